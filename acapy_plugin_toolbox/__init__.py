@@ -7,6 +7,7 @@ from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
 from aries_cloudagent.config.injection_context import InjectionContext
 
 from . import (
+    admin_registry,
     basicmessage,
     connections,
     credential_definitions,
@@ -23,6 +24,7 @@ from . import (
 from .holder import v0_1 as holder
 
 MODULES = [
+    admin_registry,
     basicmessage,
     connections,
     credential_definitions,
@@ -0,0 +1,195 @@
+"""Profile-scoped registry of admin connections."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+from aries_cloudagent.config.injection_context import InjectionContext
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.core.event_bus import Event, EventBus
+from aries_cloudagent.core.profile import Profile, ProfileSession
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.error import StorageNotFoundError
+
+LOGGER = logging.getLogger(__name__)
+
+ADMIN_GROUP = "admin"
+ADMIN_REGISTRY_TTL = float(os.environ.get("ACAPY_TOOLBOX_ADMIN_REGISTRY_TTL", 300))
+
+EVENT_PATTERN = re.compile(f"^acapy::record::{ConnRecord.RECORD_TOPIC}::.*")
+
+
+async def setup(context: InjectionContext):
+    """Setup the admin registry."""
+    event_bus = context.inject(EventBus)
+    event_bus.subscribe(EVENT_PATTERN, connections_event_handler)
+
+
+async def connections_event_handler(profile: Profile, event: Event):
+    """Keep the admin registry of the profile coherent with connection changes."""
+    registry = AdminRegistry.for_profile(profile)
+    registry.invalidate(event.payload.get("connection_id"))
+    if registry.loaded:
+        registry.connection_updated(event.payload)
+
+
+class AdminRegistry:
+    """Registry of connection groups and admin connections.
+
+    Group metadata and admin connection records are loaded from storage once
+    and then kept up to date from connection record events and group changes
+    made by the toolbox. Connection events are handled from their payload
+    alone: ACA-Py copies the group of a multi-use invitation to each
+    connection made from it, so the registry tracks the invitation key of
+    grouped multi-use invitations instead of reading metadata per event. The
+    registry is fully reloaded after ttl seconds to pick up changes made
+    outside of the toolbox, such as connections deleted through the ACA-Py
+    admin API.
+
+    The group of any connection checked for a role is cached separately for
+    ttl seconds, so that authorizing admin messages does not require a
+    storage lookup per message. At most MAX_CACHED_ROLES groups are cached,
+    evicting the least recently checked.
+    """
+
+    MAX_CACHED_ROLES = 1024
+
+    def __init__(self, ttl: float = None):
+        """Initialize an empty registry."""
+        self.ttl = ADMIN_REGISTRY_TTL if ttl is None else ttl
+        self._groups: Dict[str, Optional[str]] = {}
+        self._invitation_groups: Dict[str, str] = {}
+        self._admins: Dict[str, ConnRecord] = {}
+        self._roles: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_profile(cls, profile: Profile) -> "AdminRegistry":
+        """Return the registry bound to profile, creating it if needed."""
+        registry = profile.inject_or(cls)
+        if not registry:
+            registry = cls()
+            profile.context.injector.bind_instance(cls, registry)
+        return registry
+
+    @property
+    def loaded(self) -> bool:
+        """Return whether the registry is loaded and not yet expired."""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl
+        )
+
+    async def load(self, session: ProfileSession):
+        """Load group metadata and admin connection records from storage."""
+        storage = session.inject(BaseStorage)
+        groups = {}
+        invitation_groups = {}
+        admins = {}
+        for record in (
+            await storage.find_all_records(
+                ConnRecord.RECORD_TYPE_METADATA, {"key": "group"}
+            )
+            or []
+        ):
+            connection_id = record.tags["connection_id"]
+            group = json.loads(record.value)
+            try:
+                connection = await ConnRecord.retrieve_by_id(session, connection_id)
+            except StorageNotFoundError:
+                if group == ADMIN_GROUP:
+                    # Clean up dangling metadata records of admins
+                    LOGGER.debug("Deleting dangling admin metadata record: %s", record)
+                    await storage.delete_record(record)
+                continue
+            if group == ADMIN_GROUP:
+                admins[connection_id] = connection
+            if connection.is_multiuse_invitation and connection.invitation_key:
+                invitation_groups[connection.invitation_key] = group
+            groups[connection_id] = group
+
+        self._groups = groups
+        self._invitation_groups = invitation_groups
+        self._admins = admins
+        self._loaded_at = time.monotonic()
+        LOGGER.info("Discovered admins: %s", list(admins.values()))
+
+    async def ensure_loaded(self, session: ProfileSession):
+        """Load the registry if it is not loaded or has expired."""
+        if self.loaded:
+            return
+        async with self._lock:
+            if not self.loaded:
+                await self.load(session)
+
+    async def admins(self, session: ProfileSession) -> Sequence[ConnRecord]:
+        """Return admin connection records."""
+        await self.ensure_loaded(session)
+        return list(self._admins.values())
+
+    async def group(
+        self, session: ProfileSession, connection: ConnRecord
+    ) -> Optional[str]:
+        """Return the group of a connection, using the cached value if fresh."""
+        cached = self._roles.get(connection.connection_id)
+        if cached and cached[1] > time.monotonic():
+            self._roles.move_to_end(connection.connection_id)
+            return cached[0]
+
+        group = await connection.metadata_get(session, "group")
+        self._cache_role(connection.connection_id, group)
+        return group
+
+    def _cache_role(self, connection_id: str, group: Optional[str]):
+        """Cache the group of a connection for ttl seconds."""
+        self._roles[connection_id] = (group, time.monotonic() + self.ttl)
+        self._roles.move_to_end(connection_id)
+        while len(self._roles) > self.MAX_CACHED_ROLES:
+            self._roles.popitem(last=False)
+
+    def invalidate(self, connection_id: str):
+        """Drop the cached group of a connection."""
+        self._roles.pop(connection_id, None)
+
+    def set_group(self, connection: ConnRecord, group: Optional[str]):
+        """Record a change to the group metadata of a connection."""
+        self._cache_role(connection.connection_id, group)
+        if not self.loaded:
+            return
+        self._groups[connection.connection_id] = group
+        if connection.is_multiuse_invitation and connection.invitation_key:
+            self._invitation_groups[connection.invitation_key] = group
+        if group == ADMIN_GROUP:
+            self._admins[connection.connection_id] = connection
+        else:
+            self._admins.pop(connection.connection_id, None)
+
+    def remove(self, connection_id: str):
+        """Forget a deleted connection."""
+        self._roles.pop(connection_id, None)
+        self._groups.pop(connection_id, None)
+        self._admins.pop(connection_id, None)
+
+    def connection_updated(self, payload: Mapping):
+        """Update the registry from the event payload of a changed connection.
+
+        Only admin connection records are deserialized.
+        """
+        connection_id = payload.get("connection_id")
+        group = self._groups.get(connection_id)
+        if group is None:
+            # Connections made from a multi-use invitation get its group
+            # metadata copied by ACA-Py, after the connection is first saved
+            group = self._invitation_groups.get(payload.get("invitation_key"))
+            if group is None:
+                return
+            self._groups[connection_id] = group
+
+        if group == ADMIN_GROUP:
+            self._admins[connection_id] = ConnRecord.deserialize(payload)
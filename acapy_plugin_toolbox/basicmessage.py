@@ -1,7 +1,14 @@
 """BasicMessage Plugin."""
 # pylint: disable=invalid-name, too-few-public-methods
 
+import asyncio
+import json
+import logging
+import os
 import re
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+from weakref import WeakSet
 
 from aries_cloudagent.connections.models.conn_record import ConnRecord
 from aries_cloudagent.connections.models.connection_target import ConnectionTarget
@@ -9,6 +16,7 @@ from aries_cloudagent.core.profile import ProfileSession, Profile
 from aries_cloudagent.config.injection_context import InjectionContext
 from aries_cloudagent.core.protocol_registry import ProtocolRegistry
 from aries_cloudagent.core.event_bus import Event, EventBus
+from aries_cloudagent.core.util import SHUTDOWN_EVENT_PATTERN, STARTUP_EVENT_PATTERN
 from aries_cloudagent.messaging.base_handler import (
     BaseHandler,
     BaseResponder,
@@ -24,10 +32,25 @@ from aries_cloudagent.protocols.basicmessage.v1_0.messages.basicmessage import (
 )
 from aries_cloudagent.protocols.connections.v1_0.manager import ConnectionManager
 from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
-from aries_cloudagent.storage.error import StorageNotFoundError
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.error import StorageDuplicateError, StorageNotFoundError
+from aries_cloudagent.storage.record import StorageRecord
 from marshmallow import fields
 
-from .util import admin_only, datetime_from_iso, generate_model_schema, send_to_admins
+from .decorators.pagination import (
+    PaginationError,
+    count_records,
+    decode_cursor,
+    encode_cursor,
+    scan_records,
+)
+from .util import (
+    ExceptionReporter,
+    admin_only,
+    datetime_from_iso,
+    generate_model_schema,
+    send_to_admins,
+)
 
 ADMIN_PROTOCOL_URI = (
     "https://github.com/hyperledger/"
@@ -46,6 +69,24 @@ MESSAGE_TYPES = {
 
 BASIC_MESSAGE_EVENT_PATTERN = re.compile("^acapy::basicmessage::received$")
 
+LOGGER = logging.getLogger(__name__)
+
+SENT_MS_DIGITS = 15
+NEWEST_WINDOW_MS = 24 * 60 * 60 * 1000
+NEWEST_WINDOW_GROWTH = 8
+
+BASICMESSAGE_MAX_AGE = float(os.environ.get("ACAPY_TOOLBOX_BASICMESSAGE_MAX_AGE", 0))
+BASICMESSAGE_MAX_COUNT = int(os.environ.get("ACAPY_TOOLBOX_BASICMESSAGE_MAX_COUNT", 0))
+BASICMESSAGE_RETENTION_INTERVAL = float(
+    os.environ.get("ACAPY_TOOLBOX_BASICMESSAGE_RETENTION_INTERVAL", 3600)
+)
+
+MIGRATION_RECORD_TYPE = "acapy_plugin_toolbox_migration"
+SENT_MS_MIGRATION = "basicmessage_sent_ms"
+
+# Profiles whose stored messages are known to carry the sent time tag
+_sent_ms_migrated: "WeakSet[Profile]" = WeakSet()
+
 
 async def setup(context: InjectionContext, protocol_registry: ProblemReport = None):
     """Setup the basicmessage plugin."""
@@ -55,6 +96,8 @@ async def setup(context: InjectionContext, protocol_registry: ProblemReport = No
 
     event_bus = context.inject(EventBus)
     event_bus.subscribe(BASIC_MESSAGE_EVENT_PATTERN, basic_message_event_handler)
+    event_bus.subscribe(STARTUP_EVENT_PATTERN, basic_message_startup_handler)
+    event_bus.subscribe(SHUTDOWN_EVENT_PATTERN, basic_message_shutdown_handler)
 
 
 async def basic_message_event_handler(profile: Profile, event: Event):
@@ -75,6 +118,77 @@ async def basic_message_event_handler(profile: Profile, event: Event):
     await send_to_admins(profile, notification, responder, to_session_only=True)
 
 
+async def basic_message_startup_handler(profile: Profile, event: Event):
+    """Migrate stored basic messages and start retention on startup."""
+    async with profile.session() as session:
+        await ensure_sent_ms_tags(session)
+
+    retention = MessageRetention()
+    profile.context.injector.bind_instance(MessageRetention, retention)
+    retention.start(profile)
+
+
+async def basic_message_shutdown_handler(profile: Profile, event: Event):
+    """Stop retention on shutdown."""
+    retention = profile.inject_or(MessageRetention)
+    if retention:
+        retention.stop()
+
+
+async def migrate_sent_ms_tags(session: ProfileSession):
+    """Add the sent time tag to basic messages stored before it existed."""
+    storage = session.inject(BaseStorage)
+    try:
+        await storage.get_record(MIGRATION_RECORD_TYPE, SENT_MS_MIGRATION)
+        return
+    except StorageNotFoundError:
+        pass
+
+    untagged = [
+        row
+        async for row in scan_records(session, BasicMessageRecord, retrieve_tags=True)
+        if "~sent_ms" not in (row.tags or {})
+    ]
+    for row in untagged:
+        sent_ms = sent_ms_tag(json.loads(row.value).get("sent_time"))
+        if sent_ms:
+            await storage.update_record(
+                row, row.value, {**row.tags, "~sent_ms": sent_ms}
+            )
+
+    try:
+        await storage.add_record(
+            StorageRecord(MIGRATION_RECORD_TYPE, "{}", id=SENT_MS_MIGRATION)
+        )
+    except StorageDuplicateError:
+        pass  # Migrated concurrently; the tags written are the same
+    LOGGER.info("Tagged %d basic messages with sent time", len(untagged))
+
+
+async def ensure_sent_ms_tags(session: ProfileSession):
+    """Migrate the sent time tags of the session's profile on its first use.
+
+    Startup only sees the root profile, so each other profile, such as a
+    tenant's, is migrated the first time its messages are queried by sent
+    time.
+    """
+    if session.profile not in _sent_ms_migrated:
+        await migrate_sent_ms_tags(session)
+        _sent_ms_migrated.add(session.profile)
+
+
+def ms_tag(epoch_ms: float) -> str:
+    """Return a tag value for epoch milliseconds that sorts as a string."""
+    return f"{max(int(epoch_ms), 0):0{SENT_MS_DIGITS}d}"
+
+
+def sent_ms_tag(sent_time: Optional[str]) -> Optional[str]:
+    """Return the sent time tag value of an ISO 8601 sent time."""
+    if not sent_time:
+        return None
+    return ms_tag(datetime_from_iso(sent_time).timestamp() * 1000)
+
+
 class BasicMessageRecord(BaseRecord):
     """BasicMessage Record."""
 
@@ -82,6 +196,7 @@ class BasicMessageRecord(BaseRecord):
 
     RECORD_ID_NAME = "record_id"
     RECORD_TYPE = "basicmessage"
+    TAG_NAMES = {"~sent_ms"}
 
     STATE_SENT = "sent"
     STATE_RECV = "recv"
@@ -104,6 +219,8 @@ class BasicMessageRecord(BaseRecord):
         **kwargs,
     ):
         """Initialize a new SchemaRecord."""
+        # The sent time tag is derived from sent_time
+        kwargs.pop("sent_ms", None)
         super().__init__(record_id, state or self.STATE_SENT, **kwargs)
         self.connection_id = connection_id
         self.message_id = message_id
@@ -127,7 +244,11 @@ class BasicMessageRecord(BaseRecord):
     @property
     def record_tags(self) -> dict:
         """Get tags for record."""
-        return {"connection_id": self.connection_id, "message_id": self.message_id}
+        tags = {"connection_id": self.connection_id, "message_id": self.message_id}
+        sent_ms = sent_ms_tag(self.sent_time)
+        if sent_ms:
+            tags["~sent_ms"] = sent_ms
+        return tags
 
     @classmethod
     async def retrieve_by_message_id(
@@ -136,6 +257,192 @@ class BasicMessageRecord(BaseRecord):
         """Retrieve a basic message record by message id."""
         return await cls.retrieve_by_tag_filter(session, {"message_id": message_id})
 
+    @classmethod
+    async def query_newest(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        limit: int = 0,
+        offset: int = 0,
+    ) -> Tuple[Sequence["BasicMessageRecord"], int]:
+        """Return the newest messages by sent time and how many older remain.
+
+        Messages are searched by the indexed sent time tag in windows reaching
+        further into the past until enough are found, so only the newest part
+        of a long history is loaded and only returned messages are decoded.
+        """
+        wanted = offset + limit if limit > 0 else None
+        rows, remaining = await cls._scan_newest(session, tag_filter, wanted)
+        page = rows[offset:wanted]
+        remaining += max(len(rows) - len(page) - offset, 0)
+        records = [cls.from_storage(row.id, json.loads(row.value)) for row in page]
+        return records, remaining
+
+    @classmethod
+    async def query_before(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        limit: int = 0,
+        before: Tuple[str, str] = None,
+    ) -> Tuple[Sequence["BasicMessageRecord"], int]:
+        """Return the newest messages older than a position and how many remain.
+
+        Positions are (sent time tag, record id) pairs; without one, the
+        newest messages are returned. The search seeks on the indexed sent
+        time tag like query_newest, so each page costs about as much as the
+        page itself. Messages without a sent time have no position and are
+        skipped.
+        """
+
+        def _older(row: StorageRecord) -> bool:
+            sent_ms = (row.tags or {}).get("~sent_ms")
+            return bool(sent_ms) and (not before or (sent_ms, row.id) < before)
+
+        wanted = limit if limit > 0 else None
+        rows, remaining = await cls._scan_newest(
+            session,
+            tag_filter,
+            wanted,
+            upper=before[0] if before else None,
+            keep=_older,
+        )
+        page = rows[:wanted]
+        remaining += len(rows) - len(page)
+        records = [cls.from_storage(row.id, json.loads(row.value)) for row in page]
+        return records, remaining
+
+    @classmethod
+    async def _scan_newest(
+        cls,
+        session: ProfileSession,
+        tag_filter: dict = None,
+        wanted: int = None,
+        upper: str = None,
+        keep: Callable[[StorageRecord], bool] = None,
+    ) -> Tuple[List[StorageRecord], int]:
+        """Return at least wanted rows newest first and how many older remain.
+
+        Rows are searched in growing sent time windows reaching back from
+        upper, a sent time tag included in the search, or from now. Only rows
+        passing keep are returned; older rows are counted by tag only.
+        """
+        await ensure_sent_ms_tags(session)
+        upper_bound = {"sent_ms": {"$lte": upper}} if upper else None
+        window = NEWEST_WINDOW_MS
+        start = int(upper) if upper else time.time() * 1000
+        lower = None if wanted is None else start - window
+        if lower is not None and lower <= 0:
+            lower = None
+        rows = []
+        while True:
+            bounds = [upper_bound] if upper_bound else []
+            if lower is not None:
+                bounds.append({"sent_ms": {"$gte": ms_tag(lower)}})
+            query = {**(tag_filter or {}), "$and": bounds} if bounds else tag_filter
+            async for row in scan_records(session, cls, query, retrieve_tags=True):
+                if not keep or keep(row):
+                    rows.append(row)
+            if lower is None or len(rows) >= wanted:
+                break
+            window *= NEWEST_WINDOW_GROWTH
+            upper_bound = {"sent_ms": {"$lt": ms_tag(lower)}}
+            lower -= window
+            if lower <= 0:
+                lower = None
+
+        rows.sort(
+            key=lambda row: ((row.tags or {}).get("~sent_ms", ""), row.id),
+            reverse=True,
+        )
+        remaining = 0
+        if lower is not None:
+            remaining = await count_records(
+                session,
+                cls,
+                {**(tag_filter or {}), "sent_ms": {"$lt": ms_tag(lower)}},
+            )
+        return rows, remaining
+
+    @classmethod
+    async def delete_all(cls, session: ProfileSession, tag_filter: dict = None):
+        """Delete all messages matching a tag filter in one storage call."""
+        storage = session.inject(BaseStorage)
+        await storage.delete_all_records(
+            cls.RECORD_TYPE, cls.prefix_tag_filter(tag_filter)
+        )
+
+
+class MessageRetention:
+    """Periodically delete basic messages beyond the retention limits.
+
+    Messages sent more than max_age seconds ago are deleted, as are messages
+    of each connection beyond its max_count newest. A limit of 0 disables it.
+    """
+
+    def __init__(
+        self, max_age: float = None, max_count: int = None, interval: float = None
+    ):
+        """Initialize retention, defaulting to the configured limits."""
+        self.max_age = BASICMESSAGE_MAX_AGE if max_age is None else max_age
+        self.max_count = BASICMESSAGE_MAX_COUNT if max_count is None else max_count
+        self.interval = (
+            BASICMESSAGE_RETENTION_INTERVAL if interval is None else interval
+        )
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any retention limit is set."""
+        return bool(self.max_age or self.max_count)
+
+    async def enforce(self, profile: Profile):
+        """Delete messages beyond the retention limits."""
+        async with profile.session() as session:
+            await ensure_sent_ms_tags(session)
+            if self.max_age:
+                cutoff = ms_tag((time.time() - self.max_age) * 1000)
+                await BasicMessageRecord.delete_all(
+                    session, {"sent_ms": {"$lt": cutoff}}
+                )
+            if self.max_count:
+                connection_ids = [
+                    row.id async for row in scan_records(session, ConnRecord)
+                ]
+                for connection_id in connection_ids:
+                    await self.enforce_count(session, connection_id)
+
+    async def enforce_count(self, session: ProfileSession, connection_id: str):
+        """Delete messages of a connection older than its max_count newest."""
+        tag_filter = {"connection_id": connection_id}
+        oldest_kept, remaining = await BasicMessageRecord.query_newest(
+            session, tag_filter, limit=1, offset=self.max_count - 1
+        )
+        if oldest_kept and remaining:
+            cutoff = sent_ms_tag(oldest_kept[0].sent_time)
+            await BasicMessageRecord.delete_all(
+                session, {**tag_filter, "sent_ms": {"$lt": cutoff}}
+            )
+
+    def start(self, profile: Profile):
+        """Start enforcing retention periodically, if enabled."""
+        if self.enabled and not self.task:
+            self.task = asyncio.get_event_loop().create_task(self._run(profile))
+
+    def stop(self):
+        """Stop enforcing retention."""
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
+    async def _run(self, profile: Profile):
+        while True:
+            try:
+                await self.enforce(profile)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Failed to enforce basic message retention")
+            await asyncio.sleep(self.interval)
+
 
 class BasicMessageRecordSchema(BaseRecordSchema):
     """Schema to allow serialization/deserialization of BasicMessage
@@ -179,6 +486,13 @@ Get, GetSchema = generate_model_schema(
         "connection_id": fields.Str(required=False),
         "limit": fields.Int(required=False),
         "offset": fields.Int(required=False),
+        "cursor": fields.Str(
+            required=False,
+            description=(
+                "Return messages after the cursor of a previous list; "
+                "an empty cursor requests the newest messages by cursor"
+            ),
+        ),
     },
 )
 
@@ -197,6 +511,7 @@ MessageList, MessageListSchema = generate_model_schema(
         "offset": fields.Int(required=False),
         "count": fields.Int(required=False),
         "remaining": fields.Int(required=False),
+        "cursor": fields.Str(required=False),
     },
 )
 
@@ -214,41 +529,58 @@ class GetHandler(BaseHandler):
                 {"connection_id": context.message.connection_id}.items(),
             )
         )
-        msgs = sorted(
-            await BasicMessageRecord.query(session, tag_filter),
-            key=lambda msg: datetime_from_iso(msg.sent_time),
-            reverse=True,
+        if context.message.cursor is not None:
+            await self.handle_cursor(context, responder, session, tag_filter)
+            return
+
+        offset = max(context.message.offset or 0, 0)
+        msgs, remaining = await BasicMessageRecord.query_newest(
+            session, tag_filter, limit=context.message.limit or 0, offset=offset
         )
-        count = len(msgs)
-        offset = 0
-        if (
-            context.message.offset
-            and context.message.offset > 0
-            and context.message.offset < count
-        ):
-            offset = context.message.offset
-            count = count - offset
-
-        if (
-            context.message.limit
-            and context.message.limit > 0
-            and context.message.limit < count
-        ):
-            count = context.message.limit
-
-        remaining = len(msgs) - offset - count
-        end = offset + count
-        msgs = msgs[offset:end]
         msg_list = MessageList(
             connection_id=context.message.connection_id,  # None when not given
             messages=msgs,
             offset=offset,
-            count=count,
+            count=len(msgs),
             remaining=remaining,
         )
         msg_list.assign_thread_from(context.message)
         await responder.send_reply(msg_list)
 
+    async def handle_cursor(
+        self,
+        context: RequestContext,
+        responder: BaseResponder,
+        session: ProfileSession,
+        tag_filter: dict,
+    ):
+        """Handle get requests paging through messages by cursor."""
+        cursor = context.message.cursor
+        async with ExceptionReporter(responder, PaginationError, context.message):
+            before = decode_cursor(cursor) if cursor else None
+            if before and not (isinstance(before[0], str) and before[0].isdigit()):
+                raise PaginationError("Invalid pagination cursor")
+        msgs, remaining = await BasicMessageRecord.query_before(
+            session,
+            tag_filter,
+            limit=context.message.limit or 0,
+            before=tuple(before) if before else None,
+        )
+        next_cursor = None
+        if msgs and remaining:
+            last = msgs[-1]
+            next_cursor = encode_cursor((sent_ms_tag(last.sent_time), last.record_id))
+        msg_list = MessageList(
+            connection_id=context.message.connection_id,  # None when not given
+            messages=msgs,
+            offset=0,
+            count=len(msgs),
+            remaining=remaining,
+            cursor=next_cursor,
+        )
+        msg_list.assign_thread_from(context.message)
+        await responder.send_reply(msg_list)
+
 
 Send, SendSchema = generate_model_schema(
     name="Send",
@@ -375,22 +707,21 @@ class DeleteHandler(BaseHandler):
                 }.items(),
             )
         )
-        msgs = await BasicMessageRecord.query(session, tag_filter)
         if context.message.before_date:
-            msgs = list(
-                filter(
-                    lambda msg: datetime_from_iso(msg.sent_time)
-                    < datetime_from_iso(context.message.before_date),
-                    msgs,
-                )
-            )
+            await ensure_sent_ms_tags(session)
+            tag_filter["sent_ms"] = {"$lt": sent_ms_tag(context.message.before_date)}
 
-        for msg in msgs:
-            await msg.delete_record(session)
+        msgs = None
+        if context.message.return_deleted:
+            msgs = [
+                BasicMessageRecord.from_storage(row.id, json.loads(row.value))
+                async for row in scan_records(session, BasicMessageRecord, tag_filter)
+            ]
+        await BasicMessageRecord.delete_all(session, tag_filter)
 
         ack = Deleted(
             connection_id=context.message.connection_id,
-            deleted=msgs if context.message.return_deleted else None,
+            deleted=msgs,
         )
         ack.assign_thread_from(context.message)
         await responder.send_reply(ack)
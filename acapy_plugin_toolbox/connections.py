@@ -3,7 +3,7 @@
 # pylint: disable=invalid-name
 # pylint: disable=too-few-public-methods
 
-import re
+import json
 from typing import Any, Dict
 
 from aries_cloudagent.connections.models.conn_record import ConnRecord
@@ -27,7 +27,17 @@ from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
 from aries_cloudagent.storage.error import StorageNotFoundError
 from marshmallow import Schema, fields, validate
 
-from .util import admin_only, generate_model_schema, send_to_admins
+from .admin_registry import AdminRegistry
+from .decorators.chunk import Chunk, send_chunks
+from .decorators.pagination import Page, Paginate, PaginationError, scan_records
+from .util import (
+    ExceptionReporter,
+    admin_only,
+    generate_model_schema,
+    record_event_matches,
+    record_event_pattern,
+    send_to_admins,
+)
 
 PROTOCOL = (
     "https://github.com/hyperledger/aries-toolbox/"
@@ -58,7 +68,10 @@ MESSAGE_TYPES = {
     CONNECTED: "acapy_plugin_toolbox.connections.Connected",
 }
 
-EVENT_PATTERN = re.compile(f"acapy::record::{ConnRecord.RECORD_TOPIC}::.*")
+# Connections are active once in response state with RFC 0160 and completed
+# with RFC 0023, both of which are stored as their RFC 0160 state
+EVENT_STATES = (ConnRecord.State.RESPONSE.rfc160, ConnRecord.State.COMPLETED.rfc160)
+EVENT_PATTERN = record_event_pattern(ConnRecord, EVENT_STATES)
 
 
 async def setup(context: InjectionContext, protocol_registry: ProtocolRegistry = None):
@@ -76,6 +89,8 @@ async def connections_event_handler(profile: Profile, event: Event):
 
     Send connected message to admins when connections reach active state.
     """
+    if not record_event_matches(event, EVENT_STATES):
+        return
     record: ConnRecord = ConnRecord.deserialize(event.payload)
     if (
         record.connection_protocol == ConnRecord.Protocol.RFC_0160.value
@@ -125,8 +140,10 @@ Connected, ConnectedSchema = generate_model_schema(
 )
 
 
-def conn_record_to_message_repr(conn: ConnRecord) -> Dict[str, Any]:
-    """Map ConnRecord onto Connection."""
+def conn_record_to_message_repr(
+    conn: ConnRecord, include_raw: bool = True
+) -> Dict[str, Any]:
+    """Map ConnRecord onto Connection, optionally without the raw record."""
 
     def _state_map(state: str) -> str:
         if state in ("active", "response"):
@@ -141,7 +158,7 @@ def conn_record_to_message_repr(conn: ConnRecord) -> Dict[str, Any]:
         "their_did": conn.their_did,
         "state": _state_map(conn.state),
         "connection_id": conn.connection_id,
-        "raw_repr": conn.serialize(),
+        "raw_repr": conn.serialize() if include_raw else None,
     }
 
 
@@ -155,6 +172,23 @@ GetList, GetListSchema = generate_model_schema(
             validate=validate.OneOf(["pending", "active", "error"]), required=False
         ),
         "their_did": fields.Str(required=False),
+        "include_raw": fields.Bool(
+            required=False,
+            missing=True,
+            description="Include raw_repr of each connection",
+        ),
+        "paginate": fields.Nested(
+            Paginate.Schema,
+            required=False,
+            data_key="~paginate",
+            description="Pagination decorator; all connections when omitted.",
+        ),
+        "chunk": fields.Nested(
+            Chunk.Schema,
+            required=False,
+            data_key="~chunk",
+            description="Stream connections in chunks; overrides pagination.",
+        ),
     },
 )
 
@@ -164,7 +198,9 @@ List, ListSchema = generate_model_schema(
     handler="acapy_plugin_toolbox.util.PassHandler",
     msg_type=LIST,
     schema={
-        "connections": fields.List(fields.Nested(BaseConnectionSchema), required=True)
+        "connections": fields.List(fields.Nested(BaseConnectionSchema), required=True),
+        "page": fields.Nested(Page.Schema, required=False, data_key="~page"),
+        "chunk": fields.Nested(Chunk.Schema, required=False, data_key="~chunk"),
     },
 )
 
@@ -185,16 +221,49 @@ class GetListHandler(BaseHandler):
                 }.items(),
             )
         )
+        include_raw = context.message.include_raw is not False
         # Filter out invitations, admin-invitations will handle those
         post_filter_negative = {"state": ConnRecord.State.INVITATION.rfc160}
         # TODO: Filter on state (needs mapping back to ACA-Py connection states)
-        records = await ConnRecord.query(
-            session, tag_filter, post_filter_negative=post_filter_negative
-        )
+        if context.message.chunk:
+
+            async def _connections():
+                async for row in scan_records(
+                    session,
+                    ConnRecord,
+                    tag_filter,
+                    post_filter_negative=post_filter_negative,
+                ):
+                    record = ConnRecord.from_storage(row.id, json.loads(row.value))
+                    yield Connection(**conn_record_to_message_repr(record, include_raw))
+
+            await send_chunks(
+                responder,
+                context.message,
+                _connections(),
+                lambda results: List(connections=results),
+            )
+            return
+
+        page = None
+        paginate = context.message.paginate
+        if paginate:
+            async with ExceptionReporter(responder, PaginationError, context.message):
+                records, page = await paginate.query(
+                    session,
+                    ConnRecord,
+                    tag_filter,
+                    post_filter_negative=post_filter_negative,
+                )
+        else:
+            records = await ConnRecord.query(
+                session, tag_filter, post_filter_negative=post_filter_negative
+            )
         results = [
-            Connection(**conn_record_to_message_repr(record)) for record in records
+            Connection(**conn_record_to_message_repr(record, include_raw))
+            for record in records
         ]
-        connection_list = List(connections=results)
+        connection_list = List(connections=results, page=page)
         connection_list.assign_thread_from(context.message)
         await responder.send_reply(connection_list)
 
@@ -282,6 +351,7 @@ class DeleteHandler(BaseHandler):
             return
 
         await connection.delete_record(session)
+        AdminRegistry.for_profile(context.profile).remove(connection.connection_id)
         deleted = Deleted(connection_id=connection.connection_id)
         deleted.assign_thread_from(context.message)
         await responder.send_reply(deleted)
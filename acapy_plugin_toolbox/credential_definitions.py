@@ -4,10 +4,14 @@
 # pylint: disable=too-few-public-methods
 
 import logging
+import os
 from asyncio import ensure_future, shield
+from typing import List, Mapping, Sequence
 
-from aries_cloudagent.core.profile import ProfileSession
+from aries_cloudagent.core.event_bus import Event, EventBus
+from aries_cloudagent.core.profile import Profile, ProfileSession
 from aries_cloudagent.core.protocol_registry import ProtocolRegistry
+from aries_cloudagent.core.util import STARTUP_EVENT_PATTERN
 from aries_cloudagent.indy.issuer import IndyIssuer
 from aries_cloudagent.ledger.base import BaseLedger
 from aries_cloudagent.messaging.base_handler import (
@@ -18,6 +22,9 @@ from aries_cloudagent.messaging.base_handler import (
 from aries_cloudagent.messaging.credential_definitions.routes import (
     add_cred_def_non_secrets_record,
 )
+from aries_cloudagent.messaging.credential_definitions.util import (
+    EVENT_LISTENER_PATTERN as CRED_DEF_EVENT_PATTERN,
+)
 from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
 from aries_cloudagent.messaging.util import canon
 from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
@@ -34,8 +41,14 @@ from aries_cloudagent.tails.base import BaseTailsServer
 
 from aries_cloudagent.messaging.valid import INDY_REV_REG_SIZE
 
+from .ledger_cache import LedgerCache
 from .schemas import SchemaRecord
-from .util import admin_only, generate_model_schema
+from .util import (
+    LEDGER_FETCH_CONCURRENCY,
+    admin_only,
+    gather_bounded,
+    generate_model_schema,
+)
 
 PROTOCOL = "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/admin-credential-definitions/0.1"
 
@@ -57,6 +70,10 @@ MESSAGE_TYPES = {
 
 CRED_DEF_SENT_RECORD_TYPE = "cred_def_sent"
 
+# Cred def ids to load into the ledger cache on startup, separated by commas,
+# or "all" for every cred def authored by this agent
+LEDGER_CACHE_WARM = os.environ.get("ACAPY_TOOLBOX_LEDGER_CACHE_WARM", "")
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -66,6 +83,49 @@ async def setup(session: ProfileSession, protocol_registry: ProblemReport = None
         protocol_registry = session.inject(ProtocolRegistry)
     protocol_registry.register_message_types(MESSAGE_TYPES)
 
+    event_bus = session.inject(EventBus)
+    event_bus.subscribe(STARTUP_EVENT_PATTERN, cred_defs_startup_handler)
+    event_bus.subscribe(CRED_DEF_EVENT_PATTERN, cred_def_event_handler)
+
+
+async def cred_defs_startup_handler(profile: Profile, event: Event):
+    """Reconcile cred def records and warm the ledger cache in the background."""
+
+    async def _startup():
+        await reconcile_cred_defs(profile)
+        await warm_ledger_cache(profile)
+
+    ensure_future(_startup())
+
+
+async def cred_def_event_handler(profile: Profile, event: Event):
+    """Save a record for a cred def written to the ledger outside the toolbox."""
+    cred_def = event.payload["context"]
+    async with profile.session() as session:
+        try:
+            await CredDefRecord.retrieve_by_cred_def_id(
+                session, cred_def["cred_def_id"]
+            )
+            return
+        except StorageNotFoundError:
+            pass
+        ledger = session.inject_or(BaseLedger)
+
+    async def _fetch():
+        try:
+            await fetch_cred_def_records(
+                profile, ledger, {cred_def["cred_def_id"]: cred_def["schema_id"]}
+            )
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception(
+                "Failed to save credential definition %s", cred_def["cred_def_id"]
+            )
+
+    # The event does not carry the attributes; fetch them from the ledger
+    # without holding up the event bus, which awaits subscribers inline
+    if ledger:
+        ensure_future(_fetch())
+
 
 class CredDefRecord(BaseRecord):
     """Represents a Schema."""
@@ -208,11 +268,9 @@ class SendCredDefHandler(BaseHandler):
                 session, schema_id=context.message.schema_id
             )
         except StorageNotFoundError:
-            # Schema will be cached so retrieving here is not
-            # any less efficient (schema is retrieved in
-            # send_credential_definition).
-            async with ledger:
-                schema = await ledger.get_schema(context.message.schema_id)
+            schema = await LedgerCache.for_profile(context.profile).get_schema(
+                ledger, context.message.schema_id
+            )
 
             schema_record = SchemaRecord(
                 schema_id=schema["id"],
@@ -390,20 +448,18 @@ class CredDefGetHandler(BaseHandler):
             pass
 
         ledger: BaseLedger = session.inject(BaseLedger)
-        async with ledger:
-            credential_definition = await ledger.get_credential_definition(
-                context.message.cred_def_id
-            )
-            schema_id = await ledger.credential_definition_id2schema_id(
-                credential_definition["id"]
-            )
+        cache = LedgerCache.for_profile(context.profile)
+        credential_definition = await cache.get_credential_definition(
+            ledger, context.message.cred_def_id
+        )
+        schema_id = await cache.credential_definition_id2schema_id(
+            ledger, credential_definition["id"]
+        )
 
         try:
             schema_record = await SchemaRecord.retrieve_by_schema_id(session, schema_id)
         except StorageNotFoundError:
-            # This may be less efficient
-            async with ledger:
-                schema = await ledger.get_schema(schema_id)
+            schema = await cache.get_schema(ledger, schema_id)
 
             schema_record = SchemaRecord(
                 schema_id=schema["id"],
@@ -444,55 +500,147 @@ CredDefList, CredDefListSchema = generate_model_schema(
 )
 
 
-class CredDefGetListHandler(BaseHandler):
-    """Handler for get schema list request."""
-
-    @admin_only
-    async def handle(self, context: RequestContext, responder: BaseResponder):
-        """Handle get schema list request."""
-        session = await context.session()
-        storage = session.inject(BaseStorage)
+async def fetch_cred_def_records(
+    profile: Profile, ledger: BaseLedger, schema_ids: Mapping[str, str]
+) -> List[CredDefRecord]:
+    """Fetch credential definitions we wrote from the ledger and save them.
+
+    schema_ids maps the ids of the credential definitions to fetch to the ids
+    of their schemas. Credential definitions are fetched concurrently; those
+    that fail to be fetched are logged and skipped. Records are saved in a
+    single transaction.
+    """
+    cred_def_ids = list(schema_ids)
+    cache = LedgerCache.for_profile(profile)
+    async with ledger:
+        cred_defs = await gather_bounded(
+            *(
+                cache.get_credential_definition(ledger, cred_def_id)
+                for cred_def_id in cred_def_ids
+            ),
+            limit=LEDGER_FETCH_CONCURRENCY,
+            return_exceptions=True,
+        )
 
-        toolbox_records = [
-            cred_def_records
-            for cred_def_records in await CredDefRecord.query(session, {})
-        ]
+    records = []
+    for cred_def_id, cred_def in zip(cred_def_ids, cred_defs):
+        if isinstance(cred_def, Exception) or not cred_def:
+            LOGGER.warning(
+                "Failed to fetch credential definition %s from ledger: %s",
+                cred_def_id,
+                cred_def,
+            )
+            continue
+        records.append(
+            CredDefRecord(
+                cred_def_id=cred_def["id"],
+                schema_id=schema_ids[cred_def_id],
+                attributes=[
+                    attribute
+                    for attribute in cred_def["value"]["primary"]["r"]
+                    if attribute != "master_secret"
+                ],
+                author=CredDefRecord.AUTHOR_SELF,
+                state=CredDefRecord.STATE_WRITTEN,
+                support_revocation="revocation" in cred_def["value"],
+            )
+        )
 
-        toolbox_record_ids = [cred_def.cred_def_id for cred_def in toolbox_records]
+    async with profile.transaction() as txn:
+        for record in records:
+            await record.save(txn, reason="Retrieved from ledger")
+        await txn.commit()
+    return records
+
+
+async def reconcile_cred_defs(profile: Profile):
+    """Save records for cred defs we wrote to the ledger but have no record of."""
+    try:
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            known_ids = {
+                storage_record.tags["cred_def_id"]
+                for storage_record in await storage.find_all_records(
+                    CredDefRecord.RECORD_TYPE
+                )
+            }
+            unknown_ids = {
+                storage_record.tags["cred_def_id"]: storage_record.tags["schema_id"]
+                for storage_record in await storage.find_all_records(
+                    CRED_DEF_SENT_RECORD_TYPE
+                )
+                if storage_record.tags["cred_def_id"] not in known_ids
+            }
+            ledger = session.inject_or(BaseLedger)
+
+        if unknown_ids and not ledger:
+            LOGGER.warning("No ledger available to reconcile credential definitions")
+        elif unknown_ids:
+            await fetch_cred_def_records(profile, ledger, unknown_ids)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception("Failed to reconcile credential definitions")
+
+
+async def warm_ledger_cache(profile: Profile, cred_def_ids: Sequence[str] = None):
+    """Load cred defs and their schemas into the ledger cache.
+
+    Defaults to the cred defs configured by ACAPY_TOOLBOX_LEDGER_CACHE_WARM.
+    """
+    try:
+        async with profile.session() as session:
+            if cred_def_ids is None and LEDGER_CACHE_WARM.strip() == "all":
+                cred_def_ids = [
+                    record.cred_def_id
+                    for record in await CredDefRecord.query(
+                        session, {"author": CredDefRecord.AUTHOR_SELF}
+                    )
+                ]
+            elif cred_def_ids is None:
+                cred_def_ids = [
+                    cred_def_id.strip()
+                    for cred_def_id in LEDGER_CACHE_WARM.split(",")
+                    if cred_def_id.strip()
+                ]
+            ledger = session.inject_or(BaseLedger)
 
-        acapy_record_ids = [
-            storage_record.tags["cred_def_id"]
-            for storage_record in await storage.find_all_records(
-                CRED_DEF_SENT_RECORD_TYPE
-            )
-        ]
+        if not cred_def_ids:
+            return
+        if not ledger:
+            LOGGER.warning("No ledger available to warm ledger cache")
+            return
 
-        unknown_record_ids = set(acapy_record_ids) - set(toolbox_record_ids)
+        cache = LedgerCache.for_profile(profile)
 
-        if unknown_record_ids:
-            ledger: BaseLedger = session.inject(BaseLedger)
-            async with ledger:
-                cred_defs = [
-                    await ledger.get_credential_definition(cred_def_id)
-                    for cred_def_id in unknown_record_ids
-                ]
+        async def _warm(cred_def_id: str):
+            await cache.get_credential_definition(ledger, cred_def_id)
+            schema_id = await cache.credential_definition_id2schema_id(
+                ledger, cred_def_id
+            )
+            if schema_id:
+                await cache.get_schema(ledger, schema_id)
 
-            cred_def_records = [
-                CredDefRecord(
-                    cred_def_id=cred_def["id"],
-                    schema_id=cred_def["schema_id"],
-                    attributes=cred_def["attrNames"],
-                    author=CredDefRecord.AUTHOR_SELF,
-                    state=CredDefRecord.STATE_WRITTEN,
+        async with ledger:
+            results = await gather_bounded(
+                *(_warm(cred_def_id) for cred_def_id in cred_def_ids),
+                limit=LEDGER_FETCH_CONCURRENCY,
+                return_exceptions=True,
+            )
+        for cred_def_id, result in zip(cred_def_ids, results):
+            if isinstance(result, Exception):
+                LOGGER.warning(
+                    "Failed to warm ledger cache for %s: %s", cred_def_id, result
                 )
-                for cred_def in cred_defs
-            ]
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception("Failed to warm ledger cache")
 
-            for record in cred_def_records:
-                await record.save(session)
 
-            toolbox_records.extend(cred_def_records)
+class CredDefGetListHandler(BaseHandler):
+    """Handler for get schema list request."""
 
-        cred_def_list = CredDefList(results=toolbox_records)
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle get schema list request."""
+        session = await context.session()
+        cred_def_list = CredDefList(results=await CredDefRecord.query(session, {}))
         cred_def_list.assign_thread_from(context.message)
         await responder.send_reply(cred_def_list)
@@ -0,0 +1,80 @@
+"""Decorator for streaming list results in chunks."""
+
+import os
+from typing import Any, AsyncIterable, Callable, List
+
+from aries_cloudagent.messaging.agent_message import AgentMessage
+from aries_cloudagent.messaging.models.base import BaseModel
+from aries_cloudagent.messaging.responder import BaseResponder
+from marshmallow import fields, validate
+
+from ..util import expand_model_class
+
+CHUNK_SIZE = int(os.environ.get("ACAPY_TOOLBOX_CHUNK_SIZE", 100))
+
+
+@expand_model_class
+class Chunk(BaseModel):
+    """Chunk decorator.
+
+    On a list request, asks for the results to be streamed in replies of at
+    most size results each, or CHUNK_SIZE when no size is given. On the
+    replies, numbers them in order and marks the last one.
+    """
+
+    class Fields:
+        """Fields of chunk decorator."""
+
+        size = fields.Int(
+            required=False,
+            validate=validate.Range(min=1),
+            description=(
+                "Stream results in replies of at most n items, "
+                "defaulting to the agent's configured chunk size"
+            ),
+            example=50,
+        )
+        seq = fields.Int(
+            required=False, description="Position of reply in stream", example=0
+        )
+        last = fields.Bool(
+            required=False, description="Whether reply ends the stream", example=False
+        )
+
+    def __init__(self, size: int = None, seq: int = None, last: bool = None, **kwargs):
+        super().__init__(**kwargs)
+        self.size = size
+        self.seq = seq
+        self.last = last
+
+
+async def send_chunks(
+    responder: BaseResponder,
+    request: AgentMessage,
+    results: AsyncIterable[Any],
+    reply: Callable[[List[Any]], AgentMessage],
+):
+    """Stream results as replies to request built by reply from each chunk.
+
+    Only one chunk of results is held at a time. The stream always ends with
+    a reply marked last, which is empty if the results ran out exactly at the
+    end of the previous chunk.
+    """
+    size = request.chunk.size or CHUNK_SIZE
+    seq = 0
+    chunk = []
+
+    async def _send(last: bool):
+        message = reply(chunk)
+        message.chunk = Chunk(size=size, seq=seq, last=last)
+        message.assign_thread_from(request)
+        await responder.send_reply(message)
+
+    async for result in results:
+        chunk.append(result)
+        if len(chunk) >= size:
+            await _send(last=False)
+            seq += 1
+            chunk = []
+
+    await _send(last=True)
@@ -1,12 +1,50 @@
 """Decorators for Pagination."""
 
-from typing import Any, Sequence, Tuple
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from bisect import insort
+from typing import Any, AsyncIterator, Callable, Sequence, Tuple, Type
 
+from aries_cloudagent.core.profile import ProfileSession
 from aries_cloudagent.messaging.models.base import BaseModel
+from aries_cloudagent.messaging.models.base_record import (
+    BaseRecord,
+    RecordType,
+    match_post_filter,
+)
+from aries_cloudagent.storage.base import BaseStorage, BaseStorageSearch
+from aries_cloudagent.storage.record import StorageRecord
 from marshmallow import fields
 
 from ..util import expand_model_class
 
+SCAN_PAGE_SIZE = 100
+
+
+class PaginationError(Exception):
+    """Raised when pagination parameters are invalid."""
+
+
+def encode_cursor(position: Tuple[Any, str]) -> str:
+    """Encode a sort key and record id as an opaque cursor."""
+    return urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+
+def decode_cursor(cursor: str, key_type: type = str) -> Tuple[Any, str]:
+    """Decode an opaque cursor into a sort key of key_type and record id."""
+    try:
+        key, record_id = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as err:
+        raise PaginationError("Invalid pagination cursor") from err
+    if not isinstance(key, key_type) or not isinstance(record_id, str):
+        raise PaginationError("Invalid pagination cursor")
+    return key, record_id
+
+
+def created_at(value: dict) -> str:
+    """Sort key ordering record values by creation time."""
+    return value.get("created_at") or ""
+
 
 @expand_model_class
 class Page(BaseModel):
@@ -17,15 +55,38 @@ class Page(BaseModel):
 
         count_ = fields.Int(required=True, data_key="count", example=10)
         offset = fields.Int(required=True, example=20)
-        remaining = fields.Int(required=False, example=15)
+        remaining = fields.Int(
+            required=False,
+            description="Number of items after this page, if known",
+            example=15,
+        )
+        more = fields.Bool(
+            required=False,
+            description="Whether any items follow this page",
+            example=True,
+        )
+        cursor = fields.Str(
+            required=False,
+            description="Cursor to request the next page with, if any remain",
+        )
 
     def __init__(
-        self, count_: int = 0, offset: int = 0, remaining: int = None, **kwargs
+        self,
+        count_: int = 0,
+        offset: int = 0,
+        remaining: int = None,
+        cursor: str = None,
+        more: bool = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.count = count_
         self.offset = offset
         self.remaining = remaining
+        self.cursor = cursor
+        if more is None and remaining is not None:
+            more = remaining > 0
+        self.more = more
 
 
 @expand_model_class
@@ -46,17 +107,177 @@ class Paginate(BaseModel):
             description="Offset returned results by n items",
             example=20,
         )
+        cursor = fields.Str(
+            required=False,
+            description=(
+                "Return results after the cursor of a previous page; "
+                "an empty cursor requests the first page by cursor"
+            ),
+            example="",
+        )
 
-    def __init__(self, limit: int = 0, offset: int = 0, **kwargs):
+    def __init__(self, limit: int = 0, offset: int = 0, cursor: str = None, **kwargs):
         super().__init__(**kwargs)
         self.limit = limit
         self.offset = offset
+        self.cursor = cursor
 
     def apply(self, items: list) -> Tuple[Sequence[Any], Page]:
         """Apply pagination to list."""
-        limit = self.limit if self.limit >= 1 else len(items[self.offset :])
+        limit = self.limit if self.limit >= 1 else len(items)
         end = self.offset + limit
         result = items[self.offset : end]
-        remaining = len(items[end:])
+        remaining = max(len(items) - end, 0)
         page = Page(len(result), self.offset, remaining)
         return result, page
+
+    async def query(
+        self,
+        session: ProfileSession,
+        record_cls: Type[RecordType],
+        tag_filter: dict = None,
+        *,
+        post_filter_positive: dict = None,
+        post_filter_negative: dict = None,
+        alt: bool = False,
+        sort_key: Callable[[dict], Any] = created_at,
+        descending: bool = False,
+    ) -> Tuple[Sequence[RecordType], Page]:
+        """Query a page of records, streaming them from storage.
+
+        Takes the same filters as BaseRecord.query. Only records on the
+        requested page are deserialized; matching records after the page are
+        counted, without decoding their values when there are no post filters.
+
+        When a cursor is given, records are instead ordered by sort_key of
+        their values and record id, and the page starts after the cursor.
+        Records added between requests then never shift later pages, and only
+        the page being built is held in memory regardless of depth.
+        """
+        filters = {
+            "post_filter_positive": post_filter_positive,
+            "post_filter_negative": post_filter_negative,
+            "alt": alt,
+        }
+        if self.cursor is not None:
+            return await self._query_after_cursor(
+                session, record_cls, tag_filter, sort_key, descending, **filters
+            )
+
+        results = []
+        skipped = 0
+        remaining = 0
+        async for row in scan_records(session, record_cls, tag_filter, **filters):
+            if skipped < self.offset:
+                skipped += 1
+            elif self.limit < 1 or len(results) < self.limit:
+                results.append(record_cls.from_storage(row.id, json.loads(row.value)))
+            else:
+                remaining += 1
+
+        return results, Page(len(results), self.offset, remaining)
+
+    async def _query_after_cursor(
+        self,
+        session: ProfileSession,
+        record_cls: Type[RecordType],
+        tag_filter: dict,
+        sort_key: Callable[[dict], Any],
+        descending: bool,
+        **filters,
+    ) -> Tuple[Sequence[RecordType], Page]:
+        """Query the page of records following the cursor."""
+        after = decode_cursor(self.cursor) if self.cursor else None
+        page = []
+        matched = 0
+        async for row in scan_records(session, record_cls, tag_filter, **filters):
+            value = json.loads(row.value)
+            position = (sort_key(value), row.id)
+            if after is not None and (
+                position >= after if descending else position <= after
+            ):
+                continue
+            matched += 1
+            insort(page, (position, value))
+            if self.limit >= 1 and len(page) > self.limit:
+                page.pop(0 if descending else -1)
+
+        if descending:
+            page.reverse()
+        results = [
+            record_cls.from_storage(record_id, value)
+            for (_key, record_id), value in page
+        ]
+        remaining = matched - len(results)
+        cursor = encode_cursor(page[-1][0]) if remaining else None
+        return results, Page(len(results), self.offset, remaining, cursor)
+
+
+def storage_search(session: ProfileSession) -> BaseStorageSearch:
+    """Return the storage search implementation of a session."""
+    search = session.inject_or(BaseStorageSearch)
+    if search:
+        return search
+    # The in-memory storage implements searching but is not bound as such
+    return session.inject(BaseStorage)
+
+
+async def scan_records(
+    session: ProfileSession,
+    record_cls: Type[BaseRecord],
+    tag_filter: dict = None,
+    *,
+    post_filter_positive: dict = None,
+    post_filter_negative: dict = None,
+    alt: bool = False,
+    page_size: int = SCAN_PAGE_SIZE,
+    retrieve_tags: bool = False,
+) -> AsyncIterator[StorageRecord]:
+    """Yield stored records of record_cls matching the filters.
+
+    Records are fetched from storage page_size at a time rather than all at
+    once. Values are only decoded here when post filters must be checked.
+    """
+    search = storage_search(session).search_records(
+        record_cls.RECORD_TYPE,
+        record_cls.prefix_tag_filter(tag_filter),
+        page_size,
+        {"retrieveTags": retrieve_tags},
+    )
+    post_filtered = post_filter_positive or post_filter_negative
+    try:
+        while True:
+            rows = await search.fetch(page_size)
+            for row in rows:
+                if post_filtered:
+                    value = json.loads(row.value)
+                    if not (
+                        match_post_filter(
+                            value, post_filter_positive, positive=True, alt=alt
+                        )
+                        and match_post_filter(
+                            value, post_filter_negative, positive=False, alt=alt
+                        )
+                    ):
+                        continue
+                yield row
+            if len(rows) < page_size:
+                break
+    finally:
+        await search.close()
+
+
+async def count_records(
+    session: ProfileSession, record_cls: Type[BaseRecord], tag_filter: dict = None
+) -> int:
+    """Count stored records of record_cls matching a tag filter.
+
+    Askar counts in the store itself; other backends scan the matching rows.
+    """
+    tag_query = record_cls.prefix_tag_filter(tag_filter)
+    if session.profile.backend == "askar":
+        return await session.handle.count(record_cls.RECORD_TYPE, tag_query)
+    count = 0
+    async for _row in scan_records(session, record_cls, tag_filter):
+        count += 1
+    return count
@@ -4,7 +4,8 @@
 # pylint: disable=too-few-public-methods
 
 import logging
-import re
+import os
+from asyncio import ensure_future
 from typing import Optional
 
 from aries_cloudagent.config.injection_context import InjectionContext
@@ -20,7 +21,7 @@ from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange
     V10PresentationExchange as PresExRecord,
 )
 
-from ...util import send_to_admins
+from ...util import record_event_matches, record_event_pattern, send_to_admins
 from .messages import (
     AdminHolderMessage,
     CredDelete,
@@ -34,9 +35,13 @@ from .messages import (
     CredOfferRejectSent,
     CredReceived,
     CredRequestSent,
+    CredsDelete,
+    CredsDeleted,
     PresDelete,
     PresDeleted,
     PresExchange,
+    PresExchangesDelete,
+    PresExchangesDeleted,
     PresGetList,
     PresGetMatchingCredentials,
     PresList,
@@ -48,10 +53,26 @@ from .messages import (
     PresSent,
     SendCredProposal,
     SendPresProposal,
+    StoredCredGetList,
+    StoredCredList,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+# When to search for credentials matching a received presentation request:
+# "inline" in the presentation-request-received notification, "follow-up" in a
+# presentation-matching-credentials message sent after it, or "none" to leave
+# it to presentation-get-matching-credentials requests
+MATCHING_CREDENTIALS = os.environ.get(
+    "ACAPY_TOOLBOX_HOLDER_MATCHING_CREDENTIALS", "follow-up"
+)
+
+# Record states whose events the holder admin is notified of
+CRED_EVENT_STATES = (
+    CredExRecord.STATE_OFFER_RECEIVED,
+    CredExRecord.STATE_CREDENTIAL_RECEIVED,
+)
+PRES_EVENT_STATES = (PresExRecord.STATE_REQUEST_RECEIVED,)
 
 PROTOCOL = AdminHolderMessage.protocol
 TITLE = "Holder Admin Protocol"
@@ -73,9 +94,13 @@ MESSAGE_TYPES = {
         CredOfferRejectSent,
         CredReceived,
         CredRequestSent,
+        CredsDelete,
+        CredsDeleted,
         PresDelete,
         PresDeleted,
         PresExchange,
+        PresExchangesDelete,
+        PresExchangesDeleted,
         PresGetList,
         PresGetMatchingCredentials,
         PresList,
@@ -87,6 +112,8 @@ MESSAGE_TYPES = {
         PresSent,
         SendCredProposal,
         SendPresProposal,
+        StoredCredGetList,
+        StoredCredList,
     ]
 }
 
@@ -100,26 +127,22 @@ async def setup(
     protocol_registry.register_message_types(MESSAGE_TYPES)
     bus: EventBus = context.inject(EventBus)
     bus.subscribe(
-        re.compile(f"acapy::record::{CredExRecord.RECORD_TOPIC}::.*"),
+        record_event_pattern(CredExRecord, CRED_EVENT_STATES),
         issue_credential_event_handler,
     )
     bus.subscribe(
-        re.compile(f"acapy::record::{PresExRecord.RECORD_TOPIC}::.*"),
+        record_event_pattern(PresExRecord, PRES_EVENT_STATES),
         present_proof_event_handler,
     )
 
 
 async def issue_credential_event_handler(profile: Profile, event: Event):
     """Handle issue credential events."""
+    if not record_event_matches(event, CRED_EVENT_STATES):
+        return
     record: CredExRecord = CredExRecord.deserialize(event.payload)
     LOGGER.debug("IssueCredential Event; %s: %s", event.topic, event.payload)
 
-    if record.state not in (
-        CredExRecord.STATE_OFFER_RECEIVED,
-        CredExRecord.STATE_CREDENTIAL_RECEIVED,
-    ):
-        return
-
     responder = profile.inject(BaseResponder)
     message = None
     if record.state == CredExRecord.STATE_OFFER_RECEIVED:
@@ -135,12 +158,34 @@ async def issue_credential_event_handler(profile: Profile, event: Event):
 
 async def present_proof_event_handler(profile: Profile, event: Event):
     """Handle present proof events."""
+    if not record_event_matches(event, PRES_EVENT_STATES):
+        return
     record: PresExRecord = PresExRecord.deserialize(event.payload)
     LOGGER.debug("PresentProof Event; %s: %s", event.topic, event.payload)
 
-    if record.state == PresExRecord.STATE_REQUEST_RECEIVED:
-        responder = profile.inject(BaseResponder)
-        message: PresRequestReceived = PresRequestReceived(record)
-        LOGGER.debug("Prepared Message: %s", message.serialize())
+    responder = profile.inject(BaseResponder)
+    message: PresRequestReceived = PresRequestReceived(record)
+    LOGGER.debug("Prepared Message: %s", message.serialize())
+    if MATCHING_CREDENTIALS == "inline":
         await message.retrieve_matching_credentials(profile)
-        await send_to_admins(profile, message, responder)
+    await send_to_admins(profile, message, responder)
+    if MATCHING_CREDENTIALS == "follow-up":
+        ensure_future(send_matching_credentials(profile, message))
+
+
+async def send_matching_credentials(profile: Profile, received: PresRequestReceived):
+    """Send credentials matching a received presentation request to admins."""
+    try:
+        await received.retrieve_matching_credentials(profile)
+        message = PresMatchingCredentials(
+            presentation_exchange_id=received.presentation_exchange_id,
+            presentation_request=received.presentation_request,
+            matching_credentials=received.matching_credentials,
+            page=received.page,
+        )
+        await send_to_admins(profile, message, profile.inject(BaseResponder))
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception(
+            "Failed to send credentials matching presentation request %s",
+            received.presentation_exchange_id,
+        )
@@ -0,0 +1,120 @@
+"""Delete holder exchange records in bulk."""
+
+import logging
+import os
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple, Type
+
+from aries_cloudagent.core.profile import Profile
+from aries_cloudagent.indy.holder import IndyHolderError
+from aries_cloudagent.messaging.models.base_record import BaseRecord, RecordType
+from aries_cloudagent.messaging.util import str_to_epoch
+from aries_cloudagent.storage.error import StorageError, StorageNotFoundError
+from aries_cloudagent.wallet.error import WalletError
+from marshmallow import Schema, fields
+
+LOGGER = logging.getLogger(__name__)
+
+DELETE_BATCH_SIZE = int(os.environ.get("ACAPY_TOOLBOX_DELETE_BATCH_SIZE", 100))
+
+FailedDeletionSchema = Schema.from_dict(
+    {
+        "id": fields.Str(required=True, description="Record that was not deleted"),
+        "error": fields.Str(required=True),
+    }
+)
+
+
+async def select_records(
+    profile: Profile,
+    record_cls: Type[RecordType],
+    record_ids: Sequence[str] = None,
+    post_filter: dict = None,
+    older_than: str = None,
+) -> Tuple[List[RecordType], List[dict]]:
+    """Return records to delete, by id or by filter, and ids not selected.
+
+    The post filter takes lists of accepted values of each field. Records
+    created at or after older_than are not selected. Records given by id
+    must match the filters too; those that do not are reported with those
+    not found.
+    """
+    post_filter = post_filter or {}
+    before = str_to_epoch(older_than) if older_than else None
+
+    def _matches(record: BaseRecord) -> bool:
+        if before is not None and not (
+            record.created_at and str_to_epoch(record.created_at) < before
+        ):
+            return False
+        return all(
+            getattr(record, field, None) in values
+            for field, values in post_filter.items()
+        )
+
+    records = []
+    failed = []
+    async with profile.session() as session:
+        if record_ids:
+            for record_id in record_ids:
+                try:
+                    record = await record_cls.retrieve_by_id(session, record_id)
+                except StorageNotFoundError:
+                    failed.append({"id": record_id, "error": "Record not found"})
+                    continue
+                if _matches(record):
+                    records.append(record)
+                else:
+                    failed.append(
+                        {"id": record_id, "error": "Record does not match filters"}
+                    )
+        else:
+            records = await record_cls.query(
+                session, post_filter_positive=post_filter, alt=True
+            )
+            records = [record for record in records if _matches(record)]
+    return records, failed
+
+
+async def delete_records(
+    profile: Profile,
+    records: Sequence[BaseRecord],
+    before_delete: Optional[Callable[[BaseRecord], Awaitable[None]]] = None,
+    batch_size: int = None,
+    kept_note: str = None,
+) -> Tuple[int, List[dict]]:
+    """Delete records, batch_size per storage transaction.
+
+    before_delete is awaited for each record first; a record for which it
+    raises is left in place and reported as failed along with the error.
+    before_delete runs outside the transaction, so its effects are kept when
+    the batch then fails to be deleted; kept_note is appended to the errors
+    of those records to say so. Returns the number of records deleted and
+    the failures.
+    """
+    batch_size = batch_size or DELETE_BATCH_SIZE
+    deleted = 0
+    failed = []
+    for index in range(0, len(records), batch_size):
+        batch = []
+        for record in records[index : index + batch_size]:
+            if before_delete:
+                try:
+                    await before_delete(record)
+                except (IndyHolderError, WalletError, StorageError) as err:
+                    LOGGER.warning("Failed to delete %s: %s", record._id, err)
+                    failed.append({"id": record._id, "error": str(err)})
+                    continue
+            batch.append(record)
+
+        try:
+            async with profile.transaction() as txn:
+                for record in batch:
+                    await record.delete_record(txn)
+                await txn.commit()
+        except StorageError as err:
+            LOGGER.warning("Failed to delete batch of %d records: %s", len(batch), err)
+            error = "{}; {}".format(err, kept_note) if kept_note else str(err)
+            failed.extend({"id": record._id, "error": error} for record in batch)
+        else:
+            deleted += len(batch)
+    return deleted, failed
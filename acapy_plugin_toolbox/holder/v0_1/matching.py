@@ -0,0 +1,82 @@
+"""Search for credentials matching presentation requests."""
+
+import os
+from typing import List, Mapping, Sequence, Tuple
+
+from aries_cloudagent.indy.holder import IndyHolder
+from aries_cloudagent.indy.sdk.holder import IndySdkHolder
+
+from ...decorators.pagination import Page, Paginate, PaginationError
+from ...util import gather_bounded
+
+MATCHING_SEARCH_CONCURRENCY = int(
+    os.environ.get("ACAPY_TOOLBOX_MATCHING_SEARCH_CONCURRENCY", 10)
+)
+
+
+async def search_matching_credentials(
+    holder: IndyHolder,
+    presentation_request: Mapping,
+    paginate: Paginate,
+    referents: Sequence[str] = (),
+    extra_query: Mapping = None,
+) -> Tuple[List[dict], Page]:
+    """Return a page of credentials matching a presentation request.
+
+    Matches are paged per referent: the page holds the matches from offset
+    to offset + limit of each referent, merged per credential. Each referent
+    is searched separately so that the holder's limit applies to it alone,
+    at most MATCHING_SEARCH_CONCURRENCY at once.
+    Only the given referents are searched, all of them by default, and
+    extra_query is a WQL query further restricting the matches of each.
+
+    Page count is the number of credentials returned. The holder cannot
+    count matches, so page remaining is not set; page more tells whether
+    any referent has matches past the page, found by searching one match
+    further than the page for each referent.
+    """
+    if paginate.limit < 1:
+        raise PaginationError("Matching credentials must be paged by a limit")
+    if not referents:
+        referents = (
+            *presentation_request["requested_attributes"],
+            *presentation_request["requested_predicates"],
+        )
+
+    async def _search(referent: str, start: int, count: int):
+        query = extra_query or {}
+        if query and isinstance(holder, IndySdkHolder):
+            # Indy-sdk takes extra queries by referent, askar one for all
+            query = {referent: query}
+        return await holder.get_credentials_for_presentation_request_by_referent(
+            presentation_request,
+            (referent,),
+            start,
+            count,
+            extra_query=query,
+        )
+
+    async def _page(referent: str) -> Tuple[Sequence[dict], bool]:
+        matches = await _search(referent, paginate.offset, paginate.limit + 1)
+        return matches[: paginate.limit], len(matches) > paginate.limit
+
+    pages = await gather_bounded(
+        *map(_page, referents), limit=MATCHING_SEARCH_CONCURRENCY
+    )
+
+    merged = {}
+    for matches, _ in pages:
+        for match in matches:
+            cred_id = match["cred_info"]["referent"]
+            if cred_id in merged:
+                merged[cred_id]["presentation_referents"] = sorted(
+                    {
+                        *merged[cred_id]["presentation_referents"],
+                        *match["presentation_referents"],
+                    }
+                )
+            else:
+                merged[cred_id] = match
+
+    more = any(more for _, more in pages)
+    return list(merged.values()), Page(len(merged), paginate.offset, more=more)
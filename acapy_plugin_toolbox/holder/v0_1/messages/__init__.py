@@ -10,9 +10,13 @@ from .cred_offer_reject import CredOfferReject
 from .cred_offer_reject_sent import CredOfferRejectSent
 from .cred_received import CredReceived
 from .cred_request_sent import CredRequestSent
+from .creds_delete import CredsDelete
+from .creds_deleted import CredsDeleted
 from .pres_delete import PresDelete
 from .pres_deleted import PresDeleted
 from .pres_exchange import PresExchange
+from .pres_exchanges_delete import PresExchangesDelete
+from .pres_exchanges_deleted import PresExchangesDeleted
 from .pres_get_list import PresGetList
 from .pres_get_matching_credentials import PresGetMatchingCredentials
 from .pres_list import PresList
@@ -24,6 +28,8 @@ from .pres_request_reject import PresRequestReject
 from .pres_sent import PresSent
 from .send_cred_proposal import SendCredProposal
 from .send_pres_proposal import SendPresProposal
+from .stored_cred_get_list import StoredCredGetList
+from .stored_cred_list import StoredCredList
 
 __all__ = [
     "AdminHolderMessage",
@@ -38,9 +44,13 @@ __all__ = [
     "CredOfferRejectSent",
     "CredReceived",
     "CredRequestSent",
+    "CredsDelete",
+    "CredsDeleted",
     "PresDelete",
     "PresDeleted",
     "PresExchange",
+    "PresExchangesDelete",
+    "PresExchangesDeleted",
     "PresGetList",
     "PresGetMatchingCredentials",
     "PresList",
@@ -52,4 +62,6 @@ __all__ = [
     "PresSent",
     "SendCredProposal",
     "SendPresProposal",
+    "StoredCredGetList",
+    "StoredCredList",
 ]
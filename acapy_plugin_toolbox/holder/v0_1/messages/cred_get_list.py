@@ -6,8 +6,14 @@ from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange
 )
 from marshmallow import fields, validate
 
-from ....decorators.pagination import Paginate
-from ....util import admin_only, expand_message_class, log_handling
+from ....decorators.pagination import Paginate, PaginationError
+from ....util import (
+    ExceptionReporter,
+    admin_only,
+    expand_message_class,
+    log_handling,
+    project_record,
+)
 from .base import AdminHolderMessage
 from .cred_list import CredList
 
@@ -28,6 +34,12 @@ class CredGetList(AdminHolderMessage):
             missing=Paginate(limit=10, offset=0),
             description="Pagination decorator.",
         )
+        projection = fields.List(
+            fields.Str(),
+            required=False,
+            data_key="fields",
+            description="Only include these fields of each listed credential exchange",
+        )
         states = fields.List(
             fields.Str(required=True),
             required=False,
@@ -49,11 +61,16 @@ class CredGetList(AdminHolderMessage):
         )
 
     def __init__(
-        self, paginate: Paginate = None, states: Optional[List[str]] = None, **kwargs
+        self,
+        paginate: Paginate = None,
+        states: Optional[List[str]] = None,
+        projection: Optional[List[str]] = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.paginate = paginate
         self.states = states
+        self.projection = projection
 
     @log_handling
     @admin_only
@@ -61,17 +78,30 @@ class CredGetList(AdminHolderMessage):
         """Handle received get cred list request."""
         session = await context.session()
 
-        credentials = await CredExRecord.query(
-            session, post_filter_positive={"role": CredExRecord.ROLE_HOLDER}
-        )
-
         if self.states:
-            credentials = [c for c in credentials if c.state in self.states]
+            post_filter_positive = {
+                "role": [CredExRecord.ROLE_HOLDER],
+                "state": self.states,
+            }
+        else:
+            post_filter_positive = {"role": CredExRecord.ROLE_HOLDER}
 
-        credentials, page = self.paginate.apply(credentials)
+        async with ExceptionReporter(responder, PaginationError, context.message):
+            credentials, page = await self.paginate.query(
+                session,
+                CredExRecord,
+                post_filter_positive=post_filter_positive,
+                alt=bool(self.states),
+            )
 
         cred_list = CredList(
-            results=[credential.serialize() for credential in credentials], page=page
+            results=[
+                project_record(credential, self.projection)
+                if self.projection
+                else credential.serialize()
+                for credential in credentials
+            ],
+            page=page,
         )
         cred_list.assign_thread_from(context.message)  # self
         await responder.send_reply(cred_list)
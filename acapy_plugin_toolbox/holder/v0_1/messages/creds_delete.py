@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+from aries_cloudagent.indy.holder import IndyHolder
+from aries_cloudagent.messaging.base_handler import BaseResponder, RequestContext
+from aries_cloudagent.messaging.valid import INDY_ISO8601_DATETIME, UUIDFour
+from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange import (
+    V10CredentialExchange as CredExRecord,
+)
+from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
+from aries_cloudagent.wallet.error import WalletNotFoundError
+from marshmallow import fields
+
+from ....util import admin_only, expand_message_class, log_handling
+from ..deletion import delete_records, select_records
+from .base import AdminHolderMessage
+from .creds_deleted import CredsDeleted
+
+
+@expand_message_class
+class CredsDelete(AdminHolderMessage):
+    """Delete credentials in bulk.
+
+    Deletes the holder's credential exchanges matching all given filters,
+    among those with the given IDs if any, along with their credentials in
+    the wallet. Credentials are deleted from the wallet before their
+    exchange records; when a record then fails to be deleted, its
+    credential stays deleted and retrying the deletion succeeds.
+    """
+
+    message_type = "credentials-delete"
+
+    class Fields:
+        credential_exchange_ids = fields.List(
+            fields.Str(example=UUIDFour.EXAMPLE),
+            required=False,
+            description="IDs of the credential exchanges to delete",
+        )
+        states = fields.List(
+            fields.Str(),
+            required=False,
+            description="Delete credential exchanges in these states",
+            example=[CredExRecord.STATE_ACKED],
+        )
+        connection_id = fields.Str(
+            required=False,
+            description="Delete credential exchanges with this connection",
+            example=UUIDFour.EXAMPLE,
+        )
+        older_than = fields.Str(
+            required=False,
+            description="Delete credential exchanges created before this time",
+            **INDY_ISO8601_DATETIME,
+        )
+
+    def __init__(
+        self,
+        credential_exchange_ids: Optional[List[str]] = None,
+        states: Optional[List[str]] = None,
+        connection_id: Optional[str] = None,
+        older_than: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.credential_exchange_ids = credential_exchange_ids
+        self.states = states
+        self.connection_id = connection_id
+        self.older_than = older_than
+
+    @log_handling
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle bulk delete credentials message."""
+        if not (
+            self.credential_exchange_ids
+            or self.states
+            or self.connection_id
+            or self.older_than
+        ):
+            report = ProblemReport(
+                description={"en": "Credential exchange IDs or a filter must be given"},
+                who_retries="none",
+            )
+            report.assign_thread_from(self)
+            await responder.send_reply(report)
+            return
+
+        post_filter = {"role": [CredExRecord.ROLE_HOLDER]}
+        if self.states:
+            post_filter["state"] = self.states
+        if self.connection_id:
+            post_filter["connection_id"] = [self.connection_id]
+        records, failed = await select_records(
+            context.profile,
+            CredExRecord,
+            self.credential_exchange_ids,
+            post_filter,
+            self.older_than,
+        )
+
+        holder: IndyHolder = context.inject(IndyHolder)
+
+        async def _delete_credential(record: CredExRecord):
+            if record.credential_id:
+                try:
+                    await holder.delete_credential(record.credential_id)
+                except WalletNotFoundError:
+                    pass  # Credential already removed from wallet: carry on
+
+        deleted, failed_deletes = await delete_records(
+            context.profile,
+            records,
+            _delete_credential,
+            kept_note="credential already deleted from wallet; retry to delete record",
+        )
+        message = CredsDeleted(deleted=deleted, failed=failed + failed_deletes)
+        message.assign_thread_from(self)
+        await responder.send_reply(message)
@@ -0,0 +1,31 @@
+from typing import Sequence
+
+from marshmallow import fields
+
+from ....util import expand_message_class
+from ..deletion import FailedDeletionSchema
+from .base import AdminHolderMessage
+
+
+@expand_message_class
+class CredsDeleted(AdminHolderMessage):
+    """Credentials deleted."""
+
+    message_type = "credentials-deleted"
+
+    class Fields:
+        deleted = fields.Int(
+            required=True,
+            description="Number of credential exchanges deleted.",
+            example=10,
+        )
+        failed = fields.List(
+            fields.Nested(FailedDeletionSchema),
+            required=True,
+            description="Credential exchanges that were not deleted.",
+        )
+
+    def __init__(self, deleted: int, failed: Sequence[dict] = (), **kwargs):
+        super().__init__(**kwargs)
+        self.deleted = deleted
+        self.failed = failed
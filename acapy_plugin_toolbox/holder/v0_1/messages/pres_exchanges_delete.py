@@ -0,0 +1,100 @@
+from typing import List, Optional
+
+from aries_cloudagent.messaging.base_handler import BaseResponder, RequestContext
+from aries_cloudagent.messaging.valid import INDY_ISO8601_DATETIME, UUIDFour
+from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange import (
+    V10PresentationExchange as PresExRecord,
+)
+from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
+from marshmallow import fields
+
+from ....util import admin_only, expand_message_class, log_handling
+from ..deletion import delete_records, select_records
+from .base import AdminHolderMessage
+from .pres_exchanges_deleted import PresExchangesDeleted
+
+
+@expand_message_class
+class PresExchangesDelete(AdminHolderMessage):
+    """Delete presentation exchanges in bulk.
+
+    Deletes the prover's presentation exchanges matching all given filters,
+    among those with the given IDs if any.
+    """
+
+    message_type = "presentation-exchanges-delete"
+
+    class Fields:
+        presentation_exchange_ids = fields.List(
+            fields.Str(example=UUIDFour.EXAMPLE),
+            required=False,
+            description="IDs of the presentation exchanges to delete",
+        )
+        states = fields.List(
+            fields.Str(),
+            required=False,
+            description="Delete presentation exchanges in these states",
+            example=[PresExRecord.STATE_PRESENTATION_ACKED],
+        )
+        connection_id = fields.Str(
+            required=False,
+            description="Delete presentation exchanges with this connection",
+            example=UUIDFour.EXAMPLE,
+        )
+        older_than = fields.Str(
+            required=False,
+            description="Delete presentation exchanges created before this time",
+            **INDY_ISO8601_DATETIME,
+        )
+
+    def __init__(
+        self,
+        presentation_exchange_ids: Optional[List[str]] = None,
+        states: Optional[List[str]] = None,
+        connection_id: Optional[str] = None,
+        older_than: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.presentation_exchange_ids = presentation_exchange_ids
+        self.states = states
+        self.connection_id = connection_id
+        self.older_than = older_than
+
+    @log_handling
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle bulk delete presentation exchanges message."""
+        if not (
+            self.presentation_exchange_ids
+            or self.states
+            or self.connection_id
+            or self.older_than
+        ):
+            report = ProblemReport(
+                description={
+                    "en": "Presentation exchange IDs or a filter must be given"
+                },
+                who_retries="none",
+            )
+            report.assign_thread_from(self)
+            await responder.send_reply(report)
+            return
+
+        post_filter = {"role": [PresExRecord.ROLE_PROVER]}
+        if self.states:
+            post_filter["state"] = self.states
+        if self.connection_id:
+            post_filter["connection_id"] = [self.connection_id]
+        records, failed = await select_records(
+            context.profile,
+            PresExRecord,
+            self.presentation_exchange_ids,
+            post_filter,
+            self.older_than,
+        )
+
+        deleted, failed_deletes = await delete_records(context.profile, records)
+        message = PresExchangesDeleted(deleted=deleted, failed=failed + failed_deletes)
+        message.assign_thread_from(self)
+        await responder.send_reply(message)
@@ -0,0 +1,31 @@
+from typing import Sequence
+
+from marshmallow import fields
+
+from ....util import expand_message_class
+from ..deletion import FailedDeletionSchema
+from .base import AdminHolderMessage
+
+
+@expand_message_class
+class PresExchangesDeleted(AdminHolderMessage):
+    """Presentation exchanges deleted."""
+
+    message_type = "presentation-exchanges-deleted"
+
+    class Fields:
+        deleted = fields.Int(
+            required=True,
+            description="Number of presentation exchanges deleted.",
+            example=10,
+        )
+        failed = fields.List(
+            fields.Nested(FailedDeletionSchema),
+            required=True,
+            description="Presentation exchanges that were not deleted.",
+        )
+
+    def __init__(self, deleted: int, failed: Sequence[dict] = (), **kwargs):
+        super().__init__(**kwargs)
+        self.deleted = deleted
+        self.failed = failed
@@ -1,11 +1,19 @@
+from typing import List
+
 from aries_cloudagent.messaging.base_handler import BaseResponder, RequestContext
 from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange import (
     V10PresentationExchange as PresExRecord,
 )
 from marshmallow import fields
 
-from ....decorators.pagination import Paginate
-from ....util import admin_only, expand_message_class, log_handling
+from ....decorators.pagination import Paginate, PaginationError
+from ....util import (
+    ExceptionReporter,
+    admin_only,
+    expand_message_class,
+    log_handling,
+    project_record,
+)
 from .base import AdminHolderMessage
 from .pres_list import PresList
 
@@ -29,11 +37,24 @@ class PresGetList(AdminHolderMessage):
             missing=Paginate(limit=10, offset=0),
             description="Pagination decorator.",
         )
+        projection = fields.List(
+            fields.Str(),
+            required=False,
+            data_key="fields",
+            description="Only include these fields of each listed presentation exchange",
+        )
 
-    def __init__(self, connection_id: str = None, paginate: Paginate = None, **kwargs):
+    def __init__(
+        self,
+        connection_id: str = None,
+        paginate: Paginate = None,
+        projection: List[str] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.connection_id = connection_id
         self.paginate = paginate or Paginate()
+        self.projection = projection
 
     @log_handling
     @admin_only
@@ -52,9 +73,16 @@ class PresGetList(AdminHolderMessage):
                 }.items(),
             )
         )
-        records = await PresExRecord.query(
-            session, {}, post_filter_positive=post_filter_positive
+        async with ExceptionReporter(responder, PaginationError, context.message):
+            records, page = await paginate.query(
+                session, PresExRecord, post_filter_positive=post_filter_positive
+            )
+        projection = context.message.projection
+        pres_list = PresList(
+            [
+                project_record(record, projection) if projection else record.serialize()
+                for record in records
+            ],
+            page=page,
         )
-        records, page = paginate.apply(records)
-        pres_list = PresList([record.serialize() for record in records], page=page)
         await responder.send_reply(pres_list)
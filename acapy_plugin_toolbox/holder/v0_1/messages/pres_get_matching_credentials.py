@@ -1,14 +1,15 @@
-from typing import cast
+from typing import Sequence
 
 from aries_cloudagent.indy.holder import IndyHolder
-from aries_cloudagent.indy.sdk.holder import IndySdkHolder
 from aries_cloudagent.messaging.base_handler import BaseResponder, RequestContext
 from aries_cloudagent.messaging.valid import UUIDFour
+from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
 from marshmallow import fields
 
-from ....decorators.pagination import Page, Paginate
+from ....decorators.pagination import Paginate, PaginationError
 from ....util import ExceptionReporter, admin_only, expand_message_class, log_handling
 from ..error import InvalidPresentationExchange
+from ..matching import search_matching_credentials
 from .base import AdminHolderMessage
 from .pres_matching_credentials import PresMatchingCredentials
 from .pres_request_approve import PresRequestApprove
@@ -33,18 +34,36 @@ class PresGetMatchingCredentials(AdminHolderMessage):
             missing=Paginate(limit=10, offset=0),
             description="Pagination decorator.",
         )
+        referents = fields.List(
+            fields.Str(),
+            required=False,
+            description="Only match these referents of the presentation request.",
+            example=["0_name_uuid"],
+        )
+        extra_query = fields.Dict(
+            required=False,
+            description="WQL query further restricting matches of each referent.",
+            example={"cred_def_id": "WgWxqztrNooG92RXvxSTWv:3:CL:20:tag"},
+        )
 
     def __init__(
-        self, presentation_exchange_id: str, paginate: Paginate = None, **kwargs
+        self,
+        presentation_exchange_id: str,
+        paginate: Paginate = None,
+        referents: Sequence[str] = None,
+        extra_query: dict = None,
+        **kwargs,
     ):
         super().__init__(**kwargs)
         self.presentation_exchange_id = presentation_exchange_id
         self.paginate = paginate
+        self.referents = referents
+        self.extra_query = extra_query
 
     @log_handling
     @admin_only
     async def handle(self, context: RequestContext, responder: BaseResponder):
-        holder = cast(IndySdkHolder, context.inject(IndyHolder))
+        holder = context.inject(IndyHolder)
         async with context.session() as session:
             async with ExceptionReporter(
                 responder, InvalidPresentationExchange, context.message
@@ -53,17 +72,36 @@ class PresGetMatchingCredentials(AdminHolderMessage):
                     session, self.presentation_exchange_id
                 )
 
+        presentation_request = pres_ex_record.presentation_request.serialize()
+        unknown = set(self.referents or ()) - {
+            *presentation_request["requested_attributes"],
+            *presentation_request["requested_predicates"],
+        }
+        if unknown:
+            report = ProblemReport(
+                description={
+                    "en": "Unknown referents: {}".format(", ".join(sorted(unknown)))
+                },
+                who_retries="none",
+            )
+            report.assign_thread_from(self)
+            await responder.send_reply(report)
+            return
+
+        async with ExceptionReporter(responder, PaginationError, context.message):
+            matching_credentials, page = await search_matching_credentials(
+                holder,
+                presentation_request,
+                self.paginate,
+                self.referents or (),
+                self.extra_query,
+            )
+
         matches = PresMatchingCredentials(
             presentation_exchange_id=self.presentation_exchange_id,
-            matching_credentials=await holder.get_credentials_for_presentation_request_by_referent(
-                pres_ex_record.presentation_request,
-                (),
-                self.paginate.offset,
-                self.paginate.limit,
-                extra_query={},
-            ),
-            presentation_request=pres_ex_record.presentation_request,
-            page=Page(count_=self.paginate.limit, offset=self.paginate.offset),
+            matching_credentials=matching_credentials,
+            presentation_request=presentation_request,
+            page=page,
         )
         matches.assign_thread_from(self)
         await responder.send_reply(matches)
@@ -6,8 +6,9 @@ from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange
 from aries_cloudagent.protocols.present_proof.v1_0.routes import IndyCredPrecisSchema
 from marshmallow import fields
 
-from ....decorators.pagination import Page
+from ....decorators.pagination import Page, Paginate
 from ....util import expand_message_class
+from ..matching import search_matching_credentials
 from .base import AdminHolderMessage
 
 
@@ -60,13 +61,6 @@ class PresRequestReceived(AdminHolderMessage):
         if not (type(request) is dict):
             request = request.serialize()
 
-        self.matching_credentials = (
-            await holder.get_credentials_for_presentation_request_by_referent(
-                request,
-                (),
-                0,
-                self.DEFAULT_COUNT,
-                extra_query={},
-            )
+        self.matching_credentials, self.page = await search_matching_credentials(
+            holder, request, Paginate(limit=self.DEFAULT_COUNT)
         )
-        self.page = Page(count_=self.DEFAULT_COUNT, offset=self.DEFAULT_COUNT)
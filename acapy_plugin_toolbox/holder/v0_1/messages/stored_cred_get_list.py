@@ -0,0 +1,139 @@
+from typing import Optional
+
+from aries_cloudagent.indy.holder import IndyHolder, IndyHolderError
+from aries_cloudagent.messaging.base_handler import BaseResponder, RequestContext
+from aries_cloudagent.messaging.valid import (
+    INDY_CRED_DEF_ID,
+    INDY_DID,
+    INDY_SCHEMA_ID,
+    INDY_VERSION,
+)
+from marshmallow import fields
+
+from ....decorators.pagination import Page, Paginate, PaginationError
+from ....util import ExceptionReporter, admin_only, expand_message_class, log_handling
+from .base import AdminHolderMessage
+from .stored_cred_list import StoredCredList
+
+# Credential tags the wallet search filters by, keyed by message field
+WQL_TAGS = {
+    "schema_id": "schema_id",
+    "schema_issuer_did": "schema_issuer_did",
+    "schema_name": "schema_name",
+    "schema_version": "schema_version",
+    "cred_def_id": "cred_def_id",
+    "issuer_did": "issuer_did",
+}
+
+
+@expand_message_class
+class StoredCredGetList(AdminHolderMessage):
+    """Stored credential list retrieval message.
+
+    Unlike credentials-get-list, which lists credential exchange records,
+    this searches the credentials stored in the wallet, filtered and paged
+    by the wallet itself.
+    """
+
+    message_type = "stored-credentials-get-list"
+
+    class Fields:
+        """Stored credential get list fields."""
+
+        paginate = fields.Nested(
+            Paginate.Schema,
+            required=False,
+            data_key="~paginate",
+            missing=Paginate(limit=10, offset=0),
+            description="Pagination decorator.",
+        )
+        schema_id = fields.Str(
+            required=False, description="Schema identifier", **INDY_SCHEMA_ID
+        )
+        schema_issuer_did = fields.Str(
+            required=False, description="Schema issuer DID", **INDY_DID
+        )
+        schema_name = fields.Str(
+            required=False, description="Schema name", example="preferences"
+        )
+        schema_version = fields.Str(
+            required=False, description="Schema version", **INDY_VERSION
+        )
+        cred_def_id = fields.Str(
+            required=False,
+            description="Credential definition identifier",
+            **INDY_CRED_DEF_ID,
+        )
+        issuer_did = fields.Str(
+            required=False, description="Credential issuer DID", **INDY_DID
+        )
+        query = fields.Dict(
+            required=False,
+            description="WQL query further restricting listed credentials",
+            example={"attr::email::marker": "1"},
+        )
+
+    def __init__(
+        self,
+        paginate: Paginate = None,
+        schema_id: Optional[str] = None,
+        schema_issuer_did: Optional[str] = None,
+        schema_name: Optional[str] = None,
+        schema_version: Optional[str] = None,
+        cred_def_id: Optional[str] = None,
+        issuer_did: Optional[str] = None,
+        query: Optional[dict] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.paginate = paginate
+        self.schema_id = schema_id
+        self.schema_issuer_did = schema_issuer_did
+        self.schema_name = schema_name
+        self.schema_version = schema_version
+        self.cred_def_id = cred_def_id
+        self.issuer_did = issuer_did
+        self.query = query
+
+    def wql(self) -> dict:
+        """Return the WQL query selecting the requested credentials."""
+        wql = {
+            tag: getattr(self, field)
+            for field, tag in WQL_TAGS.items()
+            if getattr(self, field) is not None
+        }
+        if self.query:
+            wql = {"$and": [wql, self.query]} if wql else self.query
+        return wql
+
+    @log_handling
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle received get stored cred list request.
+
+        The wallet search does not count matches, so page remaining is not
+        set; page more tells whether a credential follows the page, found
+        by fetching one past it.
+        """
+        holder: IndyHolder = context.inject(IndyHolder)
+        paginate = self.paginate
+        async with ExceptionReporter(
+            responder, (PaginationError, IndyHolderError), context.message
+        ):
+            if paginate.limit < 1:
+                raise PaginationError("Stored credentials must be paged by a limit")
+            credentials = await holder.get_credentials(
+                paginate.offset, paginate.limit + 1, self.wql()
+            )
+
+        results = credentials[: paginate.limit]
+        cred_list = StoredCredList(
+            results=results,
+            page=Page(
+                len(results),
+                paginate.offset,
+                more=len(credentials) > paginate.limit,
+            ),
+        )
+        cred_list.assign_thread_from(context.message)  # self
+        await responder.send_reply(cred_list)
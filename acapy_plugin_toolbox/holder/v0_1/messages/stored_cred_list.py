@@ -0,0 +1,35 @@
+from typing import Sequence
+
+from marshmallow import fields
+
+from ....decorators.pagination import Page
+from ....util import expand_message_class
+from .base import AdminHolderMessage
+
+
+@expand_message_class
+class StoredCredList(AdminHolderMessage):
+    """Stored credential list message."""
+
+    message_type = "stored-credentials-list"
+
+    class Fields:
+        """Fields of stored credential list message."""
+
+        results = fields.List(
+            fields.Dict(),
+            required=True,
+            description="Info of each credential stored in the wallet",
+            example=[],
+        )
+        page = fields.Nested(
+            Page.Schema,
+            required=False,
+            data_key="~page",
+            description="Pagination decorator.",
+        )
+
+    def __init__(self, results: Sequence[dict], page: Page = None, **kwargs):
+        super().__init__(**kwargs)
+        self.results = results
+        self.page = page
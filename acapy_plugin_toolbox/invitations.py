@@ -3,6 +3,9 @@
 # pylint: disable=invalid-name
 # pylint: disable=too-few-public-methods
 
+import json
+from typing import AsyncIterator, List, Optional, Sequence
+
 from marshmallow import Schema, fields
 
 from aries_cloudagent.core.profile import ProfileSession
@@ -26,9 +29,16 @@ from aries_cloudagent.protocols.connections.v1_0.messages.connection_invitation
 
 # ProblemReport will probably be needed when a delete message is implemented
 # from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
-from aries_cloudagent.storage.error import StorageNotFoundError
+from aries_cloudagent.protocols.connections.v1_0.message_types import (
+    CONNECTION_INVITATION,
+)
+from aries_cloudagent.protocols.didcomm_prefix import DIDCommPrefix
+from aries_cloudagent.storage.base import BaseStorage
 from aries_cloudagent.messaging.valid import INDY_ISO8601_DATETIME
 
+from .admin_registry import AdminRegistry
+from .decorators.chunk import Chunk, send_chunks
+from .decorators.pagination import scan_records
 from .util import generate_model_schema, admin_only
 
 PROTOCOL = (
@@ -67,7 +77,14 @@ InvitationGetList, InvitationGetListSchema = generate_model_schema(
     name="InvitationGetList",
     handler="acapy_plugin_toolbox.invitations.InvitationGetListHandler",
     msg_type=INVITATION_GET_LIST,
-    schema={},
+    schema={
+        "chunk": fields.Nested(
+            Chunk.Schema,
+            required=False,
+            data_key="~chunk",
+            description="Stream invitations in chunks.",
+        ),
+    },
 )
 
 CreateInvitation, CreateInvitationSchema = generate_model_schema(
@@ -129,7 +146,10 @@ InvitationList, InvitationListSchema = generate_model_schema(
     name="InvitationList",
     handler="acapy_plugin_toolbox.util.PassHandler",
     msg_type=INVITATION_LIST,
-    schema={"results": fields.List(fields.Nested(BaseInvitationSchema))},
+    schema={
+        "results": fields.List(fields.Nested(BaseInvitationSchema)),
+        "chunk": fields.Nested(Chunk.Schema, required=False, data_key="~chunk"),
+    },
 )
 
 
@@ -152,6 +172,9 @@ class CreateInvitationHandler(BaseHandler):
         )
         if context.message.group:
             await connection.metadata_set(session, "group", context.message.group)
+            AdminRegistry.for_profile(profile).set_group(
+                connection, context.message.group
+            )
         invite_response = Invitation(
             id=connection.connection_id,
             label=invitation.label,
@@ -195,6 +218,9 @@ class OOBCreateInvitationHandler(BaseHandler):
         )
         if context.message.group:
             await connection.metadata_set(session, "group", context.message.group)
+            AdminRegistry.for_profile(profile).set_group(
+                connection, context.message.group
+            )
         invite_response = Invitation(
             id=connection.connection_id,
             label=invitation_record.invitation.label,
@@ -215,55 +241,110 @@ class OOBCreateInvitationHandler(BaseHandler):
         await responder.send_reply(invite_response)
 
 
+INVITATION_BATCH_SIZE = 100
+
+
+def invitation_repr(connection: ConnRecord, stored: dict, group: Optional[str]) -> dict:
+    """Return the message representation of an invitation connection."""
+    if DIDCommPrefix.unqualify(stored["@type"]) == CONNECTION_INVITATION:
+        invitation = ConnectionInvitation.deserialize(stored)
+        invitation_type = CONN_INVITE_TYPE
+    else:
+        invitation = InvitationMessage.deserialize(stored)
+        invitation_type = OOB_INVITE_TYPE
+
+    return {
+        "id": connection.connection_id,
+        "label": invitation.label,
+        "alias": connection.alias,
+        "group": group,
+        "invitation_type": invitation_type,
+        "auto_accept": (connection.accept == ConnRecord.ACCEPT_AUTO),
+        "multi_use": (connection.invitation_mode == ConnRecord.INVITATION_MODE_MULTI),
+        "invitation_url": invitation.to_url(),
+        "created_date": connection.created_at,
+        "raw_repr": {
+            "connection": connection.serialize(),
+            "invitation": stored,
+        },
+    }
+
+
+async def invitation_reprs(
+    session: ProfileSession, connections: Sequence[ConnRecord]
+) -> List[dict]:
+    """Return message representations of invitation connections.
+
+    Invitations and group metadata of all connections are loaded with one
+    storage query each. Connections without a stored invitation are skipped.
+    """
+    if not connections:
+        return []
+    storage = session.inject(BaseStorage)
+    connection_ids = [connection.connection_id for connection in connections]
+    invitations = {
+        record.tags["connection_id"]: json.loads(record.value)
+        for record in await storage.find_all_records(
+            ConnRecord.RECORD_TYPE_INVITATION,
+            {"connection_id": {"$in": connection_ids}},
+        )
+    }
+    groups = {
+        record.tags["connection_id"]: json.loads(record.value)
+        for record in await storage.find_all_records(
+            ConnRecord.RECORD_TYPE_METADATA,
+            {"key": "group", "connection_id": {"$in": connection_ids}},
+        )
+    }
+    return [
+        invitation_repr(
+            connection,
+            invitations[connection.connection_id],
+            groups.get(connection.connection_id),
+        )
+        for connection in connections
+        if connection.connection_id in invitations
+    ]
+
+
+async def invitation_batches(session: ProfileSession) -> AsyncIterator[List[dict]]:
+    """Yield representations of all invitations, a batch at a time."""
+    batch = []
+    async for row in scan_records(
+        session, ConnRecord, post_filter_positive={"state": "invitation"}
+    ):
+        batch.append(ConnRecord.from_storage(row.id, json.loads(row.value)))
+        if len(batch) >= INVITATION_BATCH_SIZE:
+            yield await invitation_reprs(session, batch)
+            batch = []
+    yield await invitation_reprs(session, batch)
+
+
 class InvitationGetListHandler(BaseHandler):
     """Handler for get invitation list request."""
 
     @admin_only
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Handle get invitation list request."""
-
-        post_filter_positive = {"state": "invitation"}
-
         session = await context.session()
-        records = await ConnRecord.query(
-            session, post_filter_positive=post_filter_positive
-        )
-        results = []
-        for connection in records:
-            try:
-                invitation = await connection.retrieve_invitation(session)
-            except StorageNotFoundError:
-                continue
-            group = await connection.metadata_get(session, "group")
-
-            invitation_type = (
-                CONN_INVITE_TYPE
-                if isinstance(invitation, ConnectionInvitation)
-                else OOB_INVITE_TYPE
-                if isinstance(invitation, InvitationMessage)
-                else None
+        if context.message.chunk:
+
+            async def _invitations():
+                async for batch in invitation_batches(session):
+                    for invite in batch:
+                        yield invite
+
+            await send_chunks(
+                responder,
+                context.message,
+                _invitations(),
+                lambda results: InvitationList(results=results),
             )
+            return
 
-            invite = {
-                "id": connection.connection_id,
-                "label": invitation.label,
-                "alias": connection.alias,
-                "group": group,
-                "invitation_type": invitation_type,
-                "auto_accept": (connection.accept == ConnRecord.ACCEPT_AUTO),
-                "multi_use": (
-                    connection.invitation_mode == ConnRecord.INVITATION_MODE_MULTI
-                ),
-                "invitation_url": invitation.to_url(),
-                "created_date": connection.created_at,
-                "raw_repr": {
-                    "connection": connection.serialize(),
-                    "invitation": invitation.serialize(),
-                },
-            }
-
-            results.append(invite)
-
+        results = [
+            invite async for batch in invitation_batches(session) for invite in batch
+        ]
         invitation_list = InvitationList(results=results)
         invitation_list.assign_thread_from(context.message)
         await responder.send_reply(invitation_list)
@@ -2,8 +2,10 @@
 
 # pylint: disable=invalid-name
 # pylint: disable=too-few-public-methods
-import re
-from typing import Optional, Mapping
+import json
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional, Mapping, Sequence
 import logging
 
 from aries_cloudagent.connections.models.conn_record import ConnRecord
@@ -11,7 +13,6 @@ from aries_cloudagent.core.protocol_registry import ProtocolRegistry
 from aries_cloudagent.indy.models.proof_request import IndyProofRequest
 from aries_cloudagent.indy.util import generate_pr_nonce
 
-from aries_cloudagent.indy.holder import IndyHolder
 from aries_cloudagent.messaging.agent_message import AgentMessage
 from aries_cloudagent.messaging.base_handler import (
     BaseHandler,
@@ -20,7 +21,10 @@ from aries_cloudagent.messaging.base_handler import (
 )
 from aries_cloudagent.messaging.credential_definitions.util import CRED_DEF_TAGS
 from aries_cloudagent.messaging.decorators.attach_decorator import AttachDecorator
-from aries_cloudagent.protocols.issue_credential.v1_0.manager import CredentialManager
+from aries_cloudagent.protocols.issue_credential.v1_0.manager import (
+    CredentialManager,
+    CredentialManagerError,
+)
 from aries_cloudagent.protocols.issue_credential.v1_0.messages.credential_proposal import (  # noqa: E501
     CredentialProposal,
 )
@@ -43,7 +47,6 @@ from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange
 )
 from aries_cloudagent.protocols.present_proof.v1_0.routes import (
     V10PresentationSendRequestRequestSchema,
-    IndyCredPrecisSchema,
 )
 from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
 from aries_cloudagent.storage.error import StorageError, StorageNotFoundError
@@ -52,6 +55,12 @@ from aries_cloudagent.revocation.manager import (
     RevocationManager,
     RevocationManagerError,
 )
+from aries_cloudagent.revocation.models.issuer_cred_rev_record import (
+    IssuerCredRevRecord,
+)
+from aries_cloudagent.revocation.models.issuer_rev_reg_record import (
+    IssuerRevRegRecord,
+)
 from aries_cloudagent.indy.issuer import IndyIssuerError
 from aries_cloudagent.ledger.error import LedgerError
 from aries_cloudagent.config.injection_context import InjectionContext
@@ -63,28 +72,49 @@ from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange
 from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange import (
     V10PresentationExchange as PresExRecord,
 )
-from marshmallow import fields
+from marshmallow import Schema, fields
 from uuid import UUID
 
-from .decorators.pagination import Page
+from .decorators.chunk import Chunk, send_chunks
+from .decorators.pagination import Page, Paginate, PaginationError, scan_records
 from .util import (
     ExceptionReporter,
     admin_only,
+    as_completed_bounded,
     expand_message_class,
     generate_model_schema,
     get_connection,
     log_handling,
+    project_record,
     with_generic_init,
+    record_event_matches,
+    record_event_pattern,
     send_to_admins,
+    split_tag_filter,
 )
 
 
 LOGGER = logging.getLogger(__name__)
 
+ISSUE_CONCURRENCY = int(os.environ.get("ACAPY_TOOLBOX_ISSUE_CONCURRENCY", 10))
+
+# Record states whose events the issuer admin is notified of
+CRED_EVENT_STATES = (CredExRecord.STATE_ACKED,)
+PRES_EVENT_STATES = (
+    PresExRecord.STATE_VERIFIED,
+    PresExRecord.STATE_PRESENTATION_RECEIVED,
+)
+
 PROTOCOL = "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/admin-issuer/0.1"
 
 SEND_CREDENTIAL = "{}/send-credential".format(PROTOCOL)
+SEND_CREDENTIALS = "{}/send-credentials".format(PROTOCOL)
+CREDENTIALS_SENT = "{}/credentials-sent".format(PROTOCOL)
 REVOKE_CREDENTIAL = "{}/revoke-credential".format(PROTOCOL)
+REVOKE_CREDENTIALS = "{}/revoke-credentials".format(PROTOCOL)
+CREDENTIALS_REVOKED = "{}/credentials-revoked".format(PROTOCOL)
+PUBLISH_REVOCATIONS = "{}/publish-revocations".format(PROTOCOL)
+REVOCATIONS_PUBLISHED = "{}/revocations-published".format(PROTOCOL)
 REQUEST_PRESENTATION = "{}/request-presentation".format(PROTOCOL)
 ISSUER_CRED_EXCHANGE = "{}/credential-exchange".format(PROTOCOL)
 ISSUER_PRES_EXCHANGE = "{}/presentation-exchange".format(PROTOCOL)
@@ -97,7 +127,13 @@ PRESENTATIONS_LIST = "{}/presentations-list".format(PROTOCOL)
 
 MESSAGE_TYPES = {
     SEND_CREDENTIAL: "acapy_plugin_toolbox.issuer.SendCred",
+    SEND_CREDENTIALS: "acapy_plugin_toolbox.issuer.SendCreds",
+    CREDENTIALS_SENT: "acapy_plugin_toolbox.issuer.CredsSent",
     REVOKE_CREDENTIAL: "acapy_plugin_toolbox.issuer.RevokeCred",
+    REVOKE_CREDENTIALS: "acapy_plugin_toolbox.issuer.RevokeCreds",
+    CREDENTIALS_REVOKED: "acapy_plugin_toolbox.issuer.CredsRevoked",
+    PUBLISH_REVOCATIONS: "acapy_plugin_toolbox.issuer.PublishRevocations",
+    REVOCATIONS_PUBLISHED: "acapy_plugin_toolbox.issuer.RevocationsPublished",
     REQUEST_PRESENTATION: "acapy_plugin_toolbox.issuer.RequestPres",
     PRESENTATION_RECEIVED: "acapy_plugin_toolbox.issuer.PresentationReceived",
     CREDENTIAL_ISSUED: "acapy_plugin_toolbox.issuer.CredentialIssued",
@@ -145,9 +181,7 @@ class SendCredHandler(BaseHandler):
     @admin_only
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Handle received send request."""
-        comment = context.message.comment
         connection_id = str(context.message.connection_id)
-        preview_spec = context.message.credential_proposal
 
         session = await context.session()
         try:
@@ -168,31 +202,143 @@ class SendCredHandler(BaseHandler):
             await responder.send_reply(report)
             return
 
-        credential_proposal = CredentialProposal(
-            comment=comment,
-            credential_proposal=preview_spec,
-            **{
-                t: getattr(context.message, t)
-                for t in CRED_DEF_TAGS
-                if hasattr(context.message, t)
-            },
+        cred_exchange_record = await offer_credential(
+            context.profile, responder, context.message
         )
+        cred_exchange = IssuerCredExchange(record=cred_exchange_record)
+        cred_exchange.assign_thread_from(context.message)
+        await responder.send_reply(cred_exchange)
 
-        credential_manager = CredentialManager(context.profile)
 
-        (
-            cred_exchange_record,
-            cred_offer_message,
-        ) = await credential_manager.prepare_send(
-            connection_id, credential_proposal=credential_proposal
-        )
+async def offer_credential(
+    profile: Profile, responder: BaseResponder, request: SendCred
+) -> V10CredentialExchange:
+    """Prepare and send a credential offer as requested by a send message."""
+    credential_proposal = CredentialProposal(
+        comment=request.comment,
+        credential_proposal=request.credential_proposal,
+        **{t: getattr(request, t) for t in CRED_DEF_TAGS if hasattr(request, t)},
+    )
+
+    credential_manager = CredentialManager(profile)
+
+    (cred_exchange_record, cred_offer_message,) = await credential_manager.prepare_send(
+        str(request.connection_id), credential_proposal=credential_proposal
+    )
+
+    await responder.send(
+        cred_offer_message, connection_id=cred_exchange_record.connection_id
+    )
+    return cred_exchange_record
+
+
+SentCredSchema = Schema.from_dict(
+    {
+        "index": fields.Int(
+            required=True, description="Position of the credential in the request"
+        ),
+        "connection_id": fields.Str(required=True),
+        "credential_exchange_id": fields.Str(required=False),
+        "state": fields.Str(required=False),
+        "error": fields.Str(required=False),
+    }
+)
+
+SendCreds, SendCredsSchema = generate_model_schema(
+    name="SendCreds",
+    handler="acapy_plugin_toolbox.issuer.SendCredsHandler",
+    msg_type=SEND_CREDENTIALS,
+    schema={
+        "credentials": fields.List(
+            fields.Nested(V10CredentialProposalRequestMandSchema), required=True
+        ),
+        "chunk": fields.Nested(
+            Chunk.Schema,
+            required=False,
+            data_key="~chunk",
+            description="Stream results in chunks as offers are sent.",
+        ),
+    },
+)
+
+CredsSent, CredsSentSchema = generate_model_schema(
+    name="CredsSent",
+    handler="acapy_plugin_toolbox.util.PassHandler",
+    msg_type=CREDENTIALS_SENT,
+    schema={
+        "results": fields.List(fields.Nested(SentCredSchema), required=True),
+        "chunk": fields.Nested(Chunk.Schema, required=False, data_key="~chunk"),
+    },
+)
 
-        await responder.send(
-            cred_offer_message, connection_id=cred_exchange_record.connection_id
+
+class SendCredsHandler(BaseHandler):
+    """Handler for received bulk send request."""
+
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle received bulk send request.
+
+        Offers are sent concurrently, so results are reported in the order
+        the offers complete rather than the order requested; each result
+        carries the index of its credential in the request. Any failure to
+        send one offer is reported in its result.
+        """
+
+        async def _send(index: int, request: SendCred) -> dict:
+            result = {"index": index, "connection_id": str(request.connection_id)}
+            try:
+                async with context.profile.session() as session:
+                    conn_record = await ConnRecord.retrieve_by_id(
+                        session, result["connection_id"]
+                    )
+                if not conn_record.is_ready:
+                    return {**result, "error": "Connection invalid."}
+                cred_exchange_record = await offer_credential(
+                    context.profile, responder, request
+                )
+            except StorageNotFoundError:
+                return {**result, "error": "Connection not found."}
+            except (
+                CredentialManagerError,
+                StorageError,
+                IndyIssuerError,
+                LedgerError,
+            ) as err:
+                LOGGER.warning(
+                    "Failed to send credential to %s: %s", result["connection_id"], err
+                )
+                return {**result, "error": str(err)}
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.exception(
+                    "Failed to send credential to %s", result["connection_id"]
+                )
+                return {**result, "error": str(err) or type(err).__name__}
+            return {
+                **result,
+                "credential_exchange_id": cred_exchange_record.credential_exchange_id,
+                "state": cred_exchange_record.state,
+            }
+
+        results = as_completed_bounded(
+            (
+                _send(index, SendCred(**spec))
+                for index, spec in enumerate(context.message.credentials)
+            ),
+            ISSUE_CONCURRENCY,
         )
-        cred_exchange = IssuerCredExchange(record=cred_exchange_record)
-        cred_exchange.assign_thread_from(context.message)
-        await responder.send_reply(cred_exchange)
+        if context.message.chunk:
+            await send_chunks(
+                responder,
+                context.message,
+                results,
+                lambda chunk: CredsSent(results=chunk),
+            )
+            return
+
+        creds_sent = CredsSent(results=[result async for result in results])
+        creds_sent.assign_thread_from(context.message)
+        await responder.send_reply(creds_sent)
 
 
 RevokeCred, RevokeCredSchema = generate_model_schema(
@@ -242,6 +388,201 @@ class RevokeCredHandler(BaseHandler):
         await responder.send_reply({})
 
 
+async def mark_revocations_pending(
+    profile: Profile, rrid2crid: Mapping[str, Sequence[str]]
+):
+    """Mark credentials revoked pending publication, saving once per registry."""
+    for rev_reg_id, cred_rev_ids in rrid2crid.items():
+        async with profile.transaction() as txn:
+            rev_reg_record = await IssuerRevRegRecord.retrieve_by_tag_filter(
+                txn, {"revoc_reg_id": rev_reg_id}, for_update=True
+            )
+            rev_reg_record.pending_pub = sorted(
+                set(rev_reg_record.pending_pub or ()) | set(cred_rev_ids)
+            )
+            await rev_reg_record.save(txn, reason="Marked pending revocations")
+            await txn.commit()
+
+
+RevocationSchema = Schema.from_dict(
+    {
+        "rev_reg_id": fields.Str(required=True),
+        "cred_rev_id": fields.Str(required=True),
+    }
+)
+
+FailedRevocationSchema = Schema.from_dict(
+    {
+        "credential_exchange_id": fields.Str(required=False),
+        "rev_reg_id": fields.Str(required=False),
+        "cred_rev_id": fields.Str(required=False),
+        "error": fields.Str(required=True),
+    }
+)
+
+RevokeCreds, RevokeCredsSchema = generate_model_schema(
+    name="RevokeCreds",
+    handler="acapy_plugin_toolbox.issuer.RevokeCredsHandler",
+    msg_type=REVOKE_CREDENTIALS,
+    schema={
+        "credential_exchange_ids": fields.List(fields.Str(), required=False),
+        "credentials": fields.List(fields.Nested(RevocationSchema), required=False),
+        "publish": fields.Bool(
+            required=False,
+            missing=True,
+            description="Publish once per revocation registry, "
+            "otherwise leave revocations pending",
+        ),
+    },
+)
+
+CredsRevoked, CredsRevokedSchema = generate_model_schema(
+    name="CredsRevoked",
+    handler="acapy_plugin_toolbox.util.PassHandler",
+    msg_type=CREDENTIALS_REVOKED,
+    schema={
+        "revoked": fields.Dict(
+            keys=fields.Str(),
+            values=fields.List(fields.Str()),
+            required=True,
+            description="Credential revocation ids revoked by registry",
+        ),
+        "published": fields.Dict(
+            keys=fields.Str(),
+            values=fields.List(fields.Str()),
+            required=False,
+            description="Credential revocation ids published by registry",
+        ),
+        "failed": fields.List(fields.Nested(FailedRevocationSchema), required=True),
+    },
+)
+
+
+class RevokeCredsHandler(BaseHandler):
+    """Handler for received batch revoke request."""
+
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle received batch revoke request."""
+        rrid2crid: Dict[str, List[str]] = defaultdict(list)
+        failed = []
+        for credential in context.message.credentials or ():
+            rrid2crid[credential["rev_reg_id"]].append(credential["cred_rev_id"])
+
+        cred_ex_ids = context.message.credential_exchange_ids or ()
+        if cred_ex_ids:
+            async with context.profile.session() as session:
+                cred_rev_records = await IssuerCredRevRecord.query(
+                    session, {"cred_ex_id": {"$in": list(cred_ex_ids)}}
+                )
+            for record in cred_rev_records:
+                rrid2crid[record.rev_reg_id].append(record.cred_rev_id)
+            found = {record.cred_ex_id for record in cred_rev_records}
+            failed.extend(
+                {
+                    "credential_exchange_id": cred_ex_id,
+                    "error": "No issuer credential revocation record found.",
+                }
+                for cred_ex_id in cred_ex_ids
+                if cred_ex_id not in found
+            )
+
+        for rev_reg_id in list(rrid2crid):
+            try:
+                await mark_revocations_pending(
+                    context.profile, {rev_reg_id: rrid2crid[rev_reg_id]}
+                )
+            except StorageError as err:
+                LOGGER.warning(
+                    "Failed to revoke credentials in %s: %s", rev_reg_id, err
+                )
+                failed.extend(
+                    {
+                        "rev_reg_id": rev_reg_id,
+                        "cred_rev_id": cred_rev_id,
+                        "error": str(err),
+                    }
+                    for cred_rev_id in rrid2crid.pop(rev_reg_id)
+                )
+
+        revoked = CredsRevoked(revoked=dict(rrid2crid), failed=failed)
+        if context.message.publish and rrid2crid:
+            rev_manager = RevocationManager(context.profile)
+            async with ExceptionReporter(
+                responder,
+                (
+                    RevocationManagerError,
+                    RevocationError,
+                    StorageError,
+                    IndyIssuerError,
+                    LedgerError,
+                ),
+                context.message,
+            ):
+                revoked.published = await rev_manager.publish_pending_revocations(
+                    rrid2crid
+                )
+        revoked.assign_thread_from(context.message)
+        await responder.send_reply(revoked)
+
+
+PublishRevocations, PublishRevocationsSchema = generate_model_schema(
+    name="PublishRevocations",
+    handler="acapy_plugin_toolbox.issuer.PublishRevocationsHandler",
+    msg_type=PUBLISH_REVOCATIONS,
+    schema={
+        "rrid2crid": fields.Dict(
+            keys=fields.Str(),
+            values=fields.List(fields.Str()),
+            required=False,
+            description="Credential revocation ids to publish by registry; "
+            "all pending revocations of a registry when empty, "
+            "of all registries when omitted",
+        ),
+    },
+)
+
+RevocationsPublished, RevocationsPublishedSchema = generate_model_schema(
+    name="RevocationsPublished",
+    handler="acapy_plugin_toolbox.util.PassHandler",
+    msg_type=REVOCATIONS_PUBLISHED,
+    schema={
+        "rrid2crid": fields.Dict(
+            keys=fields.Str(),
+            values=fields.List(fields.Str()),
+            required=True,
+            description="Credential revocation ids published by registry",
+        ),
+    },
+)
+
+
+class PublishRevocationsHandler(BaseHandler):
+    """Handler for received publish revocations request."""
+
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle received publish revocations request."""
+        rev_manager = RevocationManager(context.profile)
+        async with ExceptionReporter(
+            responder,
+            (
+                RevocationManagerError,
+                RevocationError,
+                StorageError,
+                IndyIssuerError,
+                LedgerError,
+            ),
+            context.message,
+        ):
+            published = await rev_manager.publish_pending_revocations(
+                context.message.rrid2crid
+            )
+        message = RevocationsPublished(rrid2crid=published)
+        message.assign_thread_from(context.message)
+        await responder.send_reply(message)
+
+
 @expand_message_class
 class RequestPres(AdminIssuerMessage):
     """Request presentation message."""
@@ -326,8 +667,27 @@ CredGetList, CredGetListSchema = generate_model_schema(
     msg_type=CREDENTIALS_GET_LIST,
     schema={
         "connection_id": fields.Str(required=False),
+        "thread_id": fields.Str(required=False),
         "cred_def_id": fields.Str(required=False),
         "schema_id": fields.Str(required=False),
+        "projection": fields.List(
+            fields.Str(),
+            required=False,
+            data_key="fields",
+            description="Only include these fields of each credential exchange",
+        ),
+        "chunk": fields.Nested(
+            Chunk.Schema,
+            required=False,
+            data_key="~chunk",
+            description="Stream credentials in chunks.",
+        ),
+        "paginate": fields.Nested(
+            Paginate.Schema,
+            required=False,
+            data_key="~paginate",
+            description="Pagination decorator; all credentials when omitted.",
+        ),
     },
 )
 
@@ -341,6 +701,8 @@ class CredList(AdminIssuerMessage):
         results = fields.List(
             fields.Dict(), required=True, description="List of credentials", example=[]
         )
+        chunk = fields.Nested(Chunk.Schema, required=False, data_key="~chunk")
+        page = fields.Nested(Page.Schema, required=False, data_key="~page")
 
 
 class CredGetListHandler(BaseHandler):
@@ -350,23 +712,63 @@ class CredGetListHandler(BaseHandler):
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Handle received get cred list request."""
 
-        post_filter_positive = dict(
-            filter(
-                lambda item: item[1] is not None,
-                {
-                    # 'state': V10CredentialExchange.STATE_ISSUED,
-                    "role": V10CredentialExchange.ROLE_ISSUER,
-                    "connection_id": context.message.connection_id,
-                    "credential_definition_id": context.message.cred_def_id,
-                    "schema_id": context.message.schema_id,
-                }.items(),
-            )
+        tag_filter, post_filter_positive = split_tag_filter(
+            V10CredentialExchange,
+            {
+                # 'state': V10CredentialExchange.STATE_ISSUED,
+                "role": V10CredentialExchange.ROLE_ISSUER,
+                "connection_id": context.message.connection_id,
+                "thread_id": context.message.thread_id,
+                "credential_definition_id": context.message.cred_def_id,
+                "schema_id": context.message.schema_id,
+            },
         )
         session = await context.session()
-        records = await V10CredentialExchange.query(
-            session, {}, post_filter_positive=post_filter_positive
+
+        def serialize(record: V10CredentialExchange) -> dict:
+            if context.message.projection:
+                return project_record(record, context.message.projection)
+            return record.serialize()
+
+        if context.message.chunk:
+
+            async def _credentials():
+                async for row in scan_records(
+                    session,
+                    V10CredentialExchange,
+                    tag_filter,
+                    post_filter_positive=post_filter_positive,
+                ):
+                    yield serialize(
+                        V10CredentialExchange.from_storage(
+                            row.id, json.loads(row.value)
+                        )
+                    )
+
+            await send_chunks(
+                responder,
+                context.message,
+                _credentials(),
+                lambda results: CredList(results=results),
+            )
+            return
+
+        page = None
+        if context.message.paginate:
+            async with ExceptionReporter(responder, PaginationError, context.message):
+                records, page = await context.message.paginate.query(
+                    session,
+                    V10CredentialExchange,
+                    tag_filter,
+                    post_filter_positive=post_filter_positive,
+                )
+        else:
+            records = await V10CredentialExchange.query(
+                session, tag_filter, post_filter_positive=post_filter_positive
+            )
+        cred_list = CredList(
+            results=[serialize(record) for record in records], page=page
         )
-        cred_list = CredList(results=[record.serialize() for record in records])
         await responder.send_reply(cred_list)
 
 
@@ -376,7 +778,20 @@ PresGetList, PresGetListSchema = generate_model_schema(
     msg_type=PRESENTATIONS_GET_LIST,
     schema={
         "connection_id": fields.Str(required=False),
+        "thread_id": fields.Str(required=False),
         "verified": fields.Str(required=False),
+        "projection": fields.List(
+            fields.Str(),
+            required=False,
+            data_key="fields",
+            description="Only include these fields of each presentation exchange",
+        ),
+        "paginate": fields.Nested(
+            Paginate.Schema,
+            required=False,
+            data_key="~paginate",
+            description="Pagination decorator; all presentations when omitted.",
+        ),
     },
 )
 
@@ -393,6 +808,7 @@ class PresList(AdminIssuerMessage):
             description="List of presentation exchange records",
             example=[],
         )
+        page = fields.Nested(Page.Schema, required=False, data_key="~page")
 
 
 class PresGetListHandler(BaseHandler):
@@ -402,22 +818,38 @@ class PresGetListHandler(BaseHandler):
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Handle received get cred list request."""
 
-        post_filter_positive = dict(
-            filter(
-                lambda item: item[1] is not None,
-                {
-                    # 'state': V10PresentialExchange.STATE_CREDENTIAL_RECEIVED,
-                    "role": V10PresentationExchange.ROLE_VERIFIER,
-                    "connection_id": context.message.connection_id,
-                    "verified": context.message.verified,
-                }.items(),
-            )
+        tag_filter, post_filter_positive = split_tag_filter(
+            V10PresentationExchange,
+            {
+                # 'state': V10PresentialExchange.STATE_CREDENTIAL_RECEIVED,
+                "role": V10PresentationExchange.ROLE_VERIFIER,
+                "connection_id": context.message.connection_id,
+                "thread_id": context.message.thread_id,
+                "verified": context.message.verified,
+            },
         )
         session = await context.session()
-        records = await V10PresentationExchange.query(
-            session, {}, post_filter_positive=post_filter_positive
+        page = None
+        if context.message.paginate:
+            async with ExceptionReporter(responder, PaginationError, context.message):
+                records, page = await context.message.paginate.query(
+                    session,
+                    V10PresentationExchange,
+                    tag_filter,
+                    post_filter_positive=post_filter_positive,
+                )
+        else:
+            records = await V10PresentationExchange.query(
+                session, tag_filter, post_filter_positive=post_filter_positive
+            )
+        projection = context.message.projection
+        cred_list = PresList(
+            results=[
+                project_record(record, projection) if projection else record.serialize()
+                for record in records
+            ],
+            page=page,
         )
-        cred_list = PresList(results=[record.serialize() for record in records])
         await responder.send_reply(cred_list)
 
 
@@ -445,8 +877,6 @@ class PresentationReceived(AdminIssuerMessage):
 
     message_type = "presentation-received"
 
-    DEFAULT_COUNT = 10
-
     class Fields:
         raw_repr = fields.Mapping(required=True)
         presentation_exchange_id = fields.Str(
@@ -456,44 +886,17 @@ class PresentationReceived(AdminIssuerMessage):
             required=True,
             description="Presentation Request associated with Presentation Exchange ID.",
         )
-        matching_credentials = fields.Nested(
-            IndyCredPrecisSchema,
-            many=True,
-            description="Credentials matching the requested attributes.",
-        )
-        page = fields.Nested(
-            Page.Schema, required=False, description="Pagination decorator."
-        )
 
     def __init__(self, record: PresExRecord, **kwargs):
         super().__init__(**kwargs)
         self.raw_repr = record.serialize()
         self.presentation_request = record.presentation_request.serialize()
         self.presentation_exchange_id = record.presentation_exchange_id
-        self.matching_credentials = []
-        self.page = None
 
     def serialize(self, **kwargs) -> Mapping:
         base_msg = super().serialize(**kwargs)
         return {**self.raw_repr, **base_msg}
 
-    async def retrieve_matching_credentials(self, profile: Profile):
-        holder = profile.inject(IndyHolder)
-        request = self.presentation_request
-
-        if not (type(request) is dict):
-            request = request.serialize()
-        self.matching_credentials = (
-            await holder.get_credentials_for_presentation_request_by_referent(
-                request,
-                (),
-                0,
-                self.DEFAULT_COUNT,
-                extra_query={},
-            )
-        )
-        self.page = Page(count_=self.DEFAULT_COUNT, offset=self.DEFAULT_COUNT)
-
 
 async def setup(
     context: InjectionContext, protocol_registry: Optional[ProtocolRegistry] = None
@@ -504,38 +907,36 @@ async def setup(
     protocol_registry.register_message_types(MESSAGE_TYPES)
     bus: EventBus = context.inject(EventBus)
     bus.subscribe(
-        re.compile(f"acapy::record::{CredExRecord.RECORD_TOPIC}::.*"),
+        record_event_pattern(CredExRecord, CRED_EVENT_STATES),
         issue_credential_event_handler,
     )
     bus.subscribe(
-        re.compile(f"acapy::record::{PresExRecord.RECORD_TOPIC}::.*"),
+        record_event_pattern(PresExRecord, PRES_EVENT_STATES),
         receive_presentation_event_handler,
     )
 
 
 async def issue_credential_event_handler(profile: Profile, event: Event):
     """Handle issue credential events."""
+    if not record_event_matches(event, CRED_EVENT_STATES, CredExRecord.ROLE_ISSUER):
+        return
     record: CredExRecord = CredExRecord.deserialize(event.payload)
     LOGGER.debug("CredentialIssued Event; %s: %s", event.topic, event.payload)
 
-    if record.state == CredExRecord.STATE_ACKED:
-        responder = profile.inject(BaseResponder)
-        message = CredentialIssued(record=record)
-        LOGGER.debug("Prepared Message: %s", message.serialize())
-        await send_to_admins(profile, message, responder)
+    responder = profile.inject(BaseResponder)
+    message = CredentialIssued(record=record)
+    LOGGER.debug("Prepared Message: %s", message.serialize())
+    await send_to_admins(profile, message, responder)
 
 
 async def receive_presentation_event_handler(profile: Profile, event: Event):
     """Handle receive presentation events."""
+    if not record_event_matches(event, PRES_EVENT_STATES, PresExRecord.ROLE_VERIFIER):
+        return
     record: PresExRecord = PresExRecord.deserialize(event.payload)
     LOGGER.debug("PresentationReceived Event; %s: %s", event.topic, event.payload)
 
-    if record.state in [
-        PresExRecord.STATE_VERIFIED,
-        PresExRecord.STATE_PRESENTATION_RECEIVED,
-    ]:
-        responder = profile.inject(BaseResponder)
-        message = PresentationReceived(record=record)
-        LOGGER.debug("Prepared Message: %s", message.serialize())
-        await message.retrieve_matching_credentials(profile)
-        await send_to_admins(profile, message, responder)
+    responder = profile.inject(BaseResponder)
+    message = PresentationReceived(record=record)
+    LOGGER.debug("Prepared Message: %s", message.serialize())
+    await send_to_admins(profile, message, responder)
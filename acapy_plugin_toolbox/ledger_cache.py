@@ -0,0 +1,126 @@
+"""Profile-scoped read-through cache of ledger artifacts."""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from aries_cloudagent.core.profile import Profile
+from aries_cloudagent.ledger.base import BaseLedger
+
+LOGGER = logging.getLogger(__name__)
+
+LEDGER_CACHE_SIZE = int(os.environ.get("ACAPY_TOOLBOX_LEDGER_CACHE_SIZE", 1024))
+LEDGER_CACHE_NEGATIVE_TTL = float(
+    os.environ.get("ACAPY_TOOLBOX_LEDGER_CACHE_NEGATIVE_TTL", 60)
+)
+
+SCHEMA = "schema"
+CRED_DEF = "cred_def"
+CRED_DEF_SCHEMA_ID = "cred_def_schema_id"
+
+
+class LedgerCache:
+    """Read-through cache of schemas and credential definitions.
+
+    Ledger artifacts never change once written, so found artifacts are kept
+    until more than max_size are cached, evicting the least recently used.
+    Lookups that find nothing are remembered for negative_ttl seconds. Any
+    number of concurrent lookups of the same artifact share a single ledger
+    request; errors are passed on to all of them and are not cached.
+    """
+
+    def __init__(self, max_size: int = None, negative_ttl: float = None):
+        """Initialize an empty cache."""
+        self.max_size = LEDGER_CACHE_SIZE if max_size is None else max_size
+        self.negative_ttl = (
+            LEDGER_CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        )
+        self._found: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._missing: Dict[Tuple[str, str], float] = {}
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    @classmethod
+    def for_profile(cls, profile: Profile) -> "LedgerCache":
+        """Return the cache bound to profile, creating it if needed."""
+        cache = profile.inject_or(cls)
+        if not cache:
+            cache = cls()
+            profile.context.injector.bind_instance(cls, cache)
+        return cache
+
+    async def get_schema(self, ledger: BaseLedger, schema_id: str) -> Optional[dict]:
+        """Return the schema with schema_id, or None if not on the ledger."""
+        return await self._get((SCHEMA, schema_id), ledger, ledger.get_schema)
+
+    async def get_credential_definition(
+        self, ledger: BaseLedger, cred_def_id: str
+    ) -> Optional[dict]:
+        """Return the cred def with cred_def_id, or None if not on the ledger."""
+        return await self._get(
+            (CRED_DEF, cred_def_id), ledger, ledger.get_credential_definition
+        )
+
+    async def credential_definition_id2schema_id(
+        self, ledger: BaseLedger, cred_def_id: str
+    ) -> Optional[str]:
+        """Return the id of the schema of the cred def with cred_def_id."""
+        return await self._get(
+            (CRED_DEF_SCHEMA_ID, cred_def_id),
+            ledger,
+            ledger.credential_definition_id2schema_id,
+        )
+
+    def clear(self):
+        """Forget all cached artifacts."""
+        self._found.clear()
+        self._missing.clear()
+
+    async def _get(
+        self,
+        key: Tuple[str, str],
+        ledger: BaseLedger,
+        fetch: Callable[[str], Awaitable[Any]],
+    ):
+        """Return cached value for key, fetching it from the ledger on a miss."""
+        if key in self._found:
+            self._found.move_to_end(key)
+            return self._found[key]
+
+        expires = self._missing.get(key)
+        if expires is not None:
+            if expires > time.monotonic():
+                return None
+            del self._missing[key]
+
+        pending = self._pending.get(key)
+        if not pending:
+            pending = asyncio.ensure_future(self._fetch(key, ledger, fetch))
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self,
+        key: Tuple[str, str],
+        ledger: BaseLedger,
+        fetch: Callable[[str], Awaitable[Any]],
+    ):
+        """Fetch value for key from the ledger and cache it."""
+        _, artifact_id = key
+        async with ledger:
+            value = await fetch(artifact_id)
+
+        if value is None:
+            LOGGER.debug("%s %s not found on ledger", *key)
+            self._missing[key] = time.monotonic() + self.negative_ttl
+            if len(self._missing) > self.max_size:
+                self._missing.pop(next(iter(self._missing)))
+            return None
+
+        self._found[key] = value
+        while len(self._found) > self.max_size:
+            self._found.popitem(last=False)
+        return value
@@ -3,25 +3,40 @@
 # pylint: disable=invalid-name
 # pylint: disable=too-few-public-methods
 
-from asyncio import shield
+import logging
+from asyncio import ensure_future, shield
+from typing import Iterable, List
 
 from marshmallow import fields
 
-from aries_cloudagent.core.profile import ProfileSession
+from aries_cloudagent.core.event_bus import Event, EventBus
+from aries_cloudagent.core.profile import Profile, ProfileSession
 from aries_cloudagent.core.protocol_registry import ProtocolRegistry
+from aries_cloudagent.core.util import STARTUP_EVENT_PATTERN
 from aries_cloudagent.messaging.base_handler import (
     BaseHandler,
     BaseResponder,
     RequestContext,
 )
 from aries_cloudagent.messaging.schemas.routes import add_schema_non_secrets_record
+from aries_cloudagent.messaging.schemas.util import (
+    EVENT_LISTENER_PATTERN as SCHEMA_EVENT_PATTERN,
+)
 from aries_cloudagent.messaging.models.base_record import BaseRecord, BaseRecordSchema
 from aries_cloudagent.ledger.base import BaseLedger
 from aries_cloudagent.indy.issuer import IndyIssuer
 from aries_cloudagent.storage.error import StorageNotFoundError
 from aries_cloudagent.storage.base import BaseStorage
 
-from .util import generate_model_schema, admin_only
+from .ledger_cache import LedgerCache
+from .util import (
+    LEDGER_FETCH_CONCURRENCY,
+    admin_only,
+    gather_bounded,
+    generate_model_schema,
+)
+
+LOGGER = logging.getLogger(__name__)
 
 PROTOCOL = "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/admin-schemas/0.1"
 SCHEMA_SENT_RECORD_TYPE = "schema_sent"
@@ -49,6 +64,36 @@ async def setup(session: ProfileSession, protocol_registry: ProtocolRegistry = N
         protocol_registry = session.inject(ProtocolRegistry)
     protocol_registry.register_message_types(MESSAGE_TYPES)
 
+    event_bus = session.inject(EventBus)
+    event_bus.subscribe(STARTUP_EVENT_PATTERN, schemas_startup_handler)
+    event_bus.subscribe(SCHEMA_EVENT_PATTERN, schema_event_handler)
+
+
+async def schemas_startup_handler(profile: Profile, event: Event):
+    """Reconcile schema records in the background on startup."""
+    ensure_future(reconcile_schemas(profile))
+
+
+async def schema_event_handler(profile: Profile, event: Event):
+    """Save a record for a schema written to the ledger outside the toolbox."""
+    schema = event.payload["context"]
+    async with profile.session() as session:
+        try:
+            await SchemaRecord.retrieve_by_schema_id(session, schema["schema_id"])
+            return
+        except StorageNotFoundError:
+            pass
+
+        record = SchemaRecord(
+            schema_id=schema["schema_id"],
+            schema_name=schema["schema_name"],
+            schema_version=schema["schema_version"],
+            attributes=schema["attributes"],
+            author=SchemaRecord.AUTHOR_SELF,
+            state=SchemaRecord.STATE_WRITTEN,
+        )
+        await record.save(session, reason="Committed to ledger")
+
 
 class SchemaRecord(BaseRecord):
     """Represents a Schema."""
@@ -134,6 +179,75 @@ class SchemaRecordSchema(BaseRecordSchema):
     attributes = fields.List(fields.Str(), required=False)
 
 
+async def fetch_schema_records(
+    profile: Profile, ledger: BaseLedger, schema_ids: Iterable[str]
+) -> List[SchemaRecord]:
+    """Fetch schemas we wrote from the ledger and save them as records.
+
+    Schemas are fetched concurrently; schemas that fail to be fetched are
+    logged and skipped. Records are saved in a single transaction.
+    """
+    schema_ids = list(schema_ids)
+    cache = LedgerCache.for_profile(profile)
+    async with ledger:
+        schemas = await gather_bounded(
+            *(cache.get_schema(ledger, schema_id) for schema_id in schema_ids),
+            limit=LEDGER_FETCH_CONCURRENCY,
+            return_exceptions=True,
+        )
+
+    records = []
+    for schema_id, schema in zip(schema_ids, schemas):
+        if isinstance(schema, Exception) or not schema:
+            LOGGER.warning(
+                "Failed to fetch schema %s from ledger: %s", schema_id, schema
+            )
+            continue
+        records.append(
+            SchemaRecord(
+                schema_id=schema["id"],
+                schema_name=schema["name"],
+                attributes=schema["attrNames"],
+                schema_version=schema["version"],
+                author=SchemaRecord.AUTHOR_SELF,
+                state=SchemaRecord.STATE_WRITTEN,
+            )
+        )
+
+    async with profile.transaction() as txn:
+        for record in records:
+            await record.save(txn, reason="Retrieved from ledger")
+        await txn.commit()
+    return records
+
+
+async def reconcile_schemas(profile: Profile):
+    """Save records for schemas we wrote to the ledger but have no record of."""
+    try:
+        async with profile.session() as session:
+            storage = session.inject(BaseStorage)
+            known_ids = {
+                storage_record.tags["schema_id"]
+                for storage_record in await storage.find_all_records(
+                    SchemaRecord.RECORD_TYPE
+                )
+            }
+            unknown_ids = {
+                storage_record.tags["schema_id"]
+                for storage_record in await storage.find_all_records(
+                    SCHEMA_SENT_RECORD_TYPE
+                )
+            } - known_ids
+            ledger = session.inject_or(BaseLedger)
+
+        if unknown_ids and not ledger:
+            LOGGER.warning("No ledger available to reconcile schemas")
+        elif unknown_ids:
+            await fetch_schema_records(profile, ledger, unknown_ids)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception("Failed to reconcile schemas")
+
+
 SendSchema, SendSchemaSchema = generate_model_schema(
     name="SendSchema",
     handler="acapy_plugin_toolbox.schemas.SendSchemaHandler",
@@ -222,9 +336,9 @@ class SchemaGetHandler(BaseHandler):
             pass
 
         session = await context.session()
-        ledger: BaseLedger = session.inject(BaseLedger)
-        async with ledger:
-            schema = await ledger.get_schema(context.message.schema_id)
+        schema = await LedgerCache.for_profile(context.profile).get_schema(
+            session.inject(BaseLedger), context.message.schema_id
+        )
 
         schema_record = SchemaRecord(
             schema_id=schema["id"],
@@ -264,48 +378,6 @@ class SchemaGetListHandler(BaseHandler):
         """Handle get schema list request."""
 
         session = await context.session()
-        storage = session.inject(BaseStorage)
-
-        toolbox_records = [
-            schema_records for schema_records in await SchemaRecord.query(session, {})
-        ]
-
-        toolbox_record_ids = [schema.schema_id for schema in toolbox_records]
-
-        acapy_record_ids = [
-            storage_record.tags["schema_id"]
-            for storage_record in await storage.find_all_records(
-                SCHEMA_SENT_RECORD_TYPE
-            )
-        ]
-
-        unknown_record_ids = set(acapy_record_ids) - set(toolbox_record_ids)
-
-        if unknown_record_ids:
-            ledger: BaseLedger = session.inject(BaseLedger)
-            async with ledger:
-                schemas = [
-                    await ledger.get_schema(schema_id)
-                    for schema_id in unknown_record_ids
-                ]
-
-            schema_records = [
-                SchemaRecord(
-                    schema_id=schema["id"],
-                    schema_name=schema["name"],
-                    attributes=schema["attrNames"],
-                    schema_version=schema["version"],
-                    author=SchemaRecord.AUTHOR_SELF,
-                    state=SchemaRecord.STATE_WRITTEN,
-                )
-                for schema in schemas
-            ]
-
-            for record in schema_records:
-                await record.save(session)
-
-            toolbox_records.extend(schema_records)
-
-        schema_list = SchemaList(results=toolbox_records)
+        schema_list = SchemaList(results=await SchemaRecord.query(session, {}))
         schema_list.assign_thread_from(context.message)
         await responder.send_reply(schema_list)
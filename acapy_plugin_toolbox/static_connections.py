@@ -3,7 +3,11 @@
 # pylint: disable=invalid-name
 # pylint: disable=too-few-public-methods
 
-from marshmallow import fields, validate
+import logging
+import os
+from typing import List, Mapping, Sequence
+
+from marshmallow import Schema, fields, validate
 
 from aries_cloudagent.core.profile import ProfileSession
 from aries_cloudagent.core.protocol_registry import ProtocolRegistry
@@ -13,6 +17,7 @@ from aries_cloudagent.messaging.base_handler import (
     BaseResponder,
     RequestContext,
 )
+from aries_cloudagent.connections.base_manager import BaseConnectionManager
 from aries_cloudagent.protocols.connections.v1_0.manager import ConnectionManager
 from aries_cloudagent.connections.models.conn_record import ConnRecord
 from aries_cloudagent.connections.models.diddoc import (
@@ -22,11 +27,18 @@ from aries_cloudagent.connections.models.diddoc import (
     Service,
 )
 from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
-from aries_cloudagent.storage.error import StorageNotFoundError
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.error import StorageError, StorageNotFoundError
+from aries_cloudagent.storage.record import StorageRecord
 from aries_cloudagent.wallet.did_method import DIDMethod
+from aries_cloudagent.wallet.error import WalletError
 from aries_cloudagent.wallet.key_type import KeyType
 
-from .util import generate_model_schema, admin_only
+from .decorators.chunk import Chunk, send_chunks
+from .decorators.pagination import Page, Paginate, PaginationError
+from .util import ExceptionReporter, admin_only, gather_bounded, generate_model_schema
+
+LOGGER = logging.getLogger(__name__)
 
 PROTOCOL = "did:sov:BzCbsNYhMrjHiqZDTUASHg;spec/admin-static-connections/0.1"
 
@@ -35,6 +47,18 @@ CREATE_STATIC_CONNECTION = "{}/create-static-connection".format(PROTOCOL)
 STATIC_CONNECTION_INFO = "{}/static-connection-info".format(PROTOCOL)
 STATIC_CONNECTION_GET_LIST = "{}/static-connection-get-list".format(PROTOCOL)
 STATIC_CONNECTION_LIST = "{}/static-connection-list".format(PROTOCOL)
+CREATE_STATIC_CONNECTIONS = "{}/create-static-connections".format(PROTOCOL)
+STATIC_CONNECTIONS_CREATED = "{}/static-connections-created".format(PROTOCOL)
+
+STATIC_RESOLVE_CONCURRENCY = int(
+    os.environ.get("ACAPY_TOOLBOX_STATIC_RESOLVE_CONCURRENCY", 10)
+)
+STATIC_CREATE_BATCH_SIZE = int(
+    os.environ.get("ACAPY_TOOLBOX_STATIC_CREATE_BATCH_SIZE", 100)
+)
+
+# Accepted peer roles: any label of a connection role
+ROLE_LABELS = [label for role in ConnRecord.Role for label in role.value]
 
 # Message Type to Message Class Map
 MESSAGE_TYPES = {
@@ -46,6 +70,10 @@ MESSAGE_TYPES = {
     ".StaticConnectionGetList",
     STATIC_CONNECTION_LIST: "acapy_plugin_toolbox.static_connections"
     ".StaticConnectionList",
+    CREATE_STATIC_CONNECTIONS: "acapy_plugin_toolbox.static_connections"
+    ".CreateStaticConnections",
+    STATIC_CONNECTIONS_CREATED: "acapy_plugin_toolbox.static_connections"
+    ".StaticConnectionsCreated",
 }
 
 
@@ -63,7 +91,7 @@ CreateStaticConnection, CreateStaticConnectionSchema = generate_model_schema(
     msg_type=CREATE_STATIC_CONNECTION,
     schema={
         "label": fields.Str(required=True),
-        "role": fields.Str(required=False),
+        "role": fields.Str(required=False, validate=validate.OneOf(ROLE_LABELS)),
         "static_did": fields.Str(required=True),
         "static_key": fields.Str(required=True),
         "static_endpoint": fields.Str(missing=""),
@@ -81,66 +109,252 @@ StaticConnectionInfo, StaticConnectionInfoSchema = generate_model_schema(
 )
 
 
-class CreateStaticConnectionHandler(BaseHandler):
-    """Handler for static connection creation requests."""
+def static_did_doc(did: str, key: str, endpoint: str) -> DIDDoc:
+    """Construct a DID doc from the basic components of a static peer."""
+    diddoc = DIDDoc(did)
+    public_key = PublicKey(
+        did=did,
+        ident="1",
+        value=key,
+        pk_type=PublicKeyType.ED25519_SIG_2018,
+        controller=did,
+    )
+    service = Service(
+        did=did,
+        ident="indy",
+        typ="IndyAgent",
+        recip_keys=[public_key],
+        routing_keys=[],
+        endpoint=endpoint,
+    )
+    diddoc.set(public_key)
+    diddoc.set(service)
+    return diddoc
 
-    @admin_only
-    async def handle(self, context: RequestContext, responder: BaseResponder):
-        """Handle static connection creation request."""
 
-        session = await context.session()
-        connection_mgr = ConnectionManager(session)
-        wallet: BaseWallet = session.inject(BaseWallet)
+async def _store_did_documents(session: ProfileSession, did_docs: Sequence[DIDDoc]):
+    """Store DID docs and their keys within the session.
+
+    Mirrors BaseConnectionManager.store_did_document of ACA-Py 0.7.4, which
+    opens sessions of its own and so cannot take part in a transaction.
+    Existing docs are looked up and their keys removed with one storage call
+    each, rather than per doc. Of several docs with the same DID, the last
+    is kept.
+    """
+    storage: BaseStorage = session.inject(BaseStorage)
+    did_docs = {did_doc.did: did_doc for did_doc in did_docs}
+    records = {
+        record.tags["did"]: record
+        for record in await storage.find_all_records(
+            BaseConnectionManager.RECORD_TYPE_DID_DOC, {"did": {"$in": list(did_docs)}}
+        )
+    }
+    await storage.delete_all_records(
+        BaseConnectionManager.RECORD_TYPE_DID_KEY, {"did": {"$in": list(did_docs)}}
+    )
+    for did, did_doc in did_docs.items():
+        if did in records:
+            await storage.update_record(records[did], did_doc.to_json(), {"did": did})
+        else:
+            await storage.add_record(
+                StorageRecord(
+                    BaseConnectionManager.RECORD_TYPE_DID_DOC,
+                    did_doc.to_json(),
+                    {"did": did},
+                )
+            )
+        for key in did_doc.pubkey.values():
+            if key.controller == did:
+                await storage.add_record(
+                    StorageRecord(
+                        BaseConnectionManager.RECORD_TYPE_DID_KEY,
+                        key.value,
+                        {"did": did, "key": key.value},
+                    )
+                )
+
+
+async def create_static_connections(
+    session: ProfileSession, peers: Sequence[Mapping], endpoint: str = None
+) -> List[dict]:
+    """Create static connections to peers within one session.
+
+    Each peer is a mapping of label, role, static_did, static_key and
+    static_endpoint.
+    """
+    wallet: BaseWallet = session.inject(BaseWallet)
+    await _store_did_documents(
+        session,
+        [
+            static_did_doc(
+                peer["static_did"], peer["static_key"], peer.get("static_endpoint", "")
+            )
+            for peer in peers
+        ],
+    )
 
+    results = []
+    for peer in peers:
+        their_did = peer["static_did"]
         # Make our info for the connection
         my_info = await wallet.create_local_did(
             method=DIDMethod.SOV, key_type=KeyType.ED25519
         )
-
-        # Create connection record
         connection = ConnRecord(
-            initiator=ConnRecord.INITIATOR_SELF,
             my_did=my_info.did,
-            their_did=context.message.static_did,
-            their_label=context.message.label,
-            their_role=context.message.role if context.message.role else None,
-            state=ConnRecord.STATE_ACTIVE,
+            their_did=their_did,
+            their_label=peer["label"],
+            their_role=peer.get("role") or None,
+            state=ConnRecord.State.COMPLETED,
             invitation_mode=ConnRecord.INVITATION_MODE_STATIC,
         )
-
-        # Construct their did doc from the basic components in message
-        diddoc = DIDDoc(context.message.static_did)
-        public_key = PublicKey(
-            did=context.message.static_did,
-            ident="1",
-            value=context.message.static_key,
-            pk_type=PublicKeyType.ED25519_SIG_2018,
-            controller=context.message.static_did,
-        )
-        service = Service(
-            did=context.message.static_did,
-            ident="indy",
-            typ="IndyAgent",
-            recip_keys=[public_key],
-            routing_keys=[],
-            endpoint=context.message.static_endpoint,
+        await connection.save(session, reason="Created new static connection")
+        results.append(
+            {
+                "connection_id": connection.connection_id,
+                "their_did": their_did,
+                "did": my_info.did,
+                "key": my_info.verkey,
+                "endpoint": endpoint,
+            }
         )
-        diddoc.set(public_key)
-        diddoc.set(service)
+    return results
 
-        # Save
-        await connection_mgr.store_did_document(diddoc)
-        await connection.save(session, reason="Created new static connection")
+
+class CreateStaticConnectionHandler(BaseHandler):
+    """Handler for static connection creation requests."""
+
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle static connection creation request."""
+        peer = {
+            "label": context.message.label,
+            "role": context.message.role,
+            "static_did": context.message.static_did,
+            "static_key": context.message.static_key,
+            "static_endpoint": context.message.static_endpoint or "",
+        }
+        async with context.profile.transaction() as txn:
+            (result,) = await create_static_connections(
+                txn, [peer], context.settings.get("default_endpoint")
+            )
+            await txn.commit()
 
         # Prepare response
         info = StaticConnectionInfo(
-            did=my_info.did,
-            key=my_info.verkey,
-            endpoint=context.settings.get("default_endpoint"),
+            did=result["did"], key=result["key"], endpoint=result["endpoint"]
         )
         info.assign_thread_from(context.message)
         await responder.send_reply(info)
-        return
+
+
+StaticPeerSchema = Schema.from_dict(
+    {
+        "label": fields.Str(required=True),
+        "role": fields.Str(required=False, validate=validate.OneOf(ROLE_LABELS)),
+        "static_did": fields.Str(required=True),
+        "static_key": fields.Str(required=True),
+        "static_endpoint": fields.Str(missing=""),
+    }
+)
+
+CreatedStaticConnectionSchema = Schema.from_dict(
+    {
+        "connection_id": fields.Str(required=True),
+        "their_did": fields.Str(required=True),
+        "did": fields.Str(required=True),
+        "key": fields.Str(required=True),
+        "endpoint": fields.Str(required=False),
+    }
+)
+
+FailedStaticPeerSchema = Schema.from_dict(
+    {
+        "static_did": fields.Str(required=True),
+        "error": fields.Str(required=True),
+    }
+)
+
+CreateStaticConnections, CreateStaticConnectionsSchema = generate_model_schema(
+    name="CreateStaticConnections",
+    handler="acapy_plugin_toolbox.static_connections" ".CreateStaticConnectionsHandler",
+    msg_type=CREATE_STATIC_CONNECTIONS,
+    schema={
+        "peers": fields.List(fields.Nested(StaticPeerSchema), required=True),
+        "chunk": fields.Nested(
+            Chunk.Schema,
+            required=False,
+            data_key="~chunk",
+            description="Stream created connections in chunks.",
+        ),
+    },
+)
+
+StaticConnectionsCreated, StaticConnectionsCreatedSchema = generate_model_schema(
+    name="StaticConnectionsCreated",
+    handler="acapy_plugin_toolbox.util.PassHandler",
+    msg_type=STATIC_CONNECTIONS_CREATED,
+    schema={
+        "results": fields.List(fields.Nested(CreatedStaticConnectionSchema)),
+        "failed": fields.List(
+            fields.Nested(FailedStaticPeerSchema),
+            required=False,
+            description="Peers whose batch failed; no connection was created.",
+        ),
+        "chunk": fields.Nested(Chunk.Schema, required=False, data_key="~chunk"),
+    },
+)
+
+
+class CreateStaticConnectionsHandler(BaseHandler):
+    """Handler for bulk static connection creation requests."""
+
+    @admin_only
+    async def handle(self, context: RequestContext, responder: BaseResponder):
+        """Handle bulk static connection creation request.
+
+        Peers are created in batches, each in a single transaction. The peers
+        of a batch that fails are reported as failed and the remaining
+        batches are still created; when chunked, failures are reported in
+        the next chunk sent.
+        """
+        peers = context.message.peers
+        endpoint = context.settings.get("default_endpoint")
+        failed = []
+
+        async def _created():
+            for start in range(0, len(peers), STATIC_CREATE_BATCH_SIZE):
+                batch = peers[start : start + STATIC_CREATE_BATCH_SIZE]
+                try:
+                    async with context.profile.transaction() as txn:
+                        results = await create_static_connections(txn, batch, endpoint)
+                        await txn.commit()
+                except (StorageError, WalletError, ValueError) as err:
+                    LOGGER.warning(
+                        "Failed to create batch of %d static connections: %s",
+                        len(batch),
+                        err,
+                    )
+                    failed.extend(
+                        {"static_did": peer["static_did"], "error": str(err)}
+                        for peer in batch
+                    )
+                    continue
+                for result in results:
+                    yield result
+
+        def _reply(results: List[dict]):
+            reply = StaticConnectionsCreated(results=results, failed=list(failed))
+            failed.clear()
+            return reply
+
+        if context.message.chunk:
+            await send_chunks(responder, context.message, _created(), _reply)
+            return
+
+        created = _reply([result async for result in _created()])
+        created.assign_thread_from(context.message)
+        await responder.send_reply(created)
 
 
 StaticConnectionGetList, StaticConnectionGetListSchema = generate_model_schema(
@@ -155,6 +369,12 @@ StaticConnectionGetList, StaticConnectionGetListSchema = generate_model_schema(
         "my_did": fields.Str(required=False),
         "their_did": fields.Str(required=False),
         "their_role": fields.Str(required=False),
+        "paginate": fields.Nested(
+            Paginate.Schema,
+            required=False,
+            data_key="~paginate",
+            description="Pagination decorator; all connections when omitted.",
+        ),
     },
 )
 
@@ -179,7 +399,8 @@ StaticConnectionList, StaticConnectionListSchema = generate_model_schema(
                     endpoint=fields.Str(),
                 ),
             )
-        )
+        ),
+        "page": fields.Nested(Page.Schema, required=False, data_key="~page"),
     },
 )
 
@@ -191,8 +412,8 @@ class StaticConnectionGetListHandler(BaseHandler):
     async def handle(self, context: RequestContext, responder: BaseResponder):
         """Handle static connection get list request."""
         session = await context.session()
-        connection_mgr = ConnectionManager(session)
-        wallet: BaseWallet = session.inject(BaseWallet)
+        connection_mgr = ConnectionManager(context.profile)
+        page = None
         try:
             tag_filter = dict(
                 filter(
@@ -214,9 +435,20 @@ class StaticConnectionGetListHandler(BaseHandler):
                     }.items(),
                 )
             )
-            records = await ConnRecord.query(
-                session, tag_filter, post_filter_positive=post_filter_positive
-            )
+            if context.message.paginate:
+                async with ExceptionReporter(
+                    responder, PaginationError, context.message
+                ):
+                    records, page = await context.message.paginate.query(
+                        session,
+                        ConnRecord,
+                        tag_filter,
+                        post_filter_positive=post_filter_positive,
+                    )
+            else:
+                records = await ConnRecord.query(
+                    session, tag_filter, post_filter_positive=post_filter_positive
+                )
         except StorageNotFoundError:
             report = ProblemReport(
                 description={"en": "Connection not found."}, who_retries="none"
@@ -225,33 +457,35 @@ class StaticConnectionGetListHandler(BaseHandler):
             await responder.send_reply(report)
             return
 
-        def flatten_target(connection, target, my_info):
+        def flatten_target(connection, targets):
             """Map for flattening results."""
+            target = targets[0] if targets else None
             return {
                 "connection_id": connection.connection_id,
                 "their_info": {
-                    "label": target.label,
-                    "did": target.did,
-                    "vk": target.recipient_keys[0],
-                    "endpoint": target.endpoint,
+                    "label": target.label if target else connection.their_label,
+                    "did": target.did if target else connection.their_did,
+                    "vk": target.recipient_keys[0] if target else None,
+                    "endpoint": target.endpoint if target else None,
                 },
                 "my_info": {
-                    "did": my_info.did,
-                    "vk": my_info.verkey,
+                    "did": connection.my_did,
+                    # Targets are built with our verkey for the connection
+                    "vk": target.sender_key if target else None,
                     "endpoint": context.settings.get("default_endpoint"),
                 },
             }
 
-        targets = []
-        my_info = []
-        for record in records:
-            targets.extend(
-                await connection_mgr.get_connection_targets(connection=record)
-            )
-            my_info.append(await wallet.get_local_did(record.my_did))
-
-        results = list(map(flatten_target, records, targets, my_info))
+        # Targets are resolved in sessions of their own, so may run concurrently
+        targets = await gather_bounded(
+            *(
+                connection_mgr.get_connection_targets(connection=record)
+                for record in records
+            ),
+            limit=STATIC_RESOLVE_CONCURRENCY,
+        )
+        results = list(map(flatten_target, records, targets))
 
-        static_connections = StaticConnectionList(results=results)
+        static_connections = StaticConnectionList(results=results, page=page)
         static_connections.assign_thread_from(context.message)
         await responder.send_reply(static_connections)
@@ -2,18 +2,34 @@
 
 # pylint: disable=too-few-public-methods
 
+import asyncio
 import sys
-from typing import Type, Union, Tuple, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Type,
+    Union,
+    Tuple,
+    cast,
+)
 import logging
 import functools
-import json
+import itertools
+import os
+import re
 from datetime import datetime, timezone
 from dateutil.parser import isoparse
 
 from aries_cloudagent.connections.models.conn_record import ConnRecord
 from aries_cloudagent.protocols.connections.v1_0.manager import ConnectionManager
-from aries_cloudagent.storage.base import BaseStorage
 from aries_cloudagent.storage.error import StorageNotFoundError
+from aries_cloudagent.core.event_bus import Event
 from aries_cloudagent.core.profile import ProfileSession, Profile
 from aries_cloudagent.messaging.agent_message import AgentMessage, AgentMessageSchema
 from aries_cloudagent.messaging.base_handler import (
@@ -22,10 +38,19 @@ from aries_cloudagent.messaging.base_handler import (
     RequestContext,
 )
 from aries_cloudagent.messaging.models.base import BaseModel, BaseModelSchema
+from aries_cloudagent.messaging.models.base_record import BaseRecord
 from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
 
+from .admin_registry import AdminRegistry
+
 LOGGER = logging.getLogger(__name__)
 
+ADMIN_SEND_CONCURRENCY = int(os.environ.get("ACAPY_TOOLBOX_ADMIN_SEND_CONCURRENCY", 10))
+ADMIN_SEND_TIMEOUT = float(os.environ.get("ACAPY_TOOLBOX_ADMIN_SEND_TIMEOUT", 10))
+LEDGER_FETCH_CONCURRENCY = int(
+    os.environ.get("ACAPY_TOOLBOX_LEDGER_FETCH_CONCURRENCY", 10)
+)
+
 
 def timestamp_utc_iso(timespec: str = "seconds") -> str:
     """Timestamp in UTC in ISO 8601 format.
@@ -55,7 +80,8 @@ def require_role(role):
     Verify that the current connection has a given role.
 
     Verify that the current connection has a given role; otherwise, send a
-    problem report.
+    problem report. Roles are looked up through the profile's AdminRegistry,
+    which caches the group of each connection.
     """
 
     def _require_role(func):
@@ -65,7 +91,8 @@ def require_role(role):
             responder, *_ = [arg for arg in args if isinstance(arg, BaseResponder)]
             if context.connection_record:
                 session = await context.session()
-                group = await context.connection_record.metadata_get(session, "group")
+                registry = AdminRegistry.for_profile(context.profile)
+                group = await registry.group(session, context.connection_record)
                 if group == role:
                     return await func(*args)
 
@@ -335,31 +362,111 @@ class PassHandler(BaseHandler):
         LOGGER.info("Pass: Not handling message of type %s", context.message._type)
 
 
+def project_record(record: BaseRecord, projection: Sequence[str] = None) -> dict:
+    """Return the stored value of a record, limited to the projected fields.
+
+    This skips the schema dump of record.serialize(); nested values are
+    returned as stored and unset values are included as None.
+    """
+    value = {record.RECORD_ID_NAME: record._id, **record.value}
+    if projection:
+        return {key: value[key] for key in projection if key in value}
+    return value
+
+
+def split_tag_filter(
+    record_cls: Type[BaseRecord], filters: Mapping[str, Any]
+) -> Tuple[dict, dict]:
+    """Split filters into a tag filter and a post filter for record_cls.
+
+    Filters on values that record_cls stores as tags are looked up in the
+    storage index; the others must be checked against each record. Filters
+    set to None are dropped.
+    """
+    tag_names = {name.lstrip("~") for name in record_cls.TAG_NAMES}
+    tag_filter = {}
+    post_filter = {}
+    for key, value in filters.items():
+        if value is not None:
+            (tag_filter if key in tag_names else post_filter)[key] = value
+    return tag_filter, post_filter
+
+
+def record_event_pattern(
+    record_cls: Type[BaseRecord], states: Iterable[str]
+) -> Pattern:
+    """Return a pattern matching events of record_cls entering any of states."""
+    return re.compile(
+        "{}::{}::({})$".format(
+            re.escape(record_cls.EVENT_NAMESPACE),
+            re.escape(record_cls.RECORD_TOPIC),
+            "|".join(map(re.escape, states)),
+        )
+    )
+
+
+def record_event_matches(
+    event: Event, states: Iterable[str], role: Optional[str] = None
+) -> bool:
+    """Check the state and role of a record event before deserializing it.
+
+    Record events carry the serialized record as payload; deserializing it
+    is only worthwhile for events the handler acts on.
+    """
+    payload = event.payload
+    return payload.get("state") in states and (
+        role is None or payload.get("role") == role
+    )
+
+
 async def admin_connections(session: ProfileSession):
     """Return admin connections."""
-    storage = session.inject(BaseStorage)
-    admin_metadata_records = [
-        record
-        for record in await storage.find_all_records(
-            ConnRecord.RECORD_TYPE_METADATA, {"key": "group"}
-        )
-        or []
-        if json.loads(record.value) == "admin"
-    ]
-    admins = []
-    for record in admin_metadata_records:
-        try:
-            admin = await ConnRecord.retrieve_by_id(
-                session, record.tags["connection_id"]
-            )
-            admins.append(admin)
-        except StorageNotFoundError:
-            # Clean up dangling metadata records of admins
-            LOGGER.debug("Deleteing dangling admin metadata record: %s", admins)
-            await storage.delete_record(record)
+    return await AdminRegistry.for_profile(session.profile).admins(session)
+
+
+async def gather_bounded(
+    *aws: Awaitable, limit: int, return_exceptions: bool = False
+) -> list:
+    """Gather awaitables, running at most limit of them at once.
+
+    Results are returned in the order the awaitables were given, as with
+    asyncio.gather.
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _bounded(awaitable: Awaitable):
+        async with semaphore:
+            return await awaitable
 
-    LOGGER.info("Discovered admins: %s", admins)
-    return admins
+    return await asyncio.gather(
+        *(_bounded(awaitable) for awaitable in aws),
+        return_exceptions=return_exceptions,
+    )
+
+
+async def as_completed_bounded(aws: Iterable[Awaitable], limit: int) -> AsyncIterator:
+    """Yield results of awaitables as they complete, running at most limit at once.
+
+    Awaitables are only started as earlier ones complete, so aws may be a
+    lazy iterable of any length. Awaitables still running when the consumer
+    stops iterating are cancelled.
+    """
+    aws = iter(aws)
+    pending = set()
+    try:
+        while True:
+            for awaitable in itertools.islice(aws, max(limit, 1) - len(pending)):
+                pending.add(asyncio.ensure_future(awaitable))
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 async def send_to_admins(
@@ -367,35 +474,58 @@ async def send_to_admins(
     message: AgentMessage,
     responder: BaseResponder,
     to_session_only: bool = False,
+    *,
+    concurrency: int = None,
+    timeout: float = None,
 ):
-    """Send a message to all admin connections."""
+    """Send a message to all admin connections.
+
+    Admins are sent to concurrently, at most concurrency at a time. Resolving
+    targets and sending to an admin must complete within timeout seconds;
+    failures and timeouts are logged and do not delay or prevent delivery to
+    the remaining admins.
+    """
     LOGGER.info("Sending message to admins: %s", message.serialize())
+    concurrency = concurrency or ADMIN_SEND_CONCURRENCY
+    timeout = timeout or ADMIN_SEND_TIMEOUT
     async with profile.session() as session:
         admins = await admin_connections(session)
     admins = list(filter(lambda admin: admin.state == "active", admins))
     connection_mgr = ConnectionManager(profile)
-    admin_targets = [
-        (admin, target)
-        for admin in admins
-        for target in await connection_mgr.get_connection_targets(connection=admin)
-    ]
-
-    for connection, target in admin_targets:
-        if not to_session_only:
-            await responder.send(
-                message,
-                connection_id=connection.connection_id,
-                reply_to_verkey=target.recipient_keys[0],
-                reply_from_verkey=target.sender_key,
+
+    async def _send(connection: ConnRecord):
+        for target in await connection_mgr.get_connection_targets(
+            connection=connection
+        ):
+            if not to_session_only:
+                await responder.send(
+                    message,
+                    connection_id=connection.connection_id,
+                    reply_to_verkey=target.recipient_keys[0],
+                    reply_from_verkey=target.sender_key,
+                )
+            else:
+                await responder.send(
+                    message,
+                    reply_to_verkey=target.recipient_keys[0],
+                    reply_from_verkey=target.sender_key,
+                    to_session_only=to_session_only,
+                )
+
+    async def _send_isolated(connection: ConnRecord):
+        try:
+            await asyncio.wait_for(_send(connection), timeout)
+        except asyncio.TimeoutError:
+            LOGGER.warning(
+                "Timed out sending message to admin %s", connection.connection_id
             )
-        else:
-            await responder.send(
-                message,
-                reply_to_verkey=target.recipient_keys[0],
-                reply_from_verkey=target.sender_key,
-                to_session_only=to_session_only,
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception(
+                "Failed to send message to admin %s", connection.connection_id
             )
 
+    await gather_bounded(*map(_send_isolated, admins), limit=concurrency)
+
 
 class InvalidConnection(Exception):
     """Raised if no connection or connection is not ready."""
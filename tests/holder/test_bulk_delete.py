@@ -0,0 +1,239 @@
+"""Test CredsDelete and PresExchangesDelete messages and handlers."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from acapy_plugin_toolbox.holder.v0_1 import (
+    CredsDelete,
+    CredsDeleted,
+    PresExchangesDelete,
+    PresExchangesDeleted,
+)
+from acapy_plugin_toolbox.holder.v0_1 import deletion
+from aries_cloudagent.indy.holder import IndyHolder, IndyHolderError
+from aries_cloudagent.indy.sdk.holder import IndySdkHolder
+from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange import (
+    V10CredentialExchange as CredExRecord,
+)
+from aries_cloudagent.protocols.present_proof.v1_0.models.presentation_exchange import (
+    V10PresentationExchange as PresExRecord,
+)
+from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
+from aries_cloudagent.storage.error import StorageError
+from aries_cloudagent.wallet.error import WalletNotFoundError
+from asynctest import mock
+
+TEST_CONN_ID = "test-connection-id"
+
+
+@pytest.fixture
+def holder():
+    yield mock.MagicMock(IndySdkHolder)
+
+
+@pytest.fixture
+def context(context, holder):
+    """Context fixture."""
+    context.injector.bind_instance(IndyHolder, holder)
+    yield context
+
+
+@pytest.fixture
+def saved(profile):
+    """Factory for saved test records."""
+
+    async def _saved(record):
+        async with profile.session() as session:
+            await record.save(session)
+        return record
+
+    yield _saved
+
+
+async def remaining_ids(profile, record_cls):
+    async with profile.session() as session:
+        return {record._id for record in await record_cls.query(session)}
+
+
+@pytest.mark.asyncio
+async def test_creds_delete_by_filter(context, mock_responder, profile, holder, saved):
+    """Test holder exchanges matching all filters are deleted with credentials."""
+    await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_HOLDER,
+            state=CredExRecord.STATE_ACKED,
+            connection_id=TEST_CONN_ID,
+            credential_id="cred-1",
+        )
+    )
+    offer = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_HOLDER,
+            state=CredExRecord.STATE_OFFER_RECEIVED,
+            connection_id=TEST_CONN_ID,
+        )
+    )
+    issued = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_ISSUER,
+            state=CredExRecord.STATE_ACKED,
+            connection_id=TEST_CONN_ID,
+        )
+    )
+    holder.delete_credential = mock.CoroutineMock(side_effect=WalletNotFoundError())
+
+    message = CredsDelete(states=[CredExRecord.STATE_ACKED], connection_id=TEST_CONN_ID)
+    await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, CredsDeleted)
+    assert reply.serialize()
+    assert reply.deleted == 1
+    assert reply.failed == []
+    holder.delete_credential.assert_awaited_once_with("cred-1")
+    assert await remaining_ids(profile, CredExRecord) == {offer._id, issued._id}
+
+
+@pytest.mark.asyncio
+async def test_creds_delete_by_ids(context, mock_responder, profile, holder, saved):
+    """Test failures are summarized and leave their records in place."""
+    records = [
+        await saved(
+            CredExRecord(role=CredExRecord.ROLE_HOLDER, credential_id=credential_id)
+        )
+        for credential_id in ("cred-0", "cred-1", "cred-2")
+    ]
+
+    async def _delete_credential(credential_id):
+        if credential_id == "cred-1":
+            raise IndyHolderError("Wallet locked")
+
+    holder.delete_credential = mock.CoroutineMock(side_effect=_delete_credential)
+
+    message = CredsDelete(
+        credential_exchange_ids=[record._id for record in records] + ["missing"]
+    )
+    with mock.patch.object(deletion, "DELETE_BATCH_SIZE", 2):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert reply.deleted == 2
+    assert reply.failed == [
+        {"id": "missing", "error": "Record not found"},
+        {"id": records[1]._id, "error": "Wallet locked"},
+    ]
+    assert await remaining_ids(profile, CredExRecord) == {records[1]._id}
+
+
+@pytest.mark.asyncio
+async def test_creds_delete_ids_and_filters(
+    context, mock_responder, profile, holder, saved
+):
+    """Test records given by id are deleted only if they match all filters."""
+    acked = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_HOLDER,
+            state=CredExRecord.STATE_ACKED,
+            connection_id=TEST_CONN_ID,
+        )
+    )
+    offer = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_HOLDER,
+            state=CredExRecord.STATE_OFFER_RECEIVED,
+            connection_id=TEST_CONN_ID,
+        )
+    )
+    issued = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_ISSUER,
+            state=CredExRecord.STATE_ACKED,
+            connection_id=TEST_CONN_ID,
+        )
+    )
+    other = await saved(
+        CredExRecord(
+            role=CredExRecord.ROLE_HOLDER,
+            state=CredExRecord.STATE_ACKED,
+            connection_id="other-connection-id",
+        )
+    )
+    holder.delete_credential = mock.CoroutineMock()
+
+    message = CredsDelete(
+        credential_exchange_ids=[acked._id, offer._id, issued._id, other._id],
+        states=[CredExRecord.STATE_ACKED],
+        connection_id=TEST_CONN_ID,
+    )
+    await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert reply.deleted == 1
+    assert reply.failed == [
+        {"id": record._id, "error": "Record does not match filters"}
+        for record in (offer, issued, other)
+    ]
+    assert await remaining_ids(profile, CredExRecord) == {
+        offer._id,
+        issued._id,
+        other._id,
+    }
+
+
+@pytest.mark.asyncio
+async def test_creds_delete_x_batch_failure(
+    context, mock_responder, profile, holder, saved
+):
+    """Test a failed batch says its credentials are already deleted."""
+    record = await saved(
+        CredExRecord(role=CredExRecord.ROLE_HOLDER, credential_id="cred-0")
+    )
+    holder.delete_credential = mock.CoroutineMock()
+
+    with mock.patch.object(
+        CredExRecord, "delete_record", side_effect=StorageError("Storage down")
+    ):
+        await CredsDelete(credential_exchange_ids=[record._id]).handle(
+            context, mock_responder
+        )
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert reply.deleted == 0
+    (failure,) = reply.failed
+    assert failure["id"] == record._id
+    assert failure["error"].startswith("Storage down; credential already deleted")
+    holder.delete_credential.assert_awaited_once_with("cred-0")
+    assert await remaining_ids(profile, CredExRecord) == {record._id}
+
+
+@pytest.mark.asyncio
+async def test_creds_delete_x_no_filter(context, mock_responder, holder, saved):
+    await saved(CredExRecord(role=CredExRecord.ROLE_HOLDER))
+    await CredsDelete().handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, ProblemReport)
+    holder.delete_credential.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pres_exchanges_delete_older_than(
+    context, mock_responder, profile, saved
+):
+    """Test only prover exchanges created before older_than are deleted."""
+    old = await saved(PresExRecord(role=PresExRecord.ROLE_PROVER))
+    cutoff = "2999-01-01 00:00:00Z"
+    new = await saved(PresExRecord(role=PresExRecord.ROLE_PROVER))
+    new.created_at = "3000-01-01 00:00:00.000000Z"
+    async with profile.session() as session:
+        await new.save(session)
+    verifier = await saved(PresExRecord(role=PresExRecord.ROLE_VERIFIER))
+
+    await PresExchangesDelete(older_than=cutoff).handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, PresExchangesDeleted)
+    assert reply.deleted == 1
+    remaining = await remaining_ids(profile, PresExRecord)
+    assert remaining == {new._id, verifier._id}
+    assert old._id not in remaining
@@ -2,6 +2,8 @@
 
 # pylint: disable=redefined-outer-name
 
+import asyncio
+
 import pytest
 from acapy_plugin_toolbox.holder import v0_1 as test_module
 from aries_cloudagent.core.event_bus import Event, EventBus
@@ -65,28 +67,44 @@ def mock_send_to_admins():
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "handler, topic",
+    "handler, topic, triggered",
     [
         (
             "issue_credential_event_handler",
-            f"acapy::record::{V10CredentialExchange.RECORD_TOPIC}::test",
+            f"acapy::record::{V10CredentialExchange.RECORD_TOPIC}::"
+            f"{V10CredentialExchange.STATE_OFFER_RECEIVED}",
+            1,
+        ),
+        (
+            "issue_credential_event_handler",
+            f"acapy::record::{V10CredentialExchange.RECORD_TOPIC}::"
+            f"{V10CredentialExchange.STATE_REQUEST_SENT}",
+            0,
         ),
         (
             "present_proof_event_handler",
-            f"acapy::record::{V10PresentationExchange.RECORD_TOPIC}::test",
+            f"acapy::record::{V10PresentationExchange.RECORD_TOPIC}::"
+            f"{V10PresentationExchange.STATE_REQUEST_RECEIVED}",
+            1,
+        ),
+        (
+            "present_proof_event_handler",
+            f"acapy::record::{V10PresentationExchange.RECORD_TOPIC}::"
+            f"{V10PresentationExchange.STATE_REQUEST_RECEIVED}_other",
+            0,
         ),
     ],
 )
 async def test_events_subscribed_and_triggered(
-    profile, context, event_bus, handler, topic
+    profile, context, event_bus, handler, topic, triggered
 ):
-    """Test events are correctly registered and triggered."""
+    """Test handlers are only triggered by events of relevant states."""
     with mock.patch.object(
         test_module, handler, mock.CoroutineMock()
     ) as mock_event_handler:
         await test_module.setup(context)
         await event_bus.notify(profile, Event(topic, {"test": "payload"}))
-        mock_event_handler.assert_called_once()
+        assert mock_event_handler.call_count == triggered
 
 
 @pytest.mark.asyncio
@@ -114,27 +132,55 @@ async def test_message_sent_on_correct_state(
     assert isinstance(mock_send_to_admins.message, message)
 
 
-@pytest.mark.asyncio
-async def test_pres_req_received_sent_on_state(profile, mock_send_to_admins):
-    """Test message sent on handle given correct state."""
-    handler = test_module.present_proof_event_handler
-    state = V10PresentationExchange.STATE_REQUEST_RECEIVED
-    message = test_module.PresRequestReceived
-    event = Event(
+@pytest.fixture
+def pres_req_received_event():
+    """Presentation request received event fixture."""
+    yield Event(
         "anything",
         {
-            "state": state,
+            "state": V10PresentationExchange.STATE_REQUEST_RECEIVED,
             "presentation_request": {
                 "requested_attributes": {},
                 "requested_predicates": {},
             },
         },
     )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode, retrieved", [("inline", 1), ("none", 0)])
+async def test_pres_req_received_sent_on_state(
+    profile, mock_send_to_admins, pres_req_received_event, monkeypatch, mode, retrieved
+):
+    """Test message sent on handle given correct state."""
+    monkeypatch.setattr(test_module, "MATCHING_CREDENTIALS", mode)
+    message = test_module.PresRequestReceived
     with mock.patch.object(
         message, "retrieve_matching_credentials", mock.CoroutineMock()
-    ):
-        await handler(profile, event)
+    ) as retrieve:
+        await test_module.present_proof_event_handler(profile, pres_req_received_event)
     assert isinstance(mock_send_to_admins.message, message)
+    assert retrieve.await_count == retrieved
+
+
+@pytest.mark.asyncio
+async def test_pres_req_received_matches_follow_up(
+    profile, mock_send_to_admins, pres_req_received_event, monkeypatch
+):
+    """Test matching credentials are sent after the notification."""
+    monkeypatch.setattr(test_module, "MATCHING_CREDENTIALS", "follow-up")
+    with mock.patch.object(
+        test_module.PresRequestReceived,
+        "retrieve_matching_credentials",
+        mock.CoroutineMock(),
+    ) as retrieve:
+        await test_module.present_proof_event_handler(profile, pres_req_received_event)
+        assert isinstance(mock_send_to_admins.message, test_module.PresRequestReceived)
+        retrieve.assert_not_awaited()
+        for _ in range(3):
+            await asyncio.sleep(0)
+    retrieve.assert_awaited_once()
+    assert isinstance(mock_send_to_admins.message, test_module.PresMatchingCredentials)
 
 
 @pytest.mark.asyncio
@@ -7,11 +7,14 @@ TEST_CONN_ID = "test-connection-id"
 
 
 @pytest.fixture
-def pres_record():
-    """Factory for test presentation records."""
+def pres_record(profile):
+    """Factory for saved test presentation records."""
 
-    def _pres_record():
-        return test_module.PresExRecord()
+    async def _pres_record(**kwargs):
+        record = test_module.PresExRecord(**kwargs)
+        async with profile.session() as session:
+            await record.save(session)
+        return record
 
     yield _pres_record
 
@@ -30,16 +33,14 @@ def context(context, message):
 
 
 @pytest.mark.asyncio
-async def test_handler(
-    context, mock_responder, message, mock_record_query, pres_record
-):
+async def test_handler(context, mock_responder, message, pres_record):
     """Test PresGetList handler."""
-    rec1 = pres_record()
-    with mock_record_query(
-        test_module.PresExRecord, [rec1], spec=test_module.PresExRecord
-    ) as record_query:
-        await message.handle(context, mock_responder)
-    record_query.assert_called_once()
+    rec1 = await pres_record(
+        role=test_module.PresExRecord.ROLE_PROVER, connection_id=TEST_CONN_ID
+    )
+    await pres_record(role=test_module.PresExRecord.ROLE_VERIFIER)
+    await pres_record(role=test_module.PresExRecord.ROLE_PROVER)
+    await message.handle(context, mock_responder)
     assert len(mock_responder.messages) == 1
     pres_list, _ = mock_responder.messages[0]
     assert isinstance(pres_list, PresList)
@@ -2,6 +2,8 @@
 
 # pylint: disable=redefined-outer-name
 
+import asyncio
+
 import pytest
 from acapy_plugin_toolbox.decorators.pagination import Paginate
 from acapy_plugin_toolbox.holder import v0_1 as test_module
@@ -10,6 +12,7 @@ from acapy_plugin_toolbox.holder.v0_1 import (
     PresMatchingCredentials,
     PresRequestApprove,
 )
+from acapy_plugin_toolbox.holder.v0_1 import matching
 from acapy_plugin_toolbox.holder.v0_1.error import InvalidPresentationExchange
 from aries_cloudagent.indy.holder import IndyHolder
 from aries_cloudagent.indy.sdk.holder import IndySdkHolder
@@ -48,10 +51,37 @@ def context(context, message, holder):
 @pytest.fixture
 def record():
     yield PresExRecord(
-        presentation_exchange_id=TEST_PRES_EX_ID, connection_id=TEST_CONN_ID
+        presentation_exchange_id=TEST_PRES_EX_ID,
+        connection_id=TEST_CONN_ID,
+        presentation_request={
+            "name": "proof",
+            "version": "1.0",
+            "nonce": "1234",
+            "requested_attributes": {
+                "name_ref": {"name": "name"},
+                "email_ref": {"name": "email"},
+            },
+            "requested_predicates": {},
+        },
     )
 
 
+def wallet_matches(counts):
+    """Fake holder search returning counts[referent] credentials per referent."""
+
+    async def _search(presentation_request, referents, start, count, extra_query):
+        (referent,) = referents
+        return [
+            {
+                "cred_info": {"referent": "cred-{}".format(index)},
+                "presentation_referents": [referent],
+            }
+            for index in range(start, min(start + count, counts[referent]))
+        ]
+
+    return _search
+
+
 @pytest.mark.asyncio
 async def test_handler(
     context, mock_responder, message, mock_get_pres_ex_record, record, holder
@@ -65,8 +95,82 @@ async def test_handler(
     reply, _reply_args = mock_responder.messages.pop()
     assert isinstance(reply, PresMatchingCredentials)
     assert reply.presentation_exchange_id == TEST_PRES_EX_ID
-    assert reply.matching_credentials == ()
-    assert reply.page.count == message.paginate.limit
+    assert reply.matching_credentials == []
+    assert reply.page.count == 0
+    assert reply.page.more is False
+
+
+@pytest.mark.asyncio
+async def test_handler_pages_per_referent(
+    context, mock_responder, message, mock_get_pres_ex_record, record, holder
+):
+    """Test matches are paged per referent with accurate page metadata."""
+    holder.get_credentials_for_presentation_request_by_referent.side_effect = (
+        wallet_matches({"name_ref": 5, "email_ref": 1})
+    )
+    message.paginate = Paginate(limit=2, offset=2)
+    with mock_get_pres_ex_record(PresRequestApprove, record):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert [
+        (match["cred_info"]["referent"], match["presentation_referents"])
+        for match in reply.matching_credentials
+    ] == [("cred-2", ["name_ref"]), ("cred-3", ["name_ref"])]
+    assert reply.page.count == 2
+    assert reply.page.offset == 2
+    assert reply.page.remaining is None
+    assert reply.page.more is True
+    # One search per referent, fetching one past the page
+    search = holder.get_credentials_for_presentation_request_by_referent
+    assert search.await_count == 2
+    assert {call.args[3] for call in search.await_args_list} == {3}
+
+    message.paginate = Paginate(limit=2, offset=0)
+    with mock_get_pres_ex_record(PresRequestApprove, record):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert [
+        (match["cred_info"]["referent"], match["presentation_referents"])
+        for match in reply.matching_credentials
+    ] == [("cred-0", ["email_ref", "name_ref"]), ("cred-1", ["name_ref"])]
+
+
+@pytest.mark.asyncio
+async def test_handler_referents_extra_query(
+    context, mock_responder, message, mock_get_pres_ex_record, record, holder
+):
+    """Test only requested referents are searched, restricted by extra query."""
+    holder.get_credentials_for_presentation_request_by_referent.return_value = ()
+    message.referents = ["email_ref"]
+    message.extra_query = {"attr::email::value": "alice@example.com"}
+    with mock_get_pres_ex_record(PresRequestApprove, record):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, PresMatchingCredentials)
+    holder.get_credentials_for_presentation_request_by_referent.assert_awaited_once_with(
+        record.presentation_request.serialize(),
+        ("email_ref",),
+        0,
+        11,
+        extra_query={"email_ref": {"attr::email::value": "alice@example.com"}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_handler_x_unknown_referent(
+    context, mock_responder, message, mock_get_pres_ex_record, record, holder
+):
+    message.referents = ["name_ref", "missing_ref"]
+    with mock_get_pres_ex_record(PresRequestApprove, record):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, ProblemReport)
+    assert "missing_ref" in reply.description["en"]
+    holder.get_credentials_for_presentation_request_by_referent.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -105,3 +209,32 @@ async def test_handler_x_pres_invalid_state(
     assert len(mock_responder.messages) == 1
     reply, _reply_args = mock_responder.messages.pop()
     assert isinstance(reply, ProblemReport)
+
+
+@pytest.mark.asyncio
+async def test_search_matching_credentials_bounded(holder):
+    """Test referents are searched at most the configured number at once."""
+    searching = 0
+    most = 0
+    search = wallet_matches({"ref{}".format(index): 1 for index in range(5)})
+
+    async def _search(*args, **kwargs):
+        nonlocal searching, most
+        searching += 1
+        most = max(most, searching)
+        await asyncio.sleep(0)
+        searching -= 1
+        return await search(*args, **kwargs)
+
+    holder.get_credentials_for_presentation_request_by_referent.side_effect = _search
+    presentation_request = {
+        "requested_attributes": {"ref{}".format(index): {} for index in range(5)},
+        "requested_predicates": {},
+    }
+    with mock.patch.object(matching, "MATCHING_SEARCH_CONCURRENCY", 2):
+        matches, page = await matching.search_matching_credentials(
+            holder, presentation_request, Paginate(limit=1)
+        )
+    assert holder.get_credentials_for_presentation_request_by_referent.await_count == 5
+    assert most == 2
+    assert page.count == 1
@@ -0,0 +1,95 @@
+"""Test StoredCredGetList message and handler."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from acapy_plugin_toolbox.decorators.pagination import Paginate
+from acapy_plugin_toolbox.holder.v0_1 import StoredCredGetList, StoredCredList
+from aries_cloudagent.indy.holder import IndyHolder, IndyHolderError
+from aries_cloudagent.indy.sdk.holder import IndySdkHolder
+from aries_cloudagent.protocols.problem_report.v1_0.message import ProblemReport
+from asynctest import mock
+
+TEST_CRED_DEF_ID = "WgWxqztrNooG92RXvxSTWv:3:CL:20:tag"
+
+
+@pytest.fixture
+def message():
+    """Message fixture."""
+    yield StoredCredGetList(
+        paginate=Paginate(limit=2, offset=2), cred_def_id=TEST_CRED_DEF_ID
+    )
+
+
+@pytest.fixture
+def holder():
+    yield mock.MagicMock(IndySdkHolder)
+
+
+@pytest.fixture
+def context(context, message, holder):
+    """Context fixture."""
+    context.message = message
+    context.injector.bind_instance(IndyHolder, holder)
+    yield context
+
+
+def stored_creds(total):
+    """Fake holder search over total stored credentials."""
+
+    async def _get_credentials(start, count, wql):
+        return [
+            {"referent": "cred-{}".format(index), "cred_def_id": TEST_CRED_DEF_ID}
+            for index in range(start, min(start + count, total))
+        ]
+
+    return _get_credentials
+
+
+@pytest.mark.asyncio
+async def test_handler(context, mock_responder, message, holder):
+    """Test the wallet search is filtered and paged by the holder."""
+    holder.get_credentials = mock.CoroutineMock(side_effect=stored_creds(5))
+    await message.handle(context, mock_responder)
+
+    holder.get_credentials.assert_awaited_once_with(
+        2, 3, {"cred_def_id": TEST_CRED_DEF_ID}
+    )
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, StoredCredList)
+    assert reply.serialize()
+    assert [cred["referent"] for cred in reply.results] == ["cred-2", "cred-3"]
+    assert reply.page.count == 2
+    assert reply.page.offset == 2
+    assert reply.page.more is True
+
+    message.paginate = Paginate(limit=2, offset=4)
+    await message.handle(context, mock_responder)
+    reply, _reply_args = mock_responder.messages.pop()
+    assert [cred["referent"] for cred in reply.results] == ["cred-4"]
+    assert reply.page.more is False
+
+
+def test_wql():
+    """Test filters and the extra query are combined."""
+    assert StoredCredGetList().wql() == {}
+    assert StoredCredGetList(
+        issuer_did="WgWxqztrNooG92RXvxSTWv", query={"attr::name::marker": "1"}
+    ).wql() == {
+        "$and": [
+            {"issuer_did": "WgWxqztrNooG92RXvxSTWv"},
+            {"attr::name::marker": "1"},
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_handler_x_holder_error(context, mock_responder, message, holder):
+    holder.get_credentials = mock.CoroutineMock(
+        side_effect=IndyHolderError("Invalid query")
+    )
+    with pytest.raises(IndyHolderError):
+        await message.handle(context, mock_responder)
+
+    reply, _reply_args = mock_responder.messages.pop()
+    assert isinstance(reply, ProblemReport)
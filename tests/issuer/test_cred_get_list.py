@@ -0,0 +1,75 @@
+"""Test issuer CredGetList and PresGetList handlers."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from acapy_plugin_toolbox import issuer as test_module
+from acapy_plugin_toolbox.decorators.pagination import Paginate
+from acapy_plugin_toolbox.issuer import CredGetList, PresGetList
+
+
+@pytest.fixture
+def cred_records(profile):
+    """Factory for saved issuer credential exchange records."""
+
+    async def _cred_records(*connection_ids):
+        records = [
+            test_module.V10CredentialExchange(
+                connection_id=connection_id,
+                thread_id="thread-{}".format(index),
+                role=test_module.V10CredentialExchange.ROLE_ISSUER,
+            )
+            for index, connection_id in enumerate(connection_ids)
+        ]
+        async with profile.session() as session:
+            for record in records:
+                await record.save(session)
+        return records
+
+    yield _cred_records
+
+
+@pytest.mark.asyncio
+async def test_cred_get_list_paginated(context, mock_responder, cred_records):
+    """Credentials are filtered by connection and paginated."""
+    records = await cred_records("conn-1", "conn-2", "conn-1", "conn-1")
+    context.message = CredGetList(connection_id="conn-1", paginate=Paginate(limit=2))
+    await test_module.CredGetListHandler().handle(context, mock_responder)
+
+    cred_list, _ = mock_responder.messages[0]
+    assert [result["credential_exchange_id"] for result in cred_list.results] == [
+        records[0].credential_exchange_id,
+        records[2].credential_exchange_id,
+    ]
+    assert cred_list.page.remaining == 1
+
+
+@pytest.mark.asyncio
+async def test_cred_get_list_by_thread(context, mock_responder, cred_records):
+    """Thread id filters are looked up by tag."""
+    records = await cred_records("conn-1", "conn-2")
+    context.message = CredGetList(thread_id="thread-1")
+    await test_module.CredGetListHandler().handle(context, mock_responder)
+
+    cred_list, _ = mock_responder.messages[0]
+    assert [result["credential_exchange_id"] for result in cred_list.results] == [
+        records[1].credential_exchange_id
+    ]
+    assert cred_list.page is None
+
+
+@pytest.mark.asyncio
+async def test_pres_get_list_paginated(context, mock_responder, profile):
+    """Presentations are filtered and paginated."""
+    async with profile.session() as session:
+        for connection_id in ("conn-1", "conn-1", "conn-2"):
+            await test_module.V10PresentationExchange(
+                connection_id=connection_id,
+                role=test_module.V10PresentationExchange.ROLE_VERIFIER,
+            ).save(session)
+    context.message = PresGetList(connection_id="conn-1", paginate=Paginate(limit=1))
+    await test_module.PresGetListHandler().handle(context, mock_responder)
+
+    pres_list, _ = mock_responder.messages[0]
+    assert len(pres_list.results) == 1
+    assert pres_list.page.remaining == 1
@@ -0,0 +1,117 @@
+"""Test RevokeCreds and PublishRevocations messages and handlers."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.revocation.models.issuer_cred_rev_record import (
+    IssuerCredRevRecord,
+)
+from aries_cloudagent.revocation.models.issuer_rev_reg_record import (
+    IssuerRevRegRecord,
+)
+from asynctest import mock
+
+from acapy_plugin_toolbox import issuer as test_module
+from acapy_plugin_toolbox.issuer import (
+    CredsRevoked,
+    PublishRevocations,
+    RevocationsPublished,
+    RevokeCreds,
+)
+
+CRED_DEF_ID = "WgWxqztrNooG92RXvxSTWv:3:CL:20:tag"
+REV_REG_IDS = [
+    "WgWxqztrNooG92RXvxSTWv:4:{}:CL_ACCUM:{}".format(CRED_DEF_ID, tag)
+    for tag in range(2)
+]
+
+
+@pytest.fixture
+async def rev_regs(profile):
+    """Saved revocation registry and issued credential records."""
+    async with profile.session() as session:
+        for rev_reg_id in REV_REG_IDS:
+            await IssuerRevRegRecord(
+                revoc_reg_id=rev_reg_id, cred_def_id=CRED_DEF_ID, pending_pub=["9"]
+            ).save(session)
+            for cred_rev_id in ("1", "2"):
+                await IssuerCredRevRecord(
+                    cred_ex_id="{}-{}".format(rev_reg_id[-1], cred_rev_id),
+                    rev_reg_id=rev_reg_id,
+                    cred_rev_id=cred_rev_id,
+                    cred_def_id=CRED_DEF_ID,
+                ).save(session)
+
+
+@pytest.fixture
+def publish_pending():
+    """Mock RevocationManager.publish_pending_revocations."""
+    with mock.patch.object(
+        test_module.RevocationManager,
+        "publish_pending_revocations",
+        mock.CoroutineMock(side_effect=lambda rrid2crid: dict(rrid2crid or {})),
+    ) as publish_pending:
+        yield publish_pending
+
+
+async def pending(profile, rev_reg_id):
+    async with profile.session() as session:
+        record = await IssuerRevRegRecord.retrieve_by_revoc_reg_id(session, rev_reg_id)
+    return record.pending_pub
+
+
+@pytest.mark.asyncio
+async def test_revoke_creds(
+    context, mock_responder, profile, rev_regs, publish_pending
+):
+    """Revocations are marked pending and published once per registry."""
+    context.message = RevokeCreds.deserialize(
+        {
+            "@type": RevokeCreds.Meta.message_type,
+            "credential_exchange_ids": ["0-1", "1-2", "unknown"],
+            "credentials": [{"rev_reg_id": REV_REG_IDS[0], "cred_rev_id": "2"}],
+        }
+    )
+    await test_module.RevokeCredsHandler().handle(context, mock_responder)
+
+    revoked, _ = mock_responder.messages[0]
+    assert isinstance(revoked, CredsRevoked)
+    assert {
+        rev_reg_id: sorted(cred_rev_ids)
+        for rev_reg_id, cred_rev_ids in revoked.revoked.items()
+    } == {REV_REG_IDS[0]: ["1", "2"], REV_REG_IDS[1]: ["2"]}
+    assert revoked.published == revoked.revoked
+    assert revoked.failed == [
+        {
+            "credential_exchange_id": "unknown",
+            "error": "No issuer credential revocation record found.",
+        }
+    ]
+    publish_pending.assert_awaited_once()
+    assert await pending(profile, REV_REG_IDS[0]) == ["1", "2", "9"]
+
+
+@pytest.mark.asyncio
+async def test_revoke_creds_deferred(
+    context, mock_responder, profile, rev_regs, publish_pending
+):
+    """Revocations are left pending when not published."""
+    context.message = RevokeCreds(credential_exchange_ids=["1-1"], publish=False)
+    await test_module.RevokeCredsHandler().handle(context, mock_responder)
+
+    revoked, _ = mock_responder.messages[0]
+    assert revoked.revoked == {REV_REG_IDS[1]: ["1"]}
+    assert revoked.published is None
+    publish_pending.assert_not_awaited()
+    assert await pending(profile, REV_REG_IDS[1]) == ["1", "9"]
+
+
+@pytest.mark.asyncio
+async def test_publish_revocations(context, mock_responder, publish_pending):
+    """Pending revocations are published."""
+    context.message = PublishRevocations(rrid2crid={REV_REG_IDS[0]: []})
+    await test_module.PublishRevocationsHandler().handle(context, mock_responder)
+
+    published, _ = mock_responder.messages[0]
+    assert isinstance(published, RevocationsPublished)
+    assert published.rrid2crid == {REV_REG_IDS[0]: []}
+    publish_pending.assert_awaited_once_with({REV_REG_IDS[0]: []})
@@ -0,0 +1,131 @@
+"""Test SendCreds message and handler."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.protocols.issue_credential.v1_0.manager import (
+    CredentialManagerError,
+)
+from asynctest import mock
+
+from acapy_plugin_toolbox import issuer as test_module
+from acapy_plugin_toolbox.issuer import CredsSent, SendCreds
+
+CRED_DEF_ID = "WgWxqztrNooG92RXvxSTWv:3:CL:20:tag"
+PREVIEW = {
+    "@type": "https://didcomm.org/issue-credential/1.0/credential-preview",
+    "attributes": [{"name": "name", "value": "Alice"}],
+}
+
+
+@pytest.fixture
+def connections(profile):
+    """Factory for saved connection records."""
+
+    async def _connections(*states):
+        records = [ConnRecord(state=state) for state in states]
+        async with profile.session() as session:
+            for record in records:
+                await record.save(session)
+        return records
+
+    yield _connections
+
+
+@pytest.fixture
+def prepare_send():
+    """Mock CredentialManager.prepare_send."""
+
+    async def _prepare_send(connection_id, credential_proposal):
+        if credential_proposal.comment == "fail":
+            raise CredentialManagerError("bad preview")
+        if credential_proposal.comment == "crash":
+            raise ValueError("unexpected")
+        record = test_module.V10CredentialExchange(
+            credential_exchange_id="cred-ex-" + connection_id,
+            connection_id=connection_id,
+            state=test_module.V10CredentialExchange.STATE_OFFER_SENT,
+        )
+        return record, mock.MagicMock()
+
+    with mock.patch.object(
+        test_module.CredentialManager,
+        "prepare_send",
+        mock.CoroutineMock(side_effect=_prepare_send),
+    ) as prepare_send:
+        yield prepare_send
+
+
+def send_creds(*specs, **kwargs):
+    return SendCreds.deserialize(
+        {
+            "@type": SendCreds.Meta.message_type,
+            "credentials": [
+                {
+                    "connection_id": connection_id,
+                    "cred_def_id": CRED_DEF_ID,
+                    "credential_proposal": PREVIEW,
+                    "comment": comment,
+                }
+                for connection_id, comment in specs
+            ],
+            **kwargs,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_handler(context, mock_responder, connections, prepare_send):
+    """Offers are sent to ready connections and failures are reported."""
+    ready, failing, not_ready = await connections(
+        ConnRecord.State.COMPLETED.rfc160,
+        ConnRecord.State.COMPLETED.rfc160,
+        ConnRecord.State.INVITATION.rfc160,
+    )
+    missing = "9b6a0a8f-8f2b-4f47-8a3b-5d5f0ffb7a1b"
+    context.message = send_creds(
+        (ready.connection_id, "ok"),
+        (failing.connection_id, "fail"),
+        (not_ready.connection_id, "ok"),
+        (missing, "ok"),
+        (ready.connection_id, "crash"),
+        (ready.connection_id, "ok"),
+    )
+    await test_module.SendCredsHandler().handle(context, mock_responder)
+
+    offers = [message for message, target in mock_responder.messages if target]
+    assert len(offers) == 2
+    creds_sent, _ = mock_responder.messages[-1]
+    assert isinstance(creds_sent, CredsSent)
+    results = {result["index"]: result for result in creds_sent.results}
+    assert sorted(results) == list(range(6))
+    assert results[0]["state"] == "offer_sent"
+    assert results[0]["credential_exchange_id"] == "cred-ex-" + ready.connection_id
+    assert results[1]["error"] == "bad preview"
+    assert results[2]["error"] == "Connection invalid."
+    assert results[3]["error"] == "Connection not found."
+    # Unexpected failures are reported without aborting the batch
+    assert results[4] == {
+        "index": 4,
+        "connection_id": ready.connection_id,
+        "error": "unexpected",
+    }
+    assert results[5]["state"] == "offer_sent"
+    assert prepare_send.await_args.kwargs["credential_proposal"].cred_def_id == (
+        CRED_DEF_ID
+    )
+    assert creds_sent.serialize()["results"]
+
+
+@pytest.mark.asyncio
+async def test_handler_chunked(context, mock_responder, connections, prepare_send):
+    """Results are streamed in chunks."""
+    records = await connections(*[ConnRecord.State.COMPLETED.rfc160] * 3)
+    context.message = send_creds(
+        *[(record.connection_id, "ok") for record in records], **{"~chunk": {"size": 2}}
+    )
+    await test_module.SendCredsHandler().handle(context, mock_responder)
+
+    replies = [message for message, _ in mock_responder.messages[3:]]
+    assert [len(reply.results) for reply in replies] == [2, 1]
+    assert [reply.chunk.last for reply in replies] == [False, True]
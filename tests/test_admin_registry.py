@@ -0,0 +1,198 @@
+"""Test AdminRegistry."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.core.event_bus import Event
+from aries_cloudagent.storage.base import BaseStorage
+from asynctest import mock
+
+from acapy_plugin_toolbox import admin_registry as test_module
+from acapy_plugin_toolbox.admin_registry import AdminRegistry
+
+INVITATION_KEY = "H3C2AVvLMv6gmMNam3uVAjZpfkcJCwDwnZn6z3wXmqPV"
+
+
+@pytest.fixture
+async def admin(profile):
+    """Saved admin connection fixture."""
+    connection = ConnRecord(state=ConnRecord.State.COMPLETED.rfc160)
+    async with profile.session() as session:
+        await connection.save(session)
+        await connection.metadata_set(session, "group", "admin")
+    yield connection
+
+
+@pytest.fixture
+def registry(profile):
+    """Registry fixture."""
+    yield AdminRegistry.for_profile(profile)
+
+
+@pytest.mark.asyncio
+async def test_for_profile_returns_same_registry(profile, registry):
+    assert AdminRegistry.for_profile(profile) is registry
+
+
+@pytest.mark.asyncio
+async def test_admins_loaded_once(profile, registry, admin):
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        with mock.patch.object(
+            storage, "find_all_records", wraps=storage.find_all_records
+        ) as find_all_records:
+            first = await registry.admins(session)
+            second = await registry.admins(session)
+
+    assert [conn.connection_id for conn in first] == [admin.connection_id]
+    assert [conn.connection_id for conn in second] == [admin.connection_id]
+    find_all_records.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_admins_reloaded_after_ttl(profile, registry, admin):
+    registry.ttl = 0
+    async with profile.session() as session:
+        await registry.admins(session)
+        assert not registry.loaded
+        await admin.delete_record(session)
+        assert await registry.admins(session) == []
+
+
+@pytest.mark.asyncio
+async def test_dangling_admin_metadata_removed(profile, registry):
+    connection = ConnRecord(connection_id="deleted")
+    async with profile.session() as session:
+        await connection.metadata_set(session, "group", "admin")
+        assert await registry.admins(session) == []
+        assert await connection.metadata_get(session, "group") is None
+
+
+@pytest.mark.asyncio
+async def test_set_group_and_remove(profile, registry, admin):
+    other = ConnRecord(connection_id="other")
+    async with profile.session() as session:
+        await registry.admins(session)
+        registry.set_group(other, "admin")
+        assert {conn.connection_id for conn in await registry.admins(session)} == {
+            admin.connection_id,
+            "other",
+        }
+        registry.set_group(other, "other")
+        registry.remove(admin.connection_id)
+        assert await registry.admins(session) == []
+
+
+@pytest.mark.asyncio
+async def test_connection_event_updates_admin(profile, event_bus, registry, admin):
+    await test_module.setup(profile.context)
+    async with profile.session() as session:
+        await registry.admins(session)
+
+    admin.their_label = "updated"
+    await event_bus.notify(
+        profile,
+        Event(f"acapy::record::connections::{admin.state}", admin.serialize()),
+    )
+    async with profile.session() as session:
+        (updated,) = await registry.admins(session)
+    assert updated.their_label == "updated"
+
+
+@pytest.mark.asyncio
+async def test_connection_event_discovers_new_admin(profile, event_bus, registry):
+    """Test connections from admin multi-use invitations become admins."""
+    await test_module.setup(profile.context)
+    invitation = ConnRecord(
+        invitation_key=INVITATION_KEY,
+        invitation_mode=ConnRecord.INVITATION_MODE_MULTI,
+        state=ConnRecord.State.INVITATION.rfc160,
+    )
+    async with profile.session() as session:
+        await invitation.save(session)
+        await invitation.metadata_set(session, "group", "admin")
+        await registry.admins(session)
+
+    connection = ConnRecord(
+        connection_id="from-invitation",
+        invitation_key=INVITATION_KEY,
+        state=ConnRecord.State.REQUEST.rfc160,
+    )
+    other = ConnRecord(connection_id="other", invitation_key="other-key")
+    with mock.patch.object(
+        ConnRecord, "metadata_get", mock.CoroutineMock()
+    ) as metadata_get, mock.patch.object(
+        ConnRecord, "deserialize", wraps=ConnRecord.deserialize
+    ) as deserialize:
+        for record in (connection, other):
+            await event_bus.notify(
+                profile,
+                Event(
+                    f"acapy::record::connections::{record.state}", record.serialize()
+                ),
+            )
+    metadata_get.assert_not_called()
+    deserialize.assert_called_once()
+
+    async with profile.session() as session:
+        admins = await registry.admins(session)
+    assert {conn.connection_id for conn in admins} == {
+        invitation.connection_id,
+        "from-invitation",
+    }
+
+
+@pytest.mark.asyncio
+async def test_group_cached(profile, registry, mock_admin_connection):
+    mock_admin_connection.connection_id = "admin-conn"
+    async with profile.session() as session:
+        assert await registry.group(session, mock_admin_connection) == "admin"
+        assert await registry.group(session, mock_admin_connection) == "admin"
+        mock_admin_connection.metadata_get.assert_called_once()
+
+        registry.set_group(mock_admin_connection, "other")
+        assert await registry.group(session, mock_admin_connection) == "other"
+        mock_admin_connection.metadata_get.assert_called_once()
+
+        registry.invalidate("admin-conn")
+        assert await registry.group(session, mock_admin_connection) == "admin"
+        assert mock_admin_connection.metadata_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_group_cache_bounded(profile, registry, mock_admin_connection):
+    registry.MAX_CACHED_ROLES = 2
+    async with profile.session() as session:
+        for connection_id in ("first", "second", "first", "third"):
+            mock_admin_connection.connection_id = connection_id
+            await registry.group(session, mock_admin_connection)
+    # Least recently checked group is evicted, even though it is still fresh
+    assert list(registry._roles) == ["first", "third"]
+    assert mock_admin_connection.metadata_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_connection_event_invalidates_group(
+    profile, event_bus, registry, mock_admin_connection
+):
+    await test_module.setup(profile.context)
+    mock_admin_connection.connection_id = "admin-conn"
+    async with profile.session() as session:
+        await registry.group(session, mock_admin_connection)
+
+    await event_bus.notify(
+        profile,
+        Event("acapy::record::connections::active", {"connection_id": "other"}),
+    )
+    async with profile.session() as session:
+        await registry.group(session, mock_admin_connection)
+    mock_admin_connection.metadata_get.assert_called_once()
+
+    await event_bus.notify(
+        profile,
+        Event("acapy::record::connections::active", {"connection_id": "admin-conn"}),
+    )
+    async with profile.session() as session:
+        await registry.group(session, mock_admin_connection)
+    assert mock_admin_connection.metadata_get.call_count == 2
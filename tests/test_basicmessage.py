@@ -1,7 +1,14 @@
 """Test BasicMessage"""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from aries_cloudagent.connections.models.conn_record import ConnRecord
 from aries_cloudagent.core.event_bus import Event
+from aries_cloudagent.messaging.responder import MockResponder
+from aries_cloudagent.messaging.util import datetime_to_str
+from aries_cloudagent.storage.base import BaseStorage
+from asynctest import mock
 
 from acapy_plugin_toolbox import basicmessage as basicmessage_module
 
@@ -36,3 +43,206 @@ async def test_basic_message_event_handler_notify_admins(
 
         assert send_to_admins.message
         assert send_to_admins.message.message.content == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_get_by_cursor(profile, context):
+    async with profile.session() as session:
+        for index in range(5):
+            await basicmessage_module.BasicMessageRecord(
+                connection_id="conn",
+                content=str(index),
+                sent_time=f"2021-01-01 00:00:0{index}Z",
+            ).save(session)
+        # Messages without a sent time have no position and are skipped
+        await basicmessage_module.BasicMessageRecord(
+            connection_id="conn", content="untimed"
+        ).save(session)
+
+    handler = basicmessage_module.GetHandler()
+    contents = []
+    remaining = []
+    cursor = ""
+    with mock.patch.object(
+        basicmessage_module.BasicMessageRecord,
+        "from_storage",
+        wraps=basicmessage_module.BasicMessageRecord.from_storage,
+    ) as from_storage:
+        while cursor is not None:
+            responder = MockResponder()
+            context.message = basicmessage_module.Get(limit=2, cursor=cursor)
+            await handler.handle(context, responder)
+            ((msg_list, _),) = responder.messages
+            contents.extend(msg.content for msg in msg_list.messages)
+            remaining.append(msg_list.remaining)
+            cursor = msg_list.cursor
+    assert contents == ["4", "3", "2", "1", "0"]
+    assert remaining == [3, 1, 0]
+    assert from_storage.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_get_by_cursor_x_invalid(context):
+    responder = MockResponder()
+    context.message = basicmessage_module.Get(limit=2, cursor="not a cursor")
+    with pytest.raises(basicmessage_module.PaginationError):
+        await basicmessage_module.GetHandler().handle(context, responder)
+    ((report, _),) = responder.messages
+    assert isinstance(report, basicmessage_module.ProblemReport)
+
+
+def iso_days_ago(days: float) -> str:
+    """Return an ISO 8601 timestamp days ago."""
+    return datetime_to_str(datetime.now(timezone.utc) - timedelta(days=days))
+
+
+@pytest.fixture
+async def history(profile):
+    """Basic messages sent over several years, newest first."""
+    records = [
+        basicmessage_module.BasicMessageRecord(
+            connection_id="conn", content=str(days), sent_time=iso_days_ago(days)
+        )
+        for days in (0, 0.5, 3, 30, 400, 2000)
+    ]
+    async with profile.session() as session:
+        for record in reversed(records):
+            await record.save(session)
+    yield records
+
+
+@pytest.mark.asyncio
+async def test_query_newest(profile, history):
+    async with profile.session() as session:
+        msgs, remaining = await basicmessage_module.BasicMessageRecord.query_newest(
+            session, {"connection_id": "conn"}, limit=2, offset=1
+        )
+        assert [msg.content for msg in msgs] == ["0.5", "3"]
+        assert remaining == 3
+
+        msgs, remaining = await basicmessage_module.BasicMessageRecord.query_newest(
+            session, {"connection_id": "conn"}
+        )
+        assert [msg.content for msg in msgs] == [msg.content for msg in history]
+        assert remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_query_newest_loads_recent_window_only(profile, history):
+    with mock.patch.object(
+        basicmessage_module.BasicMessageRecord,
+        "from_storage",
+        wraps=basicmessage_module.BasicMessageRecord.from_storage,
+    ) as from_storage, mock.patch.object(
+        basicmessage_module, "count_records", mock.CoroutineMock(return_value=4)
+    ) as count_records:
+        async with profile.session() as session:
+            msgs, remaining = await (
+                basicmessage_module.BasicMessageRecord.query_newest(session, limit=2)
+            )
+    assert [msg.content for msg in msgs] == ["0", "0.5"]
+    assert remaining == 4
+    assert from_storage.call_count == 2
+    count_records.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_newest(profile, context, history):
+    responder = MockResponder()
+    context.message = basicmessage_module.Get(connection_id="conn", limit=4)
+    await basicmessage_module.GetHandler().handle(context, responder)
+    ((msg_list, _),) = responder.messages
+    assert [msg.content for msg in msg_list.messages] == ["0", "0.5", "3", "30"]
+    assert (msg_list.count, msg_list.remaining) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_migrate_sent_ms_tags(profile, history):
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        for record in history:
+            stored = await storage.get_record(
+                basicmessage_module.BasicMessageRecord.RECORD_TYPE, record.record_id
+            )
+            tags = dict(stored.tags)
+            del tags["~sent_ms"]
+            await storage.update_record(stored, stored.value, tags)
+
+        await basicmessage_module.migrate_sent_ms_tags(session)
+        msgs, _ = await basicmessage_module.BasicMessageRecord.query_newest(
+            session, limit=2
+        )
+        assert [msg.content for msg in msgs] == ["0", "0.5"]
+
+        with mock.patch.object(
+            basicmessage_module, "scan_records", mock.MagicMock()
+        ) as scan_records:
+            await basicmessage_module.migrate_sent_ms_tags(session)
+        scan_records.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sent_ms_tags_migrated_on_first_use(profile, history):
+    """Profiles not seen at startup are migrated when first queried."""
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        for record in history:
+            stored = await storage.get_record(
+                basicmessage_module.BasicMessageRecord.RECORD_TYPE, record.record_id
+            )
+            tags = dict(stored.tags)
+            del tags["~sent_ms"]
+            await storage.update_record(stored, stored.value, tags)
+
+        msgs, _ = await basicmessage_module.BasicMessageRecord.query_newest(
+            session, limit=2
+        )
+        assert [msg.content for msg in msgs] == ["0", "0.5"]
+
+        with mock.patch.object(
+            basicmessage_module, "migrate_sent_ms_tags", mock.CoroutineMock()
+        ) as migrate:
+            await basicmessage_module.BasicMessageRecord.query_newest(session, limit=2)
+        migrate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_before_date(profile, context, history):
+    responder = MockResponder()
+    context.message = basicmessage_module.Delete(
+        connection_id="conn", before_date=iso_days_ago(10), return_deleted=True
+    )
+    with mock.patch.object(
+        basicmessage_module.BasicMessageRecord, "delete_record"
+    ) as delete_record:
+        await basicmessage_module.DeleteHandler().handle(context, responder)
+    delete_record.assert_not_called()
+    ((deleted, _),) = responder.messages
+    assert {msg.content for msg in deleted.deleted} == {"30", "400", "2000"}
+
+    async with profile.session() as session:
+        msgs, _ = await basicmessage_module.BasicMessageRecord.query_newest(session)
+    assert [msg.content for msg in msgs] == ["0", "0.5", "3"]
+
+
+@pytest.mark.asyncio
+async def test_retention(profile, history):
+    async with profile.session() as session:
+        connection = ConnRecord(connection_id="conn", new_with_id=True)
+        await connection.save(session)
+        await basicmessage_module.BasicMessageRecord(
+            connection_id="other", content="other", sent_time=iso_days_ago(1)
+        ).save(session)
+
+    await basicmessage_module.MessageRetention(
+        max_age=365 * 24 * 60 * 60, max_count=2
+    ).enforce(profile)
+    async with profile.session() as session:
+        msgs, _ = await basicmessage_module.BasicMessageRecord.query_newest(session)
+    assert [msg.content for msg in msgs] == ["0", "0.5", "other"]
+
+
+def test_retention_disabled():
+    retention = basicmessage_module.MessageRetention(max_age=0, max_count=0)
+    retention.start(mock.MagicMock())
+    assert retention.task is None
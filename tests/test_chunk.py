@@ -0,0 +1,44 @@
+"""Test chunk decorator."""
+
+import pytest
+from aries_cloudagent.messaging.responder import MockResponder
+
+from acapy_plugin_toolbox.connections import GetList, List
+from acapy_plugin_toolbox.decorators import chunk as chunk_module
+from acapy_plugin_toolbox.decorators.chunk import Chunk, send_chunks
+
+
+async def results(count):
+    """Yield count results."""
+    for index in range(count):
+        yield {"connection_id": str(index)}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count, sizes", [(5, [2, 2, 1]), (4, [2, 2, 0]), (0, [0])])
+async def test_send_chunks(count, sizes):
+    request = GetList(chunk=Chunk(size=2))
+    responder = MockResponder()
+    await send_chunks(
+        responder, request, results(count), lambda chunk: List(connections=chunk)
+    )
+    replies = [message for message, _ in responder.messages]
+    assert [len(reply.connections) for reply in replies] == sizes
+    assert [reply.chunk.seq for reply in replies] == list(range(len(sizes)))
+    assert [reply.chunk.last for reply in replies] == [False] * (len(sizes) - 1) + [
+        True
+    ]
+    assert all(reply._thread_id == request._thread_id for reply in replies)
+
+
+@pytest.mark.asyncio
+async def test_send_chunks_default_size(monkeypatch):
+    monkeypatch.setattr(chunk_module, "CHUNK_SIZE", 3)
+    request = GetList(chunk=Chunk())
+    responder = MockResponder()
+    await send_chunks(
+        responder, request, results(4), lambda chunk: List(connections=chunk)
+    )
+    replies = [message for message, _ in responder.messages]
+    assert [len(reply.connections) for reply in replies] == [3, 1]
+    assert replies[0].chunk.size == 3
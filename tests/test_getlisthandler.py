@@ -40,3 +40,29 @@ async def test_getlisthandler(context, responder):
         await handler.handle(context, responder)
         conn_list, _ = responder.messages[0]
         assert isinstance(conn_list, con.List)
+
+
+@pytest.mark.asyncio
+async def test_getlisthandler_chunked(profile, context, responder):
+    async with profile.session() as session:
+        for state in ("active", "active", "active", "invitation"):
+            await ConnRecord(state=state).save(session)
+
+    context.message = con.GetList(chunk=con.Chunk(size=2))
+    await con.GetListHandler().handle(context, responder)
+    replies = [message for message, _ in responder.messages]
+    assert [len(reply.connections) for reply in replies] == [2, 1]
+    assert replies[-1].chunk.last
+
+
+@pytest.mark.asyncio
+async def test_getlisthandler_without_raw(profile, context, responder):
+    async with profile.session() as session:
+        await ConnRecord(state="active").save(session)
+
+    context.message = con.GetList(include_raw=False)
+    await con.GetListHandler().handle(context, responder)
+    ((conn_list, _),) = responder.messages
+    (connection,) = conn_list.connections
+    assert connection.raw_repr is None
+    assert "raw_repr" not in connection.serialize()
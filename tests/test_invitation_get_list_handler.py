@@ -0,0 +1,84 @@
+"""Test InvitationGetListHandler."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.protocols.connections.v1_0.messages.connection_invitation import (
+    ConnectionInvitation,
+)
+from aries_cloudagent.storage.base import BaseStorage
+from asynctest import mock
+
+import acapy_plugin_toolbox.invitations as inv
+
+
+@pytest.fixture
+async def invitations(profile):
+    """Saved invitation connections fixture."""
+    connections = []
+    async with profile.session() as session:
+        for index in range(3):
+            connection = ConnRecord(
+                state=ConnRecord.State.INVITATION.rfc160,
+                invitation_mode=ConnRecord.INVITATION_MODE_MULTI,
+                alias=f"invitation {index}",
+            )
+            await connection.save(session)
+            await connection.attach_invitation(
+                session,
+                ConnectionInvitation(
+                    label=f"label {index}",
+                    recipient_keys=["3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"],
+                    endpoint="http://localhost:3000",
+                ),
+            )
+            await connection.metadata_set(session, "group", f"group {index}")
+            connections.append(connection)
+        await ConnRecord(state=ConnRecord.State.COMPLETED.rfc160).save(session)
+    yield connections
+
+
+@pytest.mark.asyncio
+async def test_invitation_get_list(profile, context, mock_responder, invitations):
+    context.message = inv.InvitationGetList()
+    with mock.patch.object(
+        ConnRecord, "retrieve_invitation"
+    ) as retrieve_invitation, mock.patch.object(
+        ConnRecord, "metadata_get"
+    ) as metadata_get:
+        await inv.InvitationGetListHandler().handle(context, mock_responder)
+    retrieve_invitation.assert_not_called()
+    metadata_get.assert_not_called()
+
+    ((invitation_list, _),) = mock_responder.messages
+    results = sorted(invitation_list.results, key=lambda invite: invite["alias"])
+    assert [invite["id"] for invite in results] == [
+        connection.connection_id for connection in invitations
+    ]
+    assert [invite["group"] for invite in results] == [
+        "group 0",
+        "group 1",
+        "group 2",
+    ]
+    assert all(invite["multi_use"] for invite in results)
+    assert all(invite["invitation_type"] == inv.CONN_INVITE_TYPE for invite in results)
+    assert results[0]["invitation_url"].startswith("http://localhost:3000?c_i=")
+    assert invitation_list.serialize()
+
+
+@pytest.mark.asyncio
+async def test_invitation_get_list_batches_queries(
+    profile, context, mock_responder, invitations
+):
+    context.message = inv.InvitationGetList()
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+    with mock.patch.object(inv, "INVITATION_BATCH_SIZE", 2), mock.patch.object(
+        type(storage), "find_all_records", wraps=storage.find_all_records
+    ) as find_all_records:
+        await inv.InvitationGetListHandler().handle(context, mock_responder)
+    ((invitation_list, _),) = mock_responder.messages
+    assert len(invitation_list.results) == 3
+    # Invitations and groups of each batch of two
+    assert find_all_records.call_count == 4
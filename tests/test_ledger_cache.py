@@ -0,0 +1,85 @@
+"""Test LedgerCache."""
+import asyncio
+
+import pytest
+from aries_cloudagent.ledger.base import BaseLedger
+from aries_cloudagent.ledger.error import LedgerError
+from asynctest import mock
+
+from acapy_plugin_toolbox.ledger_cache import LedgerCache
+
+
+@pytest.fixture
+def ledger():
+    """Mock ledger returning schemas after yielding to the event loop."""
+    ledger = mock.MagicMock(spec=BaseLedger)
+    ledger.__aenter__ = mock.CoroutineMock(return_value=ledger)
+    ledger.__aexit__ = mock.CoroutineMock(return_value=None)
+
+    async def get_schema(schema_id):
+        await asyncio.sleep(0)
+        if schema_id == "error":
+            raise LedgerError("unreachable")
+        return None if schema_id == "missing" else {"id": schema_id}
+
+    ledger.get_schema = mock.CoroutineMock(side_effect=get_schema)
+    yield ledger
+
+
+def test_for_profile(profile):
+    """Cache is bound to the profile once."""
+    assert LedgerCache.for_profile(profile) is LedgerCache.for_profile(profile)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesced(ledger):
+    """Concurrent lookups share a ledger request and later lookups are hits."""
+    cache = LedgerCache()
+    results = await asyncio.gather(*(cache.get_schema(ledger, "1") for _ in range(5)))
+    assert results == [{"id": "1"}] * 5
+    assert await cache.get_schema(ledger, "1") == {"id": "1"}
+    ledger.get_schema.assert_awaited_once_with("1")
+
+
+@pytest.mark.asyncio
+async def test_negative_caching(ledger):
+    """Missing artifacts are remembered for negative_ttl seconds."""
+    cache = LedgerCache(negative_ttl=60)
+    assert await cache.get_schema(ledger, "missing") is None
+    assert await cache.get_schema(ledger, "missing") is None
+    assert ledger.get_schema.await_count == 1
+
+    cache.negative_ttl = 0
+    cache.clear()
+    assert await cache.get_schema(ledger, "missing") is None
+    assert await cache.get_schema(ledger, "missing") is None
+    assert ledger.get_schema.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_not_cached(ledger):
+    """Errors are raised to every waiter and retried on the next lookup."""
+    cache = LedgerCache()
+    results = await asyncio.gather(
+        cache.get_schema(ledger, "error"),
+        cache.get_schema(ledger, "error"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, LedgerError) for result in results)
+    with pytest.raises(LedgerError):
+        await cache.get_schema(ledger, "error")
+    assert ledger.get_schema.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(ledger):
+    """Least recently used artifacts are evicted beyond max_size."""
+    cache = LedgerCache(max_size=2)
+    await cache.get_schema(ledger, "1")
+    await cache.get_schema(ledger, "2")
+    await cache.get_schema(ledger, "1")
+    await cache.get_schema(ledger, "3")
+    await cache.get_schema(ledger, "1")
+    assert ledger.get_schema.await_count == 3
+    await cache.get_schema(ledger, "2")
+    assert ledger.get_schema.await_count == 4
@@ -0,0 +1,205 @@
+"""Test reconciliation of schema and credential definition records."""
+import asyncio
+
+import pytest
+from aries_cloudagent.core.event_bus import Event
+from aries_cloudagent.ledger.base import BaseLedger
+from aries_cloudagent.ledger.error import LedgerError
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.record import StorageRecord
+from asynctest import mock
+
+from acapy_plugin_toolbox import credential_definitions, schemas
+from acapy_plugin_toolbox.ledger_cache import LedgerCache
+
+SCHEMA_IDS = ["WgWxqztrNooG92RXvxSTWv:2:schema-{}:1.0".format(i) for i in range(3)]
+CRED_DEF_IDS = ["WgWxqztrNooG92RXvxSTWv:3:CL:{}:default".format(i) for i in range(3)]
+
+
+def ledger_schema(schema_id: str):
+    return {
+        "id": schema_id,
+        "name": schema_id.split(":")[2],
+        "version": "1.0",
+        "attrNames": ["name", "age"],
+    }
+
+
+def ledger_cred_def(cred_def_id: str):
+    return {
+        "id": cred_def_id,
+        "value": {"primary": {"r": {"master_secret": "1", "name": "2", "age": "3"}}},
+    }
+
+
+@pytest.fixture
+def ledger(profile):
+    """Mock ledger bound on profile."""
+    ledger = mock.MagicMock(spec=BaseLedger)
+    ledger.__aenter__ = mock.CoroutineMock(return_value=ledger)
+    ledger.__aexit__ = mock.CoroutineMock(return_value=None)
+    profile.context.injector.bind_instance(BaseLedger, ledger)
+    yield ledger
+
+
+async def save_sent(profile, record_type, tags_list):
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        for tags in tags_list:
+            await storage.add_record(
+                StorageRecord(record_type, tags[next(iter(tags))], tags)
+            )
+
+
+@pytest.mark.asyncio
+async def test_reconcile_schemas(profile, ledger):
+    """Unknown schemas are fetched, failures skipped and the rest saved."""
+
+    async def get_schema(schema_id):
+        if schema_id == SCHEMA_IDS[1]:
+            raise LedgerError("unreachable")
+        return ledger_schema(schema_id)
+
+    ledger.get_schema = mock.CoroutineMock(side_effect=get_schema)
+    await save_sent(
+        profile,
+        schemas.SCHEMA_SENT_RECORD_TYPE,
+        [{"schema_id": schema_id} for schema_id in SCHEMA_IDS],
+    )
+    await schemas.reconcile_schemas(profile)
+    assert ledger.get_schema.await_count == 3
+
+    async with profile.session() as session:
+        records = await schemas.SchemaRecord.query(session)
+    assert sorted(record.schema_id for record in records) == [
+        SCHEMA_IDS[0],
+        SCHEMA_IDS[2],
+    ]
+
+    await schemas.reconcile_schemas(profile)
+    assert ledger.get_schema.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_reconcile_cred_defs(profile, ledger):
+    """Unknown cred defs are fetched with schema ids from the sent records."""
+    ledger.get_credential_definition = mock.CoroutineMock(
+        side_effect=lambda cred_def_id: None
+        if cred_def_id == CRED_DEF_IDS[2]
+        else ledger_cred_def(cred_def_id)
+    )
+    await save_sent(
+        profile,
+        credential_definitions.CRED_DEF_SENT_RECORD_TYPE,
+        [
+            {"cred_def_id": cred_def_id, "schema_id": schema_id}
+            for cred_def_id, schema_id in zip(CRED_DEF_IDS, SCHEMA_IDS)
+        ],
+    )
+    await credential_definitions.reconcile_cred_defs(profile)
+
+    async with profile.session() as session:
+        records = await credential_definitions.CredDefRecord.query(session)
+    records.sort(key=lambda record: record.cred_def_id)
+    assert [(record.cred_def_id, record.schema_id) for record in records] == list(
+        zip(CRED_DEF_IDS[:2], SCHEMA_IDS[:2])
+    )
+    assert sorted(records[0].attributes) == ["age", "name"]
+
+
+@pytest.mark.asyncio
+async def test_schema_event_saves_record(profile, event_bus, ledger):
+    """Schemas written through the admin API are recorded without the ledger."""
+    await schemas.setup(profile.context)
+    ledger.get_schema = mock.CoroutineMock()
+    topic = "acapy::SCHEMA::" + SCHEMA_IDS[0]
+    payload = {
+        "context": {
+            "schema_id": SCHEMA_IDS[0],
+            "schema_name": "schema-0",
+            "schema_version": "1.0",
+            "attributes": ["name", "age"],
+        }
+    }
+    await event_bus.notify(profile, Event(topic, payload))
+    await event_bus.notify(profile, Event(topic, payload))
+
+    async with profile.session() as session:
+        records = await schemas.SchemaRecord.query(session)
+    assert [record.schema_id for record in records] == [SCHEMA_IDS[0]]
+    ledger.get_schema.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cred_def_event_fetches_in_background(profile, event_bus, ledger):
+    """Cred def events do not wait on the ledger fetch of the attributes."""
+    await credential_definitions.setup(profile.context)
+    released = asyncio.Event()
+
+    async def get_credential_definition(cred_def_id):
+        await released.wait()
+        return ledger_cred_def(cred_def_id)
+
+    ledger.get_credential_definition = mock.CoroutineMock(
+        side_effect=get_credential_definition
+    )
+    topic = "acapy::CRED_DEF::" + CRED_DEF_IDS[0]
+    payload = {"context": {"cred_def_id": CRED_DEF_IDS[0], "schema_id": SCHEMA_IDS[0]}}
+    await asyncio.wait_for(event_bus.notify(profile, Event(topic, payload)), 1)
+
+    released.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    async with profile.session() as session:
+        records = await credential_definitions.CredDefRecord.query(session)
+    assert [(record.cred_def_id, record.schema_id) for record in records] == [
+        (CRED_DEF_IDS[0], SCHEMA_IDS[0])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_handlers_read_local_records(context, mock_responder, ledger):
+    """List handlers do not touch the ledger."""
+    async with context.profile.session() as session:
+        await schemas.SchemaRecord(schema_id=SCHEMA_IDS[0]).save(session)
+        await credential_definitions.CredDefRecord(cred_def_id=CRED_DEF_IDS[0]).save(
+            session
+        )
+
+    await schemas.SchemaGetListHandler().handle(context, mock_responder)
+    await credential_definitions.CredDefGetListHandler().handle(context, mock_responder)
+    (schema_list, _), (cred_def_list, _) = mock_responder.messages
+    assert [record.schema_id for record in schema_list.results] == SCHEMA_IDS[:1]
+    assert [record.cred_def_id for record in cred_def_list.results] == CRED_DEF_IDS[:1]
+    assert not ledger.method_calls
+
+
+@pytest.mark.asyncio
+async def test_warm_ledger_cache(profile, ledger, monkeypatch):
+    """Self-authored cred defs and their schemas are loaded into the cache."""
+    ledger.get_credential_definition = mock.CoroutineMock(side_effect=ledger_cred_def)
+    ledger.credential_definition_id2schema_id = mock.CoroutineMock(
+        side_effect=lambda cred_def_id: SCHEMA_IDS[CRED_DEF_IDS.index(cred_def_id)]
+    )
+    ledger.get_schema = mock.CoroutineMock(side_effect=ledger_schema)
+    async with profile.session() as session:
+        for cred_def_id, author in zip(CRED_DEF_IDS, ["self", "self", "other"]):
+            await credential_definitions.CredDefRecord(
+                cred_def_id=cred_def_id, author=author
+            ).save(session)
+
+    monkeypatch.setattr(credential_definitions, "LEDGER_CACHE_WARM", "all")
+    await credential_definitions.warm_ledger_cache(profile)
+    assert sorted(call.args[0] for call in ledger.get_schema.await_args_list) == sorted(
+        SCHEMA_IDS[:2]
+    )
+
+    cache = LedgerCache.for_profile(profile)
+    assert await cache.get_schema(ledger, SCHEMA_IDS[0]) == ledger_schema(SCHEMA_IDS[0])
+    assert ledger.get_schema.await_count == 2
+
+    monkeypatch.setattr(
+        credential_definitions, "LEDGER_CACHE_WARM", f" {CRED_DEF_IDS[2]} ,"
+    )
+    await credential_definitions.warm_ledger_cache(profile)
+    ledger.get_schema.assert_awaited_with(SCHEMA_IDS[2])
@@ -0,0 +1,171 @@
+"""Test pagination decorators."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.storage.base import BaseStorage
+from asynctest import mock
+
+from acapy_plugin_toolbox.basicmessage import BasicMessageRecord
+from acapy_plugin_toolbox.decorators.pagination import (
+    Paginate,
+    PaginationError,
+    encode_cursor,
+)
+
+
+@pytest.fixture
+async def records(profile):
+    """Saved records fixture."""
+    records = [
+        BasicMessageRecord(connection_id="conn", content=str(index))
+        for index in range(25)
+    ]
+    async with profile.session() as session:
+        for record in records:
+            await record.save(session)
+    yield records
+
+
+def test_apply():
+    items, page = Paginate(limit=10, offset=5).apply(list(range(30)))
+    assert items == list(range(5, 15))
+    assert (page.count, page.offset, page.remaining) == (10, 5, 15)
+    assert page.more is True
+
+    items, page = Paginate(limit=10, offset=25).apply(list(range(30)))
+    assert items == list(range(25, 30))
+    assert page.remaining == 0
+    assert page.more is False
+
+
+@pytest.mark.asyncio
+async def test_query(profile, records):
+    async with profile.session() as session:
+        results, page = await Paginate(limit=10, offset=20).query(
+            session, BasicMessageRecord, {"connection_id": "conn"}
+        )
+    assert [record.content for record in results] == [
+        record.content for record in records[20:]
+    ]
+    assert (page.count, page.offset, page.remaining) == (5, 20, 0)
+
+
+@pytest.mark.asyncio
+async def test_query_no_limit(profile, records):
+    async with profile.session() as session:
+        results, page = await Paginate(offset=5).query(session, BasicMessageRecord)
+    assert len(results) == 20
+    assert (page.count, page.remaining) == (20, 0)
+
+
+@pytest.mark.asyncio
+async def test_query_post_filter(profile, records):
+    async with profile.session() as session:
+        results, page = await Paginate(limit=2).query(
+            session,
+            BasicMessageRecord,
+            post_filter_positive={"content": ["3", "13", "23"]},
+            alt=True,
+        )
+    assert [record.content for record in results] == ["3", "13"]
+    assert page.remaining == 1
+
+
+@pytest.mark.asyncio
+async def test_query_deserializes_page_only(profile, records):
+    with mock.patch.object(
+        BasicMessageRecord, "from_storage", wraps=BasicMessageRecord.from_storage
+    ) as from_storage:
+        async with profile.session() as session:
+            results, page = await Paginate(limit=3, offset=4).query(
+                session, BasicMessageRecord
+            )
+    assert len(results) == 3
+    assert page.remaining == 18
+    assert from_storage.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_query_fetches_in_pages(profile, records):
+    async with profile.session() as session:
+        storage = session.inject(BaseStorage)
+        with mock.patch.object(
+            storage, "find_all_records", mock.CoroutineMock()
+        ) as find_all_records:
+            results, _ = await Paginate(limit=1).query(session, BasicMessageRecord)
+    assert len(results) == 1
+    find_all_records.assert_not_called()
+
+
+async def walk_cursor(profile, **kwargs):
+    """Return the contents of all records paged through by cursor."""
+    contents = []
+    cursor = ""
+    while cursor is not None:
+        async with profile.session() as session:
+            results, page = await Paginate(limit=10, cursor=cursor).query(
+                session, BasicMessageRecord, **kwargs
+            )
+        contents.extend(record.content for record in results)
+        cursor = page.cursor
+    return contents
+
+
+@pytest.mark.asyncio
+async def test_query_cursor(profile, records):
+    expected = [
+        record.content
+        for record in sorted(
+            records, key=lambda record: (record.created_at, record.record_id)
+        )
+    ]
+    assert await walk_cursor(profile) == expected
+    assert await walk_cursor(profile, descending=True) == expected[::-1]
+
+
+@pytest.mark.asyncio
+async def test_query_cursor_stable_under_inserts(profile, records):
+    async with profile.session() as session:
+        first, page = await Paginate(limit=10, cursor="").query(
+            session, BasicMessageRecord
+        )
+        assert (page.count, page.remaining) == (10, 15)
+        # Records sorting before the cursor do not shift the next page
+        early = BasicMessageRecord(content="early")
+        await early.save(session)
+        storage = session.inject(BaseStorage)
+        stored = await storage.get_record(
+            BasicMessageRecord.RECORD_TYPE, early.record_id
+        )
+        await storage.update_record(
+            stored,
+            stored.value.replace(early.created_at, "2000-01-01 00:00:00.000000Z"),
+            stored.tags,
+        )
+        second, page = await Paginate(limit=10, cursor=page.cursor).query(
+            session, BasicMessageRecord
+        )
+    assert (page.count, page.remaining) == (10, 5)
+    assert not {record.record_id for record in first} & {
+        record.record_id for record in second
+    }
+
+
+@pytest.mark.asyncio
+async def test_query_invalid_cursor(profile, records):
+    async with profile.session() as session:
+        with pytest.raises(PaginationError):
+            await Paginate(limit=10, cursor="not a cursor").query(
+                session, BasicMessageRecord
+            )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("key", [{"a": 1}, ["a"], 1, None])
+async def test_query_cursor_x_key_type(profile, records, key):
+    async with profile.session() as session:
+        with pytest.raises(PaginationError):
+            await Paginate(limit=10, cursor=encode_cursor((key, "id"))).query(
+                session, BasicMessageRecord
+            )
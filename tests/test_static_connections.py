@@ -0,0 +1,169 @@
+"""Test static connections protocol."""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+from aries_cloudagent.connections.models.conn_record import ConnRecord
+from aries_cloudagent.messaging.models.base import BaseModelError
+from aries_cloudagent.messaging.responder import MockResponder
+from aries_cloudagent.protocols.connections.v1_0.manager import ConnectionManager
+from aries_cloudagent.storage.base import BaseStorage
+from aries_cloudagent.storage.error import StorageError
+from aries_cloudagent.wallet.base import BaseWallet
+from aries_cloudagent.wallet.util import bytes_to_b58
+from asynctest import mock
+
+from acapy_plugin_toolbox import static_connections as test_module
+from acapy_plugin_toolbox.decorators.chunk import Chunk
+from acapy_plugin_toolbox.decorators.pagination import Paginate
+
+THEIR_KEY = "3Dn1SJNPaCXcvvJvSbsFWP2xaCjMom3can8CQNhWrTRx"
+
+
+def peers(count):
+    """Return static peer infos."""
+    return [
+        {
+            "label": f"device {index}",
+            "static_did": bytes_to_b58((index + 1).to_bytes(16, "big")),
+            "static_key": THEIR_KEY,
+            "static_endpoint": "http://device",
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+async def static_connections(profile):
+    """Saved static connections fixture; yields the created connections."""
+    async with profile.session() as session:
+        yield await test_module.create_static_connections(session, peers(3))
+
+
+@pytest.mark.asyncio
+async def test_get_list(context, static_connections):
+    responder = MockResponder()
+    context.message = test_module.StaticConnectionGetList()
+    with mock.patch.object(BaseWallet, "get_local_did") as get_local_did:
+        await test_module.StaticConnectionGetListHandler().handle(context, responder)
+    get_local_did.assert_not_called()
+
+    ((static_list, _),) = responder.messages
+    results = sorted(
+        static_list.results, key=lambda result: result["their_info"]["label"]
+    )
+    assert [result["their_info"]["label"] for result in results] == [
+        "device 0",
+        "device 1",
+        "device 2",
+    ]
+    assert all(result["their_info"]["vk"] == THEIR_KEY for result in results)
+    assert [result["my_info"]["vk"] for result in results] == [
+        created["key"] for created in static_connections
+    ]
+    assert static_list.page is None
+
+
+@pytest.mark.asyncio
+async def test_get_list_paginated(context, static_connections):
+    responder = MockResponder()
+    context.message = test_module.StaticConnectionGetList(paginate=Paginate(limit=2))
+    await test_module.StaticConnectionGetListHandler().handle(context, responder)
+    ((static_list, _),) = responder.messages
+    assert len(static_list.results) == 2
+    assert (static_list.page.count, static_list.page.remaining) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_create_static_connection(context):
+    responder = MockResponder()
+    context.message = test_module.CreateStaticConnection(**peers(1)[0])
+    await test_module.CreateStaticConnectionHandler().handle(context, responder)
+    ((info, _),) = responder.messages
+    assert isinstance(info, test_module.StaticConnectionInfo)
+
+    async with context.profile.session() as session:
+        (connection,) = await ConnRecord.query(session)
+    assert connection.my_did == info.did
+    assert connection.state == ConnRecord.State.COMPLETED.rfc160
+    targets = await ConnectionManager(context.profile).fetch_connection_targets(
+        connection
+    )
+    assert targets[0].recipient_keys == [THEIR_KEY]
+    assert targets[0].sender_key == info.key
+
+
+@pytest.mark.asyncio
+async def test_create_static_connections_chunked(context):
+    responder = MockResponder()
+    context.message = test_module.CreateStaticConnections(
+        peers=peers(5), chunk=Chunk(size=2)
+    )
+    with mock.patch.object(test_module, "STATIC_CREATE_BATCH_SIZE", 3):
+        await test_module.CreateStaticConnectionsHandler().handle(context, responder)
+    replies = [message for message, _ in responder.messages]
+    assert [len(reply.results) for reply in replies] == [2, 2, 1]
+    assert replies[-1].chunk.last
+    assert [result["their_did"] for reply in replies for result in reply.results] == [
+        peer["static_did"] for peer in peers(5)
+    ]
+
+    context.message = test_module.StaticConnectionGetList()
+    responder = MockResponder()
+    await test_module.StaticConnectionGetListHandler().handle(context, responder)
+    ((static_list, _),) = responder.messages
+    assert len(static_list.results) == 5
+
+
+@pytest.mark.asyncio
+async def test_create_static_connections_x_failed_batch(context):
+    """Committed batches are returned along with the peers of failed ones."""
+    create = test_module.create_static_connections
+    failing_did = peers(5)[2]["static_did"]
+
+    async def _create(session, batch, endpoint=None):
+        if any(peer["static_did"] == failing_did for peer in batch):
+            raise StorageError("Storage down")
+        return await create(session, batch, endpoint)
+
+    responder = MockResponder()
+    context.message = test_module.CreateStaticConnections(peers=peers(5))
+    with mock.patch.object(
+        test_module, "STATIC_CREATE_BATCH_SIZE", 2
+    ), mock.patch.object(test_module, "create_static_connections", _create):
+        await test_module.CreateStaticConnectionsHandler().handle(context, responder)
+    ((created, _),) = responder.messages
+    assert created.serialize()
+    assert [result["their_did"] for result in created.results] == [
+        peer["static_did"] for peer in peers(5)[:2] + peers(5)[4:]
+    ]
+    assert created.failed == [
+        {"static_did": peer["static_did"], "error": "Storage down"}
+        for peer in peers(5)[2:4]
+    ]
+    async with context.profile.session() as session:
+        assert len(await ConnRecord.query(session)) == 3
+
+
+def test_create_static_connections_x_unknown_role():
+    peer = {**peers(1)[0], "role": "observer"}
+    with pytest.raises(BaseModelError):
+        test_module.CreateStaticConnection.deserialize(peer)
+    with pytest.raises(BaseModelError):
+        test_module.CreateStaticConnections.deserialize({"peers": [peer]})
+    assert test_module.CreateStaticConnections.deserialize(
+        {"peers": [{**peer, "role": "inviter"}]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_static_connections_replaces_did_doc(context):
+    async with context.profile.session() as session:
+        await test_module.create_static_connections(session, peers(1) * 2)
+        (did_doc,) = await session.inject(BaseStorage).find_all_records(
+            "did_doc", {"did": peers(1)[0]["static_did"]}
+        )
+        (did_key,) = await session.inject(BaseStorage).find_all_records(
+            "did_key", {"did": peers(1)[0]["static_did"]}
+        )
+    assert did_key.value == THEIR_KEY
@@ -1,14 +1,28 @@
 """Test utilities."""
 
+import asyncio
+
 import pytest
+from aries_cloudagent.core.event_bus import Event
 from aries_cloudagent.messaging.agent_message import AgentMessage, AgentMessageSchema
 from aries_cloudagent.messaging.models.base import BaseModel, BaseModelSchema
+from aries_cloudagent.protocols.issue_credential.v1_0.models.credential_exchange import (  # noqa: E501
+    V10CredentialExchange,
+)
+from asynctest import mock
 from marshmallow import fields
 
+from acapy_plugin_toolbox import util as test_module
 from acapy_plugin_toolbox.util import (
     PassHandler,
+    as_completed_bounded,
     expand_message_class,
     expand_model_class,
+    gather_bounded,
+    record_event_matches,
+    record_event_pattern,
+    require_role,
+    split_tag_filter,
 )
 
 
@@ -166,3 +180,121 @@ def test_expand_model_class_fields_from():
     test = TestModel("test")
     assert test.one
     assert TestModel.deserialize(test.serialize())
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_limits_concurrency():
+    """Test that no more than limit awaitables run at once."""
+    running = 0
+    peak = 0
+
+    async def _task(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    results = await gather_bounded(*map(_task, range(10)), limit=3)
+    assert results == list(range(10))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_as_completed_bounded_yields_in_completion_order():
+    """Test results are yielded as they complete with limited concurrency."""
+    running = 0
+    peak = 0
+
+    async def _task(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (value % 2))
+        running -= 1
+        return value
+
+    results = [result async for result in as_completed_bounded(map(_task, range(6)), 2)]
+    assert sorted(results) == list(range(6))
+    assert results[0] == 0
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_send_to_admins_isolates_failures(profile, mock_responder):
+    """Test that failing and slow admins do not prevent delivery to others."""
+    admins = [
+        mock.MagicMock(connection_id=conn_id, state="active")
+        for conn_id in ("failing", "slow", "healthy")
+    ]
+    target = mock.MagicMock(recipient_keys=["recipient"], sender_key="sender")
+
+    async def _get_connection_targets(connection):
+        if connection.connection_id == "failing":
+            raise Exception("Dead admin")
+        if connection.connection_id == "slow":
+            await asyncio.sleep(1)
+        return [target]
+
+    connection_mgr = mock.MagicMock()
+    connection_mgr.get_connection_targets = _get_connection_targets
+    message = mock.MagicMock()
+    with mock.patch.object(
+        test_module, "admin_connections", mock.CoroutineMock(return_value=admins)
+    ), mock.patch.object(
+        test_module, "ConnectionManager", mock.MagicMock(return_value=connection_mgr)
+    ):
+        await test_module.send_to_admins(profile, message, mock_responder, timeout=0.05)
+
+    assert len(mock_responder.messages) == 1
+    sent, kwargs = mock_responder.messages[0]
+    assert sent is message
+    assert kwargs["connection_id"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_require_role_caches_group(context, mock_responder):
+    """Test that repeated admin messages reuse the cached connection group."""
+    context.connection_record.connection_id = "admin-conn"
+    handled = mock.CoroutineMock()
+
+    @require_role("admin")
+    async def _handle(context, responder):
+        await handled()
+
+    await _handle(context, mock_responder)
+    await _handle(context, mock_responder)
+
+    assert handled.call_count == 2
+    context.connection_record.metadata_get.assert_called_once()
+    assert not mock_responder.messages
+
+
+def test_split_tag_filter():
+    """Test filters on tagged values are routed to the tag filter."""
+    assert split_tag_filter(
+        V10CredentialExchange,
+        {"thread_id": "thread", "connection_id": "conn", "schema_id": None},
+    ) == ({"thread_id": "thread"}, {"connection_id": "conn"})
+
+
+def test_record_event_pattern_and_matches():
+    """Test record events are selected by state and role."""
+    pattern = record_event_pattern(
+        V10CredentialExchange, [V10CredentialExchange.STATE_ACKED]
+    )
+    assert pattern.match("acapy::record::issue_credential::credential_acked")
+    assert not pattern.match("acapy::record::issue_credential::offer_sent")
+    assert not pattern.match("acapy::record::issue_credential::credential_acked::x")
+
+    event = Event(
+        "acapy::record::issue_credential::credential_acked",
+        {"state": V10CredentialExchange.STATE_ACKED, "role": "issuer"},
+    )
+    assert record_event_matches(event, [V10CredentialExchange.STATE_ACKED])
+    assert record_event_matches(event, [V10CredentialExchange.STATE_ACKED], "issuer")
+    assert not record_event_matches(
+        event, [V10CredentialExchange.STATE_ACKED], "holder"
+    )
+    assert not record_event_matches(event, [V10CredentialExchange.STATE_ISSUED])